@@ -0,0 +1,73 @@
+"""
+Benchmark of the JSON codecs and of to_dict on a large list databases payload.
+
+Every installed codec decodes the payload, the records are loaded into DatabaseRead models and converted back with
+'to_dict' before the result is encoded again. 'asdict' is the deep-copying dataclasses.asdict used before the
+generated per-class dumpers.
+
+Run with: python -m benchmarks.bench_codec
+"""
+
+import argparse
+import time
+from dataclasses import asdict
+from typing import Any, Callable, List
+
+from benchmarks.stub_server import database_record
+from tursopy.codec import CODEC_NAMES, get_codec
+from tursopy.dataclasses import DatabaseRead
+
+
+def best_of(rounds: int, func: Callable[[], Any]) -> float:
+    """
+    Return the fastest of several runs.
+    :param rounds: Number of timed rounds.
+    :param func: Call under test.
+    :return: Seconds
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """
+    Run the benchmark.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = get_codec("json").dumps({"databases": [database_record(i) for i in range(args.records)]})
+    print(f"payload: {args.records:,} databases, {len(payload) / 1024 / 1024:.1f} MiB")
+
+    records = get_codec("json").loads(payload)["databases"]
+    databases: List[DatabaseRead] = [DatabaseRead.load(record) for record in records]
+    load = best_of(args.rounds, lambda: [DatabaseRead.load(record) for record in records])
+    to_dict = best_of(args.rounds, lambda: [database.to_dict() for database in databases])
+    deep_copy = best_of(args.rounds, lambda: [asdict(database) for database in databases])
+    print(f"{'load':<10} {load * 1000:>9.1f} ms")
+    print(f"{'to_dict':<10} {to_dict * 1000:>9.1f} ms")
+    print(f"{'asdict':<10} {deep_copy * 1000:>9.1f} ms")
+
+    print(f"\n{'codec':<10} {'decode':>9} {'encode':>9} {'total':>9}   (decode + load + to_dict + encode)")
+    for name in CODEC_NAMES:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name:<10} not installed")
+            continue
+        decode = best_of(args.rounds, lambda: codec.loads(payload))
+        dicts = [database.to_dict() for database in databases]
+        encode = best_of(args.rounds, lambda: codec.dumps({"databases": dicts}))
+        total = decode + load + to_dict + encode
+        print(f"{name:<10} {decode * 1000:>7.1f}ms {encode * 1000:>7.1f}ms {total * 1000:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Compare the pooled HTTP/1.1 transport with the multiplexed HTTP/2 transport on a 'get_usage' fan-out.
+
+The HTTP/1.1 clients run against benchmarks.stub_server, the HTTP/2 clients against the cleartext HTTP/2 stub of
+benchmarks.h2_stub. Both stubs share routes and latency. 'connections' counts the connections the stub accepted.
+
+Run with: python -m benchmarks.bench_http2
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+import httpx
+
+from benchmarks.h2_stub import start_h2_stub_server
+from benchmarks.stub_server import StubConfig, StubState, start_stub_server
+from tursopy import AsyncTursoClient, TursoClient
+from tursopy.transport import HTTPXAsyncTransport, HTTPXTransport
+
+
+def run_sync(client: TursoClient, names: List[str], concurrency: int) -> int:
+    """
+    Fetch the usage of every database from a thread pool.
+    :param client: Client under test.
+    :param names: Database names.
+    :param concurrency: Number of threads.
+    :return: Number of failed calls.
+    """
+
+    def call(name: str) -> bool:
+        try:
+            client.db.get_usage(org_name="my-org", db_name=name)
+        except Exception:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return sum(not ok for ok in executor.map(call, names))
+
+
+def run_async(client: AsyncTursoClient, names: List[str], concurrency: int) -> int:
+    """
+    Fetch the usage of every database from concurrent tasks.
+    :param client: Client under test.
+    :param names: Database names.
+    :param concurrency: Number of calls in flight.
+    :return: Number of failed calls.
+    """
+
+    async def main() -> int:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(name: str) -> bool:
+            async with semaphore:
+                try:
+                    await client.db.get_usage(org_name="my-org", db_name=name)
+                except Exception:
+                    return False
+                return True
+
+        try:
+            results = await asyncio.gather(*(call(name) for name in names))
+        finally:
+            await client.aclose()
+        return sum(not ok for ok in results)
+
+    return asyncio.run(main())
+
+
+def report(label: str, server: StubState, calls: int, run: Callable[[], int]) -> None:
+    """
+    Time a variant and print its throughput.
+    :param label: Name of the variant.
+    :param server: Stub server the variant talks to.
+    :param calls: Number of calls the variant makes.
+    :param run: Runs the variant and returns the number of failed calls.
+    :return: None
+    """
+    connections = server.connections
+    start = time.perf_counter()
+    errors = run()
+    seconds = time.perf_counter() - start
+    print(
+        f"{label:<14} {calls / seconds:>9,.0f} calls/s   connections={server.connections - connections:<4}"
+        f" errors={errors}"
+    )
+
+
+def main() -> None:
+    """
+    Run the benchmark.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.02, help="Latency of the stub servers in seconds.")
+    parser.add_argument("--pool-size", type=int, default=10, help="Connection pool size of the HTTP/1.1 clients.")
+    args = parser.parse_args()
+
+    names = [f"db-{i}" for i in range(args.calls)]
+    config = StubConfig(latency=args.latency)
+    http1, http1_url = start_stub_server(config=config)
+    http2, http2_url = start_h2_stub_server(config=config)
+    try:
+        sync_http1 = TursoClient(
+            platform_token="bench", token_validation="lazy", base_url=http1_url, pool_size=args.pool_size
+        )
+        report("sync http/1.1", http1, args.calls, lambda: run_sync(sync_http1, names, args.concurrency))
+        sync_http1.close()
+
+        # The stub speaks cleartext HTTP/2, which httpx only uses with prior knowledge.
+        h2c = HTTPXTransport(client=httpx.Client(http1=False, http2=True))
+        sync_http2 = TursoClient(platform_token="bench", token_validation="lazy", base_url=http2_url, transport=h2c)
+        report("sync http/2", http2, args.calls, lambda: run_sync(sync_http2, names, args.concurrency))
+        sync_http2.close()
+
+        async_http1 = AsyncTursoClient(
+            platform_token="bench", token_validation="lazy", base_url=http1_url, pool_size=args.pool_size
+        )
+        report("async http/1.1", http1, args.calls, lambda: run_async(async_http1, names, args.concurrency))
+
+        h2c_async = HTTPXAsyncTransport(client=httpx.AsyncClient(http1=False, http2=True))
+        async_http2 = AsyncTursoClient(
+            platform_token="bench", token_validation="lazy", base_url=http2_url, transport=h2c_async
+        )
+        report("async http/2", http2, args.calls, lambda: run_async(async_http2, names, args.concurrency))
+    finally:
+        http1.shutdown()
+        http1.server_close()
+        http2.shutdown()
+
+
+if __name__ == "__main__":
+    main()
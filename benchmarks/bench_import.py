@@ -0,0 +1,75 @@
+"""
+Import-time benchmark of tursopy.
+
+Every statement runs in a fresh interpreter, which reports the time the statement took and whether heavy modules
+were loaded by it. The fastest of several runs is compared against a budget in milliseconds.
+
+Run with: python -m benchmarks.bench_import
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+HEAVY_MODULES = ("requests", "urllib3", "httpx", "asyncio", "concurrent.futures", "tursopy.db")
+
+#: Statement -> (budget in milliseconds, heavy modules the statement may load).
+IMPORT_BUDGETS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "import tursopy": (25.0, ()),
+    "from tursopy import TursoClient": (100.0, ()),
+    "from tursopy import TursoClient; TursoClient(platform_token='x', token_validation='lazy')": (100.0, ()),
+}
+
+_PROBE = """
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+exec({statement!r})
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": [m for m in {modules!r} if m in sys.modules and m not in before]}}))
+"""
+
+
+def measure(statement: str, runs: int = 3) -> Tuple[float, List[str]]:
+    """
+    Time a statement in fresh interpreters.
+    :param statement: Python statement, e.g. 'import tursopy'.
+    :param runs: Number of interpreters. The fastest run is reported.
+    :return: Milliseconds of the fastest run and the heavy modules the statement loaded.
+    """
+    best = float("inf")
+    modules: List[str] = []
+    for _ in range(runs):
+        probe = _PROBE.format(statement=statement, modules=HEAVY_MODULES)
+        output = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout
+        result = json.loads(output)
+        best = min(best, result["seconds"] * 1000)
+        modules = result["modules"]
+    return best, modules
+
+
+def main() -> None:
+    """
+    Run the benchmark. Exits with 1 if a statement exceeds its budget or loads a heavy module.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    failed = False
+    for statement, (budget, allowed) in IMPORT_BUDGETS.items():
+        milliseconds, modules = measure(statement, args.runs)
+        unexpected = [module for module in modules if module not in allowed]
+        ok = milliseconds <= budget and not unexpected
+        failed |= not ok
+        print(
+            f"{'ok' if ok else 'FAIL':<5} {milliseconds:>7.1f} ms / {budget:>5.0f} ms  {statement}  {unexpected or ''}"
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
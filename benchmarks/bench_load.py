@@ -0,0 +1,73 @@
+"""
+Micro-benchmark of BaseDataClass.load throughput and memory for DatabaseRead records.
+
+The 'before' variant rebuilds the field set on every call and creates regular (non-slotted) instances,
+the 'after' variant uses the precompiled per-class loader of tursopy.
+
+Run with: python -m benchmarks.bench_load
+"""
+
+import argparse
+import time
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from typing import Any, Callable, Dict, List
+
+from benchmarks.stub_server import database_record
+from tursopy.dataclasses import DatabaseRead
+
+LegacyDatabaseRead = make_dataclass("LegacyDatabaseRead", [(f.name, f.type) for f in fields(DatabaseRead)])
+
+
+def legacy_load(data: Dict[str, Any]) -> Any:
+    """
+    Loader as implemented before the precompiled loaders.
+    :param data: Database record.
+    :return: LegacyDatabaseRead instance.
+    """
+    field_names = {f.name for f in fields(LegacyDatabaseRead)}
+    reduced_data = {k: v for k, v in data.items() if k in field_names}
+    return LegacyDatabaseRead(**reduced_data)
+
+
+def measure(label: str, load: Callable[[Dict[str, Any]], Any], records: List[Dict[str, Any]], rounds: int) -> None:
+    """
+    Print throughput and memory of loading all records.
+    :param label: Name of the measured variant.
+    :param load: Loader under test.
+    :param records: Records to load.
+    :param rounds: Number of timed rounds. The best round is reported.
+    :return: None
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        [load(record) for record in records]
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    loaded = [load(record) for record in records]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+
+    print(f"{label:<8} {len(records) / best:>12,.0f} loads/s   {size / 1024:>10,.0f} KiB")
+
+
+def main() -> None:
+    """
+    Run the benchmark.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    records = [database_record(i) for i in range(args.records)]
+    measure("before", legacy_load, records, args.rounds)
+    measure("after", DatabaseRead.load, records, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
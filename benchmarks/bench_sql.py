@@ -0,0 +1,104 @@
+"""
+Benchmarks of the SQL client against the local SQL stub.
+
+Inserts compare one pipeline request per statement with batched pipeline requests. The stub adds a fixed latency
+to every request, so the difference shows the round trips a batch saves. Selects compare a buffered 'execute' with
+the streamed rows and column blocks of 'stream' by time to the first row, total time and peak memory.
+
+Run with: python -m benchmarks.bench_sql
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Iterable
+
+from benchmarks.sql_stub import start_sql_stub_server
+from benchmarks.stub_server import start_stub_server
+from tursopy import TursoClient
+from tursopy.sql import SQLClient
+
+
+def measure_select(label: str, rows: int, query: Callable[[], Iterable[Any]]) -> None:
+    """
+    Consume a query and print its time to the first item, total time and peak memory.
+    :param label: Name of the variant.
+    :param rows: Number of rows of the query.
+    :param query: Returns the rows or blocks of the query.
+    :return: None
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    for _ in query():
+        if first is None:
+            first = time.perf_counter() - start
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<14} {rows / seconds:>9,.0f} rows/s   first={(first or 0) * 1000:>7.1f} ms"
+        f"   total={seconds * 1000:>8.1f} ms   peak={peak / 1024:>9,.0f} KiB"
+    )
+
+
+def bench_select(sql: SQLClient, rows: int) -> None:
+    """
+    Compare buffered and streamed reads of a large result.
+    :param sql: SQL client of the stub.
+    :param rows: Number of rows to select.
+    :return: None
+    """
+    sql.execute("CREATE TABLE s (id INTEGER PRIMARY KEY, name TEXT, score REAL)")
+    sql.execute(
+        "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < ?) "
+        "INSERT INTO s SELECT i, 'name-' || i, i / 3.0 FROM n",
+        [rows],
+    )
+    query = "SELECT id, name, score FROM s"
+    measure_select("execute", rows, lambda: sql.execute(query).rows)
+    measure_select("stream", rows, lambda: sql.stream(query))
+    measure_select("stream blocks", rows, lambda: sql.stream(query).blocks())
+
+
+def main() -> None:
+    """
+    Run the benchmark.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.01, help="Latency of the SQL stub in seconds.")
+    parser.add_argument("--select-rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    platform, platform_url = start_stub_server()
+    server, url = start_sql_stub_server(token="stub.jwt.token", latency=args.latency)
+    try:
+        client = TursoClient(platform_token="bench", base_url=platform_url, token_cache=True)
+        sql = client.db.connect("my-org", "db-0", url=url)
+        sql.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+
+        for label, size in (("per statement", 1), (f"batch of {args.batch_size}", args.batch_size)):
+            requests = server.requests
+            start = time.perf_counter()
+            for offset in range(0, args.rows, size):
+                sql.executemany("INSERT INTO t (name) VALUES (?)", [[f"n{i}"] for i in range(offset, offset + size)])
+            seconds = time.perf_counter() - start
+            print(
+                f"{label:<14} {args.rows / seconds:>9,.0f} rows/s   requests={server.requests - requests}"
+                f"   {seconds * 1000:>8.1f} ms"
+            )
+        print()
+        bench_select(sql, args.select_rows)
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        platform.shutdown()
+        platform.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compare per-call latency of unpooled module-level requests calls with the pooled TursoClient transport.
+
+Run with: python -m benchmarks.bench_transport
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+import requests
+
+from benchmarks.stub_server import start_stub_server
+from tursopy import TursoClient
+
+
+def measure(call: Callable[[], object], iterations: int) -> List[float]:
+    """
+    Measure the latency of repeated calls.
+    :param call: Callable to measure.
+    :param iterations: Number of calls.
+    :return: Latencies in milliseconds.
+    """
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def report(label: str, latencies: List[float]) -> None:
+    """
+    Print a latency summary.
+    :param label: Name of the measured variant.
+    :param latencies: Latencies in milliseconds.
+    :return: None
+    """
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{label:<10} mean={statistics.mean(ordered):.3f}ms p50={statistics.median(ordered):.3f}ms p99={p99:.3f}ms")
+
+
+def main() -> None:
+    """
+    Run the benchmark.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server()
+    try:
+        client = TursoClient(platform_token="bench", base_url=base_url)
+        url = base_url + "/v1/organizations/my-org/databases/db-0"
+
+        def unpooled() -> object:
+            return requests.get(url, headers=client.base_header)
+
+        def pooled() -> object:
+            return client.db.retrieve(org_name="my-org", db_name="db-0")
+
+        report("before", measure(unpooled, args.iterations))
+        report("after", measure(pooled, args.iterations))
+        client.close()
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
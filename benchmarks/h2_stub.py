@@ -0,0 +1,191 @@
+"""
+HTTP/2 variant of the stub server used by the benchmarks.
+
+The server speaks cleartext HTTP/2 with prior knowledge (h2c) and answers every stream concurrently, so many requests
+share a single connection. Routes, payloads, latency and injected errors are the ones of benchmarks.stub_server.
+"""
+
+import asyncio
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.exceptions
+
+from benchmarks.stub_server import StubConfig, StubState
+
+
+class H2StubServer(StubState):
+    """
+    Cleartext HTTP/2 stub server running an asyncio event loop on a background thread.
+    """
+
+    def __init__(self, address: Tuple[str, int], config: StubConfig) -> None:
+        """
+        Initialize the server. The socket is bound by 'start'.
+        :param address: Interface and port to bind.
+        :param config: Stub configuration.
+        """
+        super().__init__(config)
+        self.address = address
+        self.server_address: Tuple[str, int] = address
+        self._loop = asyncio.new_event_loop()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def start(self) -> None:
+        """
+        Bind the socket and serve on the background thread.
+        :return: None
+        """
+        self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self._serve, self.address[0], self.address[1]), self._loop
+        )
+        self._server = future.result()
+        self.server_address = self._server.sockets[0].getsockname()[:2]
+
+    def shutdown(self) -> None:
+        """
+        Stop serving, close all connections and stop the event loop.
+        :return: None
+        """
+        asyncio.run_coroutine_threadsafe(self._close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _close(self) -> None:
+        """
+        Close the listening socket and cancel the tasks of all open connections.
+        :return: None
+        """
+        if self._server is not None:
+            self._server.close()
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Handle a single connection until the client closes it.
+        :param reader: Stream of the connection.
+        :param writer: Stream of the connection.
+        :return: None
+        """
+        self.connected()
+        connection = _H2Connection(self, writer)
+        connection.h2.initiate_connection()
+        writer.write(connection.h2.data_to_send())
+        try:
+            while data := await reader.read(65536):
+                connection.receive(data)
+                writer.write(connection.h2.data_to_send())
+                await writer.drain()
+        except (ConnectionError, h2.exceptions.ProtocolError):
+            pass
+        finally:
+            for task in connection.tasks:
+                task.cancel()
+            writer.close()
+
+
+class _H2Connection:
+    """
+    State of a single HTTP/2 connection: the h2 state machine, pending requests and flow-control waiters.
+    """
+
+    def __init__(self, server: H2StubServer, writer: asyncio.StreamWriter) -> None:
+        """
+        Initialize the connection.
+        :param server: Server owning the connection.
+        :param writer: Stream of the connection.
+        """
+        self.server = server
+        self.writer = writer
+        self.h2 = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        self.requests: Dict[int, Dict[str, str]] = {}
+        self.tasks: List["asyncio.Task[None]"] = []
+        self._window = asyncio.Event()
+
+    def receive(self, data: bytes) -> None:
+        """
+        Feed received bytes to the state machine and start a response for every completed request.
+        :param data: Received bytes.
+        :return: None
+        """
+        for event in self.h2.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                self.requests[event.stream_id] = dict(event.headers)  # type: ignore[arg-type]
+            elif isinstance(event, h2.events.DataReceived):
+                self.h2.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                headers = self.requests.pop(event.stream_id, {})
+                self.tasks.append(asyncio.ensure_future(self._respond(event.stream_id, headers)))
+            elif isinstance(event, h2.events.WindowUpdated):
+                self._window.set()
+            elif isinstance(event, h2.events.StreamReset):
+                self.requests.pop(event.stream_id, None)
+
+    async def _respond(self, stream_id: int, headers: Dict[str, str]) -> None:
+        """
+        Answer a request after the configured latency.
+        :param stream_id: Stream of the request.
+        :param headers: Request headers including the pseudo headers.
+        :return: None
+        """
+        if self.server.config.latency:
+            await asyncio.sleep(self.server.config.latency)
+        status, payload = self.server.answer(headers.get(":method", "GET"), headers.get(":path", "/"))
+        self.h2.send_headers(
+            stream_id,
+            [(":status", str(status)), ("content-type", "application/json"), ("content-length", str(len(payload)))],
+        )
+        await self._send(stream_id, payload)
+
+    async def _send(self, stream_id: int, payload: bytes) -> None:
+        """
+        Send a response body in chunks that fit the flow-control window.
+        :param stream_id: Stream of the response.
+        :param payload: Response body.
+        :return: None
+        """
+        view = memoryview(payload)
+        while True:
+            size = min(len(view), self.h2.local_flow_control_window(stream_id), self.h2.max_outbound_frame_size)
+            if size == 0 and view:
+                self._flush()
+                self._window.clear()
+                await self._window.wait()
+                continue
+            self.h2.send_data(stream_id, bytes(view[:size]), end_stream=size == len(view))
+            self._flush()
+            view = view[size:]
+            if not view:
+                return
+
+    def _flush(self) -> None:
+        """
+        Write the pending frames of the state machine.
+        :return: None
+        """
+        self.writer.write(self.h2.data_to_send())
+
+
+def start_h2_stub_server(
+    host: str = "127.0.0.1", port: int = 0, config: Optional[StubConfig] = None
+) -> Tuple[H2StubServer, str]:
+    """
+    Start the HTTP/2 stub server on a background thread.
+    :param host: Interface to bind.
+    :param port: Port to bind. 0 selects a free port.
+    :param config: Stub configuration. Defaults to a StubConfig without latency and errors.
+    :return: Server instance and its base url.
+    """
+    server = H2StubServer((host, port), config or StubConfig())
+    server.start()
+    return server, f"http://{host}:{server.server_address[1]}"
@@ -0,0 +1,281 @@
+"""
+Local stand-in for the HTTP pipeline and cursor endpoints of a Turso database.
+
+Statements are executed by an in-memory SQLite database and answered in the Hrana over HTTP JSON format, so the
+SQL client can be tested and benchmarked without a real database. Cursor rows are fetched from SQLite in small
+batches and sent as a chunked newline delimited stream. Every request needs the configured bearer token.
+"""
+
+import base64
+import json
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Generator, List, Optional, Tuple
+
+SQLValue = Any
+
+
+def decode_value(value: Dict[str, Any]) -> SQLValue:
+    """
+    Decode a Hrana value.
+    :param value: Hrana value, e.g. {'type': 'integer', 'value': '1'}.
+    :return: Python value
+    """
+    kind = value["type"]
+    if kind == "null":
+        return None
+    if kind == "integer":
+        return int(value["value"])
+    if kind == "blob":
+        return base64.b64decode(value["base64"])
+    return value["value"]
+
+
+def encode_value(value: SQLValue) -> Dict[str, Any]:
+    """
+    Encode a value returned by SQLite as Hrana value.
+    :param value: Python value
+    :return: Hrana value
+    """
+    if value is None:
+        return {"type": "null"}
+    if isinstance(value, int):
+        return {"type": "integer", "value": str(value)}
+    if isinstance(value, float):
+        return {"type": "float", "value": value}
+    if isinstance(value, bytes):
+        return {"type": "blob", "base64": base64.b64encode(value).decode()}
+    return {"type": "text", "value": value}
+
+
+class SQLStubServer(ThreadingHTTPServer):
+    """
+    Threading HTTP server answering Hrana pipeline requests from an in-memory SQLite database.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], token: str, latency: float = 0.0) -> None:
+        """
+        Initialize the server.
+        :param address: Interface and port to bind.
+        :param token: Bearer token every request has to present.
+        :param latency: Seconds added to every request.
+        """
+        super().__init__(address, SQLStubHandler)
+        self.token = token
+        self.latency = latency
+        self.requests = 0
+        self.statements = 0
+        self.closed_batons: List[str] = []
+        self.database = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+
+    def pipeline(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a pipeline request.
+        :param body: Decoded request body.
+        :return: Response body
+        """
+        with self._lock:
+            self.requests += 1
+            if body.get("baton") and any(request["type"] == "close" for request in body["requests"]):
+                self.closed_batons.append(body["baton"])
+            results = [self._request(request) for request in body["requests"]]
+        return {"baton": None, "base_url": None, "results": results}
+
+    def cursor(self, body: Dict[str, Any]) -> Generator[Dict[str, Any], None, None]:
+        """
+        Execute the steps of a cursor request and yield the cursor entries. Rows are fetched lazily.
+        :param body: Decoded request body.
+        :return: Iterator of entries, starting with the header holding the baton of the stream.
+        """
+        with self._lock:
+            self.requests += 1
+            yield {"baton": f"baton-{self.requests}", "base_url": None}
+            for index, step in enumerate(body["batch"]["steps"]):
+                stmt = step["stmt"]
+                self.statements += 1
+                try:
+                    cursor = self.database.execute(stmt["sql"], [decode_value(arg) for arg in stmt.get("args", [])])
+                except sqlite3.Error as e:
+                    yield {"type": "step_error", "step": index, "error": {"message": str(e), "code": "SQLITE_ERROR"}}
+                    return
+                columns = [{"name": column[0], "decltype": None} for column in cursor.description or []]
+                yield {"type": "step_begin", "step": index, "cols": columns}
+                while rows := cursor.fetchmany(256):
+                    for row in rows:
+                        yield {"type": "row", "row": [encode_value(value) for value in row]}
+                yield {"type": "step_end", "affected_row_count": max(cursor.rowcount, 0), "last_insert_rowid": None}
+
+    def _request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a single request of a pipeline.
+        :param request: Hrana stream request.
+        :return: Hrana stream result
+        """
+        kind = request["type"]
+        try:
+            if kind == "execute":
+                response: Dict[str, Any] = {"type": "execute", "result": self._execute(request["stmt"])}
+            elif kind == "batch":
+                response = {"type": "batch", "result": self._batch(request["batch"]["steps"])}
+            elif kind == "close":
+                response = {"type": "close"}
+            else:
+                raise ValueError(f"unsupported request type {kind!r}")
+        except (sqlite3.Error, ValueError) as e:
+            return {"type": "error", "error": {"message": str(e), "code": "SQLITE_ERROR"}}
+        return {"type": "ok", "response": response}
+
+    def _execute(self, stmt: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a statement.
+        :param stmt: Hrana statement.
+        :return: Hrana statement result
+        """
+        self.statements += 1
+        if stmt.get("named_args"):
+            args: Any = {arg["name"].lstrip(":@$"): decode_value(arg["value"]) for arg in stmt["named_args"]}
+        else:
+            args = [decode_value(arg) for arg in stmt.get("args", [])]
+        cursor = self.database.execute(stmt["sql"], args)
+        rows = cursor.fetchall() if stmt.get("want_rows", True) else []
+        columns = [{"name": column[0], "decltype": None} for column in cursor.description or []]
+        return {
+            "cols": columns,
+            "rows": [[encode_value(value) for value in row] for row in rows],
+            "affected_row_count": max(cursor.rowcount, 0),
+            "last_insert_rowid": str(cursor.lastrowid) if cursor.lastrowid else None,
+            "replication_index": None,
+        }
+
+    def _batch(self, steps: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Execute the steps of a batch. Steps whose condition is false are skipped.
+        :param steps: Hrana batch steps.
+        :return: Hrana batch result
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        errors: List[Optional[Dict[str, Any]]] = []
+        for step in steps:
+            if step.get("condition") is not None and not self._condition(step["condition"], results, errors):
+                results.append(None)
+                errors.append(None)
+                continue
+            try:
+                results.append(self._execute(step["stmt"]))
+                errors.append(None)
+            except sqlite3.Error as e:
+                results.append(None)
+                errors.append({"message": str(e), "code": "SQLITE_ERROR"})
+        return {"step_results": results, "step_errors": errors, "replication_index": None}
+
+    def _condition(
+        self, condition: Dict[str, Any], results: List[Optional[Dict[str, Any]]], errors: List[Optional[Dict[str, Any]]]
+    ) -> bool:
+        """
+        Evaluate a batch condition.
+        :param condition: Hrana batch condition.
+        :param results: Results of the executed steps.
+        :param errors: Errors of the executed steps.
+        :return: bool
+        """
+        kind = condition["type"]
+        if kind == "ok":
+            return results[condition["step"]] is not None
+        if kind == "error":
+            return errors[condition["step"]] is not None
+        if kind == "not":
+            return not self._condition(condition["cond"], results, errors)
+        if kind == "and":
+            return all(self._condition(c, results, errors) for c in condition["conds"])
+        if kind == "or":
+            return any(self._condition(c, results, errors) for c in condition["conds"])
+        if kind == "is_autocommit":
+            return not self.database.in_transaction
+        raise ValueError(f"unsupported condition type {kind!r}")
+
+
+class SQLStubHandler(BaseHTTPRequestHandler):
+    """
+    Request handler of the SQL stub server.
+    """
+
+    server: SQLStubServer
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:  # noqa: N802
+        """
+        Handle a pipeline request.
+        :return: None
+        """
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if self.headers.get("Authorization") != f"Bearer {self.server.token}":
+            status, payload = 401, {"error": "Unauthorized"}
+        elif self.path == "/v3/cursor":
+            self._stream(self.server.cursor(json.loads(body)))
+            return
+        elif self.path in ("/v2/pipeline", "/v3/pipeline"):
+            status, payload = 200, self.server.pipeline(json.loads(body))
+        else:
+            status, payload = 404, {"error": f"no route for POST {self.path}"}
+        encoded = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def _stream(self, entries: Generator[Dict[str, Any], None, None]) -> None:
+        """
+        Send cursor entries as chunked newline delimited JSON, one chunk per 64 KiB.
+        :param entries: Cursor entries
+        :return: None
+        """
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        buffer = bytearray()
+        try:
+            for entry in entries:
+                buffer += json.dumps(entry).encode() + b"\n"
+                if len(buffer) >= 64 * 1024:
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(buffer), buffer))
+                    buffer.clear()
+            if buffer:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(buffer), buffer))
+            self.wfile.write(b"0\r\n\r\n")
+        except ConnectionError:
+            self.close_connection = True
+        finally:
+            entries.close()
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """
+        Silence the request log.
+        :return: None
+        """
+
+
+def start_sql_stub_server(
+    host: str = "127.0.0.1", port: int = 0, token: str = "db-token", latency: float = 0.0
+) -> Tuple[SQLStubServer, str]:
+    """
+    Start the SQL stub server on a background thread.
+    :param host: Interface to bind.
+    :param port: Port to bind. 0 selects a free port.
+    :param token: Bearer token every request has to present.
+    :param latency: Seconds added to every request.
+    :return: Server instance and its base url.
+    """
+    server = SQLStubServer((host, port), token, latency)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
@@ -0,0 +1,340 @@
+"""
+Local stand-in for the Turso Platform API used by the benchmarks.
+
+Every route of tursopy.endpoints.API_PATH is served with a payload shaped like the real API. Latency, payload sizes
+and injected errors are configured with a StubConfig.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+from tursopy.endpoints import API_PATH
+
+ROUTE_METHODS = {
+    "validate_platform_token": "GET",
+    "create_platform_token": "POST",
+    "list_platform_tokens": "GET",
+    "revoke_platform_token": "DELETE",
+    "list_databases": "GET",
+    "create_database": "POST",
+    "delete_database": "DELETE",
+    "retrieve_database": "GET",
+    "update_database": "PATCH",
+    "get_usage": "GET",
+    "get_stats": "GET",
+    "list_instances": "GET",
+    "retrieve_instance": "GET",
+    "generate_db_token": "POST",
+    "invalidate_tokens": "POST",
+}
+
+
+def _compile_route(path: str) -> Pattern[str]:
+    """
+    Compile an API_PATH template into a regular expression with a named group per placeholder.
+    :param path: Path template, e.g. '/v1/organizations/{org_name}/databases'.
+    :return: Compiled pattern
+    """
+    return re.compile(re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(path)))
+
+
+ROUTES: List[Tuple[str, Pattern[str], str]] = [
+    (ROUTE_METHODS[key], _compile_route(path), key) for key, path in API_PATH.items()
+]
+
+
+@dataclass(frozen=True)
+class StubConfig:
+    """
+    Behaviour of the stub server.
+    """
+
+    latency: float = 0.0
+    database_count: int = 1
+    instance_count: int = 1
+    stat_count: int = 10
+    error_rate: float = 0.0
+    error_status: int = 500
+    seed: int = 0
+
+
+def database_record(index: int) -> Dict[str, Any]:
+    """
+    Build a database record as returned by the Platform API.
+    :param index: Running number of the database.
+    :return: Database record.
+    """
+    return {
+        "DbId": f"0eb771dd-6906-11ee-8553-{index:012d}",
+        "Hostname": f"db-{index}-my-org.turso.io",
+        "hostname": f"db-{index}-my-org.turso.io",
+        "Name": f"db-{index}",
+        "allow_attach": False,
+        "block_reads": False,
+        "block_writes": False,
+        "group": "default",
+        "is_schema": False,
+        "primaryRegion": "lhr",
+        "regions": ["lhr"],
+        "schema": "",
+        "sleeping": False,
+        "type": "logical",
+        "version": "0.24.1",
+    }
+
+
+def instance_record(index: int) -> Dict[str, Any]:
+    """
+    Build a database instance record as returned by the Platform API.
+    :param index: Running number of the instance.
+    :return: Instance record.
+    """
+    return {
+        "hostname": f"instance-{index}-db-my-org.turso.io",
+        "name": f"instance-{index}",
+        "region": "lhr",
+        "type": "primary" if index == 0 else "replica",
+        "uuid": f"cdfc5ad4-6e34-11ee-8553-{index:012d}",
+    }
+
+
+@lru_cache(maxsize=32)
+def _list_payload(key: str, count: int) -> bytes:
+    """
+    Encode a large list payload once per size, so the server does not dominate the measured time.
+    :param key: Route key of the list.
+    :param count: Number of items.
+    :return: Encoded JSON body.
+    """
+    if key == "list_databases":
+        body: Dict[str, Any] = {"databases": [database_record(i) for i in range(count)]}
+    elif key == "list_instances":
+        body = {"instances": [instance_record(i) for i in range(count)]}
+    else:
+        body = {
+            "top_queries": [
+                {"query": f"SELECT * FROM table_{i} WHERE id = ?", "rows_read": i * 10, "rows_written": i}
+                for i in range(count)
+            ]
+        }
+    return json.dumps(body).encode()
+
+
+USAGE = {"rows_read": 100, "rows_written": 10, "storage_bytes": 4096}
+
+ROUTE_BODIES: Dict[str, Callable[[str, StubConfig], Any]] = {
+    "validate_platform_token": lambda name, config: {"exp": -1},
+    "create_platform_token": lambda name, config: {"id": "token-id", "name": name, "token": "stub-token"},
+    "list_platform_tokens": lambda name, config: {"tokens": [{"id": "token-id", "name": "stub"}]},
+    "revoke_platform_token": lambda name, config: {"token": name},
+    "list_databases": lambda name, config: _list_payload("list_databases", config.database_count),
+    "create_database": lambda name, config: {
+        "database": {
+            "DbId": "0eb771dd-6906-11ee-8553-eaa7715aeaf2",
+            "Hostname": f"{name}-my-org.turso.io",
+            "Name": name,
+            "IssuedCertCount": 0,
+            "IssuedCertLimit": 2,
+        }
+    },
+    "delete_database": lambda name, config: {"database": name},
+    "retrieve_database": lambda name, config: {"database": {**database_record(0), "Name": name}},
+    "update_database": lambda name, config: {"allow_attach": True, "size_limit": "1gb"},
+    "get_usage": lambda name, config: {
+        "database": {"instances": [{"uuid": "instance", "usage": USAGE}], "total": USAGE, "uuid": "db"}
+    },
+    "get_stats": lambda name, config: _list_payload("get_stats", config.stat_count),
+    "list_instances": lambda name, config: _list_payload("list_instances", config.instance_count),
+    "retrieve_instance": lambda name, config: {"instance": instance_record(0)},
+    "generate_db_token": lambda name, config: {"jwt": "stub.jwt.token"},
+    "invalidate_tokens": lambda name, config: {},
+}
+
+
+def route_body(key: str, params: Dict[str, str], config: StubConfig) -> Any:
+    """
+    Build the response body of a route.
+    :param key: API_PATH key of the route.
+    :param params: Values of the path placeholders.
+    :param config: Stub configuration.
+    :return: Body as JSON compatible object or encoded bytes.
+    """
+    return ROUTE_BODIES[key](params.get("name", "db-0"), config)
+
+
+def match_route(method: str, path: str) -> Optional[Tuple[str, Dict[str, str]]]:
+    """
+    Find the route of a request.
+    :param method: HTTP method of the request.
+    :param path: Request path, optionally with a query string.
+    :return: API_PATH key and path placeholder values, or None if no route matches.
+    """
+    path = path.split("?", 1)[0]
+    for route_method, pattern, key in ROUTES:
+        found = pattern.fullmatch(path)
+        if found and route_method == method:
+            return key, found.groupdict()
+    return None
+
+
+class StubState:
+    """
+    Configuration, call counts and routing shared by the HTTP/1.1 and the HTTP/2 stub servers.
+    """
+
+    def __init__(self, config: StubConfig) -> None:
+        """
+        Initialize the state.
+        :param config: Stub configuration.
+        """
+        self.config = config
+        self.calls: Counter[str] = Counter()
+        self.connections = 0
+        self._random = random.Random(config.seed)
+        self._lock = threading.Lock()
+
+    def record(self, key: str) -> bool:
+        """
+        Count a call of a route and decide whether an error is injected.
+        :param key: API_PATH key of the route.
+        :return: True if the call fails with an injected error.
+        """
+        with self._lock:
+            self.calls[key] += 1
+            return self.config.error_rate > 0 and self._random.random() < self.config.error_rate
+
+    def connected(self) -> None:
+        """
+        Count an accepted connection.
+        :return: None
+        """
+        with self._lock:
+            self.connections += 1
+
+    def answer(self, method: str, path: str) -> Tuple[int, bytes]:
+        """
+        Build the response of a request. The configured latency is applied by the server.
+        :param method: HTTP method of the request.
+        :param path: Request path, optionally with a query string.
+        :return: Status code and encoded JSON body.
+        """
+        match = match_route(method, path)
+        if match is None:
+            status, body = 404, {"error": f"no route for {method} {path}"}
+        elif self.record(match[0]):
+            status, body = self.config.error_status, {"error": "injected error"}
+        else:
+            status, body = 200, route_body(match[0], match[1], self.config)
+        return status, body if isinstance(body, bytes) else json.dumps(body).encode()
+
+
+class StubServer(StubState, ThreadingHTTPServer):
+    """
+    Threading HTTP/1.1 server holding the configuration and the per-route call counts of the stub.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: StubConfig) -> None:
+        """
+        Initialize the stub server.
+        :param address: Interface and port to bind.
+        :param config: Stub configuration.
+        """
+        ThreadingHTTPServer.__init__(self, address, StubHandler)
+        StubState.__init__(self, config)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """
+        Count the connection and handle it on a new thread.
+        :return: None
+        """
+        self.connected()
+        super().process_request(request, client_address)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Request handler answering all Platform API routes.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: StubServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        """
+        Answer GET requests.
+        :return: None
+        """
+        self._handle("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        """
+        Answer POST requests.
+        :return: None
+        """
+        self._handle("POST")
+
+    def do_PATCH(self) -> None:  # noqa: N802
+        """
+        Answer PATCH requests.
+        :return: None
+        """
+        self._handle("PATCH")
+
+    def do_DELETE(self) -> None:  # noqa: N802
+        """
+        Answer DELETE requests.
+        :return: None
+        """
+        self._handle("DELETE")
+
+    def _handle(self, method: str) -> None:
+        """
+        Route a request and answer it after the configured latency.
+        :param method: HTTP method of the request.
+        :return: None
+        """
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+
+        if self.server.config.latency:
+            time.sleep(self.server.config.latency)
+        status, payload = self.server.answer(method, self.path)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """
+        Silence request logging.
+        :return: None
+        """
+
+
+def start_stub_server(
+    host: str = "127.0.0.1", port: int = 0, config: Optional[StubConfig] = None
+) -> Tuple[StubServer, str]:
+    """
+    Start the stub server on a background thread.
+    :param host: Interface to bind.
+    :param port: Port to bind. 0 selects a free port.
+    :param config: Stub configuration. Defaults to a StubConfig without latency and errors.
+    :return: Server instance and its base url.
+    """
+    server = StubServer((host, port), config or StubConfig())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
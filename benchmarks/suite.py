@@ -0,0 +1,239 @@
+"""
+Benchmark suite of tursopy against the local Platform API stub server.
+
+Scenarios:
+  single_call   one 'retrieve' call per operation
+  fan_out       'get_usage_many' over many databases per operation
+  list_parsing  'list_databases' of a large organization per operation
+
+Every scenario reports calls/s, p50/p99 latency per operation and the peak memory allocated by one operation.
+Results can be stored as a baseline and compared against it, failing when a metric regressed by more than the
+tolerance.
+
+Run with: python -m benchmarks.suite [--save benchmarks/baseline.json] [--compare benchmarks/baseline.json]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.stub_server import StubConfig, start_stub_server
+from tursopy import TursoClient
+from tursopy.batch import BatchResult
+from tursopy.exceptions import TursoRequestException
+
+HIGHER_IS_BETTER = {"calls_per_second"}
+
+
+@dataclass
+class Scenario:
+    """
+    Benchmarked operation.
+    """
+
+    name: str
+    run: Callable[[TursoClient], object]
+    calls_per_operation: int
+    operations: int
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Measured metrics of a scenario.
+    """
+
+    calls_per_second: float
+    p50_ms: float
+    p99_ms: float
+    peak_memory_kib: float
+    errors: int
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """
+    Return the value at the given quantile of sorted values.
+    :param ordered: Sorted values.
+    :param q: Quantile between 0 and 1.
+    :return: Value
+    """
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def count_failures(value: object) -> int:
+    """
+    Count the failed items of a bulk operation. Bulk operations report failures per item instead of raising.
+    :param value: Return value of a scenario.
+    :return: Number of failed BatchResults, 0 for other values.
+    """
+    if not isinstance(value, list):
+        return 0
+    return sum(1 for item in value if isinstance(item, BatchResult) and not item.ok)
+
+
+def run_scenario(client: TursoClient, scenario: Scenario) -> ScenarioResult:
+    """
+    Measure a scenario.
+    :param client: Client connected to the stub server.
+    :param scenario: Scenario to measure.
+    :return: ScenarioResult
+    """
+    errors = 0
+
+    def operation() -> None:
+        nonlocal errors
+        try:
+            errors += count_failures(scenario.run(client))
+        except TursoRequestException:
+            errors += 1
+
+    operation()
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(scenario.operations):
+        call_start = time.perf_counter()
+        operation()
+        latencies.append((time.perf_counter() - call_start) * 1000)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ordered = sorted(latencies)
+    return ScenarioResult(
+        calls_per_second=scenario.calls_per_operation * scenario.operations / elapsed,
+        p50_ms=percentile(ordered, 0.5),
+        p99_ms=percentile(ordered, 0.99),
+        peak_memory_kib=peak / 1024,
+        errors=errors,
+    )
+
+
+def build_scenarios(args: argparse.Namespace) -> List[Scenario]:
+    """
+    Build the scenarios of the suite.
+    :param args: Parsed command line arguments.
+    :return: Scenarios
+    """
+    names = [f"db-{i}" for i in range(args.fan_out)]
+
+    def fan_out(client: TursoClient) -> object:
+        return list(client.db.get_usage_many("my-org", names))
+
+    return [
+        Scenario(
+            "single_call",
+            lambda client: client.db.retrieve(org_name="my-org", db_name="db-0"),
+            calls_per_operation=1,
+            operations=args.operations,
+        ),
+        Scenario("fan_out", fan_out, calls_per_operation=args.fan_out, operations=max(1, args.operations // 20)),
+        Scenario(
+            "list_parsing",
+            lambda client: client.db.list_databases(org_name="my-org"),
+            calls_per_operation=1,
+            operations=max(1, args.operations // 100),
+        ),
+    ]
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Compare results against a baseline.
+    :param results: Metrics per scenario.
+    :param baseline: Stored baseline document.
+    :param tolerance: Allowed relative change before a metric counts as regressed, e.g. 0.25.
+    :return: Descriptions of all regressions.
+    """
+    regressions = []
+    for scenario, metrics in results.items():
+        for metric, value in metrics.items():
+            expected = baseline["results"].get(scenario, {}).get(metric)
+            if metric == "errors" or not expected:
+                continue
+            change = (value - expected) / expected
+            regressed = change < -tolerance if metric in HIGHER_IS_BETTER else change > tolerance
+            marker = "  REGRESSION" if regressed else ""
+            print(f"  {scenario:<13} {metric:<17} {expected:>12,.2f} -> {value:>12,.2f} ({change:+.1%}){marker}")
+            if regressed:
+                regressions.append(f"{scenario}.{metric} changed by {change:+.1%}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark suite.
+    :param argv: Command line arguments. Defaults to sys.argv.
+    :return: Exit code, 1 if a regression against the baseline was found.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operations", type=int, default=1000, help="Operations of the single_call scenario.")
+    parser.add_argument("--databases", type=int, default=10_000, help="Databases returned by list_databases.")
+    parser.add_argument("--fan-out", type=int, default=100, help="Databases per fan_out operation.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latency of the stub server in seconds.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of calls failing with a 500.")
+    parser.add_argument("--scenario", action="append", help="Only run the given scenario. Can be repeated.")
+    parser.add_argument("--save", help="Store the results as baseline in this file.")
+    parser.add_argument("--compare", help="Compare the results against the baseline in this file.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression.")
+    args = parser.parse_args(argv)
+
+    settings = {
+        "operations": args.operations,
+        "databases": args.databases,
+        "fan_out": args.fan_out,
+        "latency": args.latency,
+        "error_rate": args.error_rate,
+    }
+    config = StubConfig(latency=args.latency, database_count=args.databases, error_rate=args.error_rate)
+    server, base_url = start_stub_server(config=config)
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        with TursoClient(platform_token="bench", base_url=base_url) as client:
+            for scenario in build_scenarios(args):
+                if args.scenario and scenario.name not in args.scenario:
+                    continue
+                result = run_scenario(client, scenario)
+                results[scenario.name] = asdict(result)
+                print(
+                    f"{scenario.name:<13} {result.calls_per_second:>10,.0f} calls/s"
+                    f"   p50={result.p50_ms:.3f}ms p99={result.p99_ms:.3f}ms"
+                    f"   peak={result.peak_memory_kib:,.0f} KiB   errors={result.errors}"
+                )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if args.save:
+        document = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "settings": settings,
+            "results": results,
+        }
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("settings") != settings:
+            print("Warning: the baseline was recorded with different settings.", file=sys.stderr)
+        print(f"Compared to {args.compare}:")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("Regressions: " + ", ".join(regressions), file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
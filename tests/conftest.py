@@ -1,11 +1,72 @@
-from typing import Any, Generator
+import inspect
+import json
+from typing import Any, Awaitable, Callable, Dict, Generator, Tuple, Union
 
+import httpx
 import pytest
+import requests
 import responses
 
 from tursopy import TursoClient
+from tursopy.transport import HTTPXAsyncTransport
 
 TURSO_TOKEN_VALIDATION_URL = "https://api.turso.tech/v1/auth/validate"
+DATABASES_URL = "https://api.turso.tech/v1/organizations/my-org/databases"
+
+Callback = Callable[[requests.PreparedRequest], Tuple[int, Dict[str, str], str]]
+Handler = Callable[[httpx.Request], Union[httpx.Response, Awaitable[httpx.Response]]]
+
+
+def database(
+    name: str = "my-db",
+    group: str = "default",
+    regions: Tuple[str, ...] = ("lhr",),
+    *,
+    db_id: str = "",
+    schema: str = "",
+    sleeping: bool = False,
+) -> Dict[str, Any]:
+    """Database record as returned by the databases endpoints."""
+    return {
+        "DbId": db_id or f"id-{name}",
+        "Hostname": f"{name}-my-org.turso.io",
+        "hostname": f"{name}-my-org.turso.io",
+        "Name": name,
+        "allow_attach": True,
+        "block_reads": False,
+        "block_writes": False,
+        "group": group,
+        "is_schema": False,
+        "primaryRegion": regions[0],
+        "regions": list(regions),
+        "schema": schema,
+        "sleeping": sleeping,
+        "type": "logical",
+        "version": "0.22.22",
+    }
+
+
+def database_callback(answer: Callable[[str], Tuple[int, Any]]) -> Callback:
+    """Responses callback answering with the status and JSON body 'answer' returns for the database in the url."""
+
+    def callback(request: requests.PreparedRequest) -> Tuple[int, Dict[str, str], str]:
+        name = str(request.url).split("/databases/")[1].split("/")[0]
+        status, body = answer(name)
+        return status, {}, json.dumps(body)
+
+    return callback
+
+
+def mock_async_transport(handler: Handler) -> HTTPXAsyncTransport:
+    """Async transport answering the token validation and passing every other request to the handler."""
+
+    async def route(request: httpx.Request) -> httpx.Response:
+        if str(request.url) == TURSO_TOKEN_VALIDATION_URL:
+            return httpx.Response(200, json={})
+        response = handler(request)
+        return await response if inspect.isawaitable(response) else response
+
+    return HTTPXAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(route)))
 
 
 @pytest.fixture(autouse=True)
@@ -0,0 +1,77 @@
+from typing import Dict, List, Tuple
+
+import pytest
+import responses
+
+from tests.conftest import DATABASES_URL, database_callback
+from tursopy import TursoClient
+from tursopy.analysis import QueryAggregator, fingerprint
+from tursopy.dataclasses import StatQuery
+
+TOP_QUERIES: Dict[str, List[Dict[str, object]]] = {
+    "db-1": [
+        {"query": "SELECT * FROM users WHERE id = 1", "rows_read": 100, "rows_written": 0},
+        {"query": "INSERT INTO events (kind) VALUES ('login')", "rows_read": 0, "rows_written": 5},
+    ],
+    "db-2": [
+        {"query": "select *  from users where id = 42;", "rows_read": 50, "rows_written": 0},
+        {"query": "UPDATE users SET seen = 1 WHERE id IN (1, 2, 3)", "rows_read": 3, "rows_written": 30},
+    ],
+}
+
+
+def top_queries(name: str) -> Tuple[int, Dict[str, object]]:
+    if name not in TOP_QUERIES:
+        return 404, {"error": "database not found"}
+    return 200, {"top_queries": TOP_QUERIES[name]}
+
+
+stats_callback = database_callback(top_queries)
+
+
+class TestFingerprint:
+    @pytest.mark.parametrize(
+        ("first", "second"),
+        [
+            ("SELECT * FROM t WHERE a = 1", "select * from t where a=2"),
+            ("SELECT * FROM t WHERE a = 'x' -- comment", "SELECT *\n FROM t WHERE a = 'it''s'"),
+            ("SELECT * FROM t WHERE a IN (1, 2, 3)", "SELECT * FROM t WHERE a IN (4)"),
+            ("INSERT INTO t VALUES (1, 2), (3, 4)", "INSERT INTO t VALUES (?, ?);"),
+            ("SELECT * FROM t WHERE a = ?1", "SELECT * FROM t WHERE a = :value"),
+        ],
+    )
+    def test_queries_differing_in_values_match(self, first: str, second: str) -> None:
+        assert fingerprint(first) == fingerprint(second)
+
+    def test_structure_is_kept(self) -> None:
+        assert fingerprint('SELECT "Id", t.b FROM t LIMIT 10') == 'select "Id", t.b from t limit ?'
+        assert fingerprint("SELECT a FROM t") != fingerprint("SELECT b FROM t")
+
+
+class TestQueryAggregator:
+    def test_top_patterns(self) -> None:
+        aggregator = QueryAggregator()
+        for name, queries in TOP_QUERIES.items():
+            aggregator.add(name, [StatQuery.load(query) for query in queries])
+
+        heaviest = aggregator.top(1)[0]
+        assert heaviest.fingerprint == "select * from users where id = ?"
+        assert heaviest.rows_read == 150
+        assert heaviest.top_databases() == [("db-1", 100), ("db-2", 50)]
+        assert [pattern.rows_written for pattern in aggregator.top(2, by="rows_written")] == [30, 5]
+        with pytest.raises(ValueError, match="Metric"):
+            aggregator.top(by="latency")
+
+
+class TestHotQueries:
+    @responses.activate
+    def test_hot_queries_across_the_org(self, client: TursoClient) -> None:
+        for name in ["db-1", "db-2", "missing"]:
+            responses.add_callback(responses.GET, f"{DATABASES_URL}/{name}/stats", callback=stats_callback)
+
+        report = client.db.hot_queries("my-org", top=2, db_names=["db-1", "db-2", "missing"], max_concurrency=3)
+
+        assert report.databases == 2
+        assert [name for name, _ in report.failures] == ["missing"]
+        assert [pattern.rows for pattern in report.patterns] == [150, 33]
+        assert list(report.patterns[1].databases) == ["db-2"]
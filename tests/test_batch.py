@@ -0,0 +1,117 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+import httpx
+import pytest
+import responses
+
+from tursopy import AsyncTursoClient, TursoClient
+from tursopy.batch import BatchResult, run_batch, run_batch_async
+from tursopy.dataclasses import StatQuery
+from tursopy.exceptions import TursoRequestException
+from tursopy.transport import HTTPXAsyncTransport
+
+USAGE = {"instances": [], "total": {"rows_read": 1, "rows_written": 2, "storage_bytes": 3}, "uuid": "x"}
+
+
+class TestRunBatch:
+    def test_results_keep_input_order(self) -> None:
+        def slow_upper(key: str) -> str:
+            time.sleep(0.01 * (5 - len(key)))
+            return key.upper()
+
+        keys = ["a", "bb", "ccc", "dddd"]
+        results = list(run_batch(slow_upper, keys, max_concurrency=4))
+        assert [r.key for r in results] == keys
+        assert [r.unwrap() for r in results] == ["A", "BB", "CCC", "DDDD"]
+
+    def test_unordered_results_stream_as_completed(self) -> None:
+        def slow(key: str) -> str:
+            time.sleep(0.05 if key == "slow" else 0)
+            return key
+
+        results = list(run_batch(slow, ["slow", "fast"], max_concurrency=2, ordered=False))
+        assert [r.key for r in results] == ["fast", "slow"]
+        assert sorted(r.index for r in results) == [0, 1]
+
+    def test_failures_are_reported_per_item(self) -> None:
+        def fail_on_b(key: str) -> str:
+            if key == "b":
+                raise TursoRequestException("boom")
+            return key
+
+        results = list(run_batch(fail_on_b, ["a", "b", "c"]))
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, TursoRequestException)
+        with pytest.raises(TursoRequestException):
+            results[1].unwrap()
+
+    def test_concurrency_is_bounded(self) -> None:
+        lock = threading.Lock()
+        active: List[int] = [0, 0]
+
+        def track(key: str) -> str:
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return key
+
+        list(run_batch(track, [str(i) for i in range(20)], max_concurrency=3))
+        assert active[1] <= 3
+
+    def test_async_batch(self) -> None:
+        async def upper(key: str) -> str:
+            await asyncio.sleep(0)
+            if key == "b":
+                raise ValueError(key)
+            return key.upper()
+
+        async def main() -> List[BatchResult[str]]:
+            return [r async for r in run_batch_async(upper, ["a", "b", "c"], max_concurrency=2)]
+
+        results = asyncio.run(main())
+        assert [r.value for r in results] == ["A", None, "C"]
+        assert isinstance(results[1].error, ValueError)
+
+
+class TestDatabasesFanOut:
+    @responses.activate
+    def test_get_usage_many(self, client: TursoClient) -> None:
+        for name in ["db-1", "db-2"]:
+            responses.add(
+                responses.GET,
+                f"https://api.turso.tech/v1/organizations/my-org/databases/{name}/usage",
+                json={"database": USAGE},
+                status=200,
+            )
+        responses.add(
+            responses.GET,
+            "https://api.turso.tech/v1/organizations/my-org/databases/missing/usage",
+            json={"error": "not found"},
+            status=404,
+        )
+
+        results = list(client.db.get_usage_many("my-org", ["db-1", "missing", "db-2"], max_concurrency=2))
+        assert [r.key for r in results] == ["db-1", "missing", "db-2"]
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[0].unwrap().uuid == "x"
+
+    def test_async_get_stats_many(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "broken" in request.url.path:
+                return httpx.Response(500, json={"error": "boom"})
+            return httpx.Response(200, json={"top_queries": [{"query": "x", "rows_read": 1, "rows_written": 0}]})
+
+        async def main() -> List[BatchResult[List[StatQuery]]]:
+            transport = HTTPXAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            client = AsyncTursoClient(platform_token="dummy", transport=transport, requests_per_second=1000)
+            return [r async for r in client.db.get_stats_many("my-org", ["a", "broken", "b"])]
+
+        results = asyncio.run(main())
+        assert [r.ok for r in results] == [True, False, True]
+        assert len(results[0].unwrap()) == 1
@@ -0,0 +1,25 @@
+import pytest
+
+from benchmarks.stub_server import ROUTE_BODIES, ROUTE_METHODS, ROUTES
+from benchmarks.suite import count_failures
+from tursopy.batch import BatchResult
+from tursopy.endpoints import API_PATH
+
+
+class TestStubServer:
+    def test_every_api_path_is_routed(self) -> None:
+        assert set(ROUTE_METHODS) == set(API_PATH)
+        assert set(ROUTE_BODIES) == set(API_PATH)
+
+    @pytest.mark.parametrize("key", sorted(API_PATH))
+    def test_routes_match_their_path(self, key: str) -> None:
+        path = API_PATH[key].format(org_name="my-org", name="my-db", instance_name="lhr")
+        matches = [route_key for _, pattern, route_key in ROUTES if pattern.fullmatch(path)]
+        assert key in matches
+
+
+class TestSuite:
+    def test_failed_bulk_items_are_counted(self) -> None:
+        results = [BatchResult(0, "a", value=1), BatchResult(1, "b", error=ValueError("b"))]
+        assert count_failures(results) == 1
+        assert count_failures(object()) == 0
@@ -0,0 +1,119 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Tuple, Union, cast
+
+import httpx
+import pytest
+import requests
+import responses
+
+from tests.conftest import DATABASES_URL, mock_async_transport
+from tursopy import AsyncTursoClient, TursoClient
+from tursopy.dataclasses import DatabaseCreated, DatabaseSpec
+from tursopy.exceptions import BulkOperationException
+
+
+def created(name: str) -> Dict[str, Any]:
+    return {
+        "database": {
+            "DbId": f"id-{name}",
+            "Hostname": f"{name}-my-org.turso.io",
+            "Name": name,
+            "IssuedCertCount": 0,
+            "IssuedCertLimit": 2,
+        }
+    }
+
+
+def create_callback(request: requests.PreparedRequest) -> Tuple[int, Dict[str, str], str]:
+    name = json.loads(cast(bytes, request.body))["name"]
+    if name.startswith("bad"):
+        return 400, {}, json.dumps({"error": f"invalid database {name}"})
+    return 200, {}, json.dumps(created(name))
+
+
+class TestCreateDatabases:
+    @responses.activate
+    def test_specs_are_validated_before_any_request(self, client: TursoClient) -> None:
+        specs = [DatabaseSpec(name="ok"), DatabaseSpec(name="broken", seed_type="dump")]
+        with pytest.raises(ValueError, match="broken"):
+            client.db.create_databases("my-org", specs)
+        with pytest.raises(ValueError, match="more than once"):
+            client.db.create_databases("my-org", ["same", "same"])
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_results_are_reported_per_database(self, client: TursoClient) -> None:
+        responses.add_callback(responses.POST, DATABASES_URL, callback=create_callback)
+
+        specs: List[Union[DatabaseSpec, str]] = ["pr-1", DatabaseSpec(name="pr-2", schema="parent"), "bad-1"]
+        results = client.db.create_databases("my-org", specs, max_concurrency=3)
+
+        assert [result.key for result in results] == ["pr-1", "pr-2", "bad-1"]
+        assert [result.ok for result in results] == [True, True, False]
+        assert isinstance(results[0].value, DatabaseCreated)
+        bodies = [json.loads(cast(bytes, call.request.body)) for call in responses.calls]
+        assert {"name": "pr-2", "group": "default", "schema": "parent"} in bodies
+
+    @responses.activate
+    def test_created_databases_are_rolled_back_on_failure(self, client: TursoClient) -> None:
+        responses.add_callback(responses.POST, DATABASES_URL, callback=create_callback)
+        responses.add(responses.DELETE, f"{DATABASES_URL}/pr-1", json={"database": "pr-1"}, status=200)
+        responses.add(responses.DELETE, f"{DATABASES_URL}/pr-2", json={"error": "busy"}, status=500)
+
+        with pytest.raises(BulkOperationException) as error:
+            client.db.create_databases("my-org", ["pr-1", "bad-1", "pr-2"], rollback=True)
+
+        assert [result.ok for result in error.value.results] == [True, False, True]
+        assert error.value.failed == ["bad-1"]
+        assert error.value.rolled_back == ["pr-1"]
+        assert error.value.rollback_failed == ["pr-2"]
+
+    @responses.activate
+    def test_nothing_is_rolled_back_without_failures(self, client: TursoClient) -> None:
+        responses.add_callback(responses.POST, DATABASES_URL, callback=create_callback)
+
+        results = client.db.create_databases("my-org", ["pr-1", "pr-2"], rollback=True)
+        assert all(result.ok for result in results)
+        assert all(call.request.method == "POST" for call in responses.calls)
+
+
+class TestDeleteDatabases:
+    @responses.activate
+    def test_delete_databases(self, client: TursoClient) -> None:
+        responses.add(responses.DELETE, f"{DATABASES_URL}/pr-1", json={"database": "pr-1"}, status=200)
+        responses.add(responses.DELETE, f"{DATABASES_URL}/pr-2", json={"error": "not found"}, status=404)
+
+        results = client.db.delete_databases("my-org", ["pr-1", "pr-2"])
+        assert results[0].value == "pr-1"
+        assert not results[1].ok
+
+    @responses.activate
+    def test_delete_databases_runs_without_iteration(self, client: TursoClient) -> None:
+        responses.add(responses.DELETE, f"{DATABASES_URL}/pr-1", json={"database": "pr-1"}, status=200)
+        client.db.delete_databases("my-org", ["pr-1"])
+        assert len(responses.calls) == 1
+
+
+class TestAsyncBulk:
+    def test_async_create_databases_rolls_back(self) -> None:
+        deleted: List[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "DELETE":
+                deleted.append(request.url.path.rsplit("/", 1)[1])
+                return httpx.Response(200, json={"database": deleted[-1]})
+            name = json.loads(request.content)["name"]
+            if name.startswith("bad"):
+                return httpx.Response(400, json={"error": "invalid"})
+            return httpx.Response(200, json=created(name))
+
+        async def main() -> List[bool]:
+            transport = mock_async_transport(handler)
+            client = AsyncTursoClient(platform_token="dummy", transport=transport)
+            with pytest.raises(BulkOperationException) as error:
+                await client.db.create_databases("my-org", ["pr-1", "bad-1"], rollback=True)
+            return [result.ok for result in error.value.results]
+
+        assert asyncio.run(main()) == [True, False]
+        assert deleted == ["pr-1"]
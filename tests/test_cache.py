@@ -0,0 +1,159 @@
+import asyncio
+import time
+from typing import Any, List
+
+import httpx
+import pytest
+import requests
+import responses
+
+from tests.conftest import DATABASES_URL, TURSO_TOKEN_VALIDATION_URL, database, mock_async_transport
+from tursopy import AsyncTursoClient, TursoClient
+from tursopy.cache import ResponseCache
+from tursopy.transport import AsyncTransport
+
+
+@pytest.fixture
+@responses.activate
+def cached_client(dummy_settings: dict[str, str]) -> TursoClient:
+    responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+    return TursoClient(cache=True, **dummy_settings)
+
+
+class TestResponseCache:
+    def test_lru_bound_evicts_least_recently_used(self) -> None:
+        cache = ResponseCache(ttl={"list_databases": 60}, max_entries=2)
+        response = requests.Response()
+        response.status_code = 200
+        keys = [cache.key(f"{DATABASES_URL}?{i}") for i in range(3)]
+        cache.set("list_databases", keys[0], response)
+        cache.set("list_databases", keys[1], response)
+        cache.get(keys[0])
+        cache.set("list_databases", keys[2], response)
+
+        assert cache.get(keys[0]) is response
+        assert cache.get(keys[1]) is None
+        assert cache.stats() == {"hits": 2, "misses": 1, "entries": 2}
+
+    def test_invalidation_scope(self) -> None:
+        cache = ResponseCache(ttl={"any": 60})
+        response = requests.Response()
+        response.status_code = 200
+        urls = [
+            DATABASES_URL,
+            DATABASES_URL + "/my-db",
+            DATABASES_URL + "/my-db/instances",
+            DATABASES_URL + "/other-db",
+            "https://api.turso.tech/v1/organizations/other-org/databases",
+        ]
+        for url in urls:
+            cache.set("any", cache.key(url), response)
+
+        assert cache.invalidate(DATABASES_URL + "/my-db/configuration") == 3
+        assert cache.get(cache.key(DATABASES_URL + "/other-db")) is response
+        assert cache.get(cache.key("https://api.turso.tech/v1/organizations/other-org/databases")) is response
+
+
+class TestClientCache:
+    @responses.activate
+    def test_reads_are_served_from_cache(self, cached_client: TursoClient) -> None:
+        responses.add(responses.GET, DATABASES_URL, json={"databases": [database()]}, status=200)
+
+        first = cached_client.db.list_databases(org_name="my-org")
+        second = cached_client.db.list_databases(org_name="my-org")
+
+        assert first == second
+        assert len(responses.calls) == 1
+        assert cached_client.cache is not None
+        assert cached_client.cache.stats()["hits"] == 1
+
+    @responses.activate
+    def test_errors_are_not_cached(self, cached_client: TursoClient) -> None:
+        responses.add(responses.GET, DATABASES_URL, json={"error": "boom"}, status=500)
+        responses.add(responses.GET, DATABASES_URL, json={"databases": []}, status=200)
+
+        with pytest.raises(Exception):
+            cached_client.db.list_databases(org_name="my-org")
+        assert cached_client.db.list_databases(org_name="my-org") == []
+
+    @responses.activate
+    def test_entries_expire(self, dummy_settings: dict[str, str]) -> None:
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        responses.add(responses.GET, DATABASES_URL, json={"databases": []}, status=200)
+        client = TursoClient(cache=ResponseCache(ttl={"list_databases": 0.01}), **dummy_settings)
+
+        client.db.list_databases(org_name="my-org")
+        time.sleep(0.02)
+        client.db.list_databases(org_name="my-org")
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_mutations_invalidate_reads(self, cached_client: TursoClient) -> None:
+        responses.add(responses.GET, DATABASES_URL + "/my-db", json={"database": database()}, status=200)
+        responses.add(responses.DELETE, DATABASES_URL + "/my-db", json={"database": "my-db"}, status=200)
+
+        cached_client.db.retrieve(org_name="my-org", db_name="my-db")
+        cached_client.db.delete_database(org_name="my-org", db_name="my-db")
+        cached_client.db.retrieve(org_name="my-org", db_name="my-db")
+
+        assert [call.request.method for call in responses.calls] == ["GET", "DELETE", "GET"]
+
+    @responses.activate
+    def test_revoke_token_invalidates_token_list(self, cached_client: TursoClient) -> None:
+        tokens_url = "https://api.turso.tech/v1/auth/api-tokens"
+        responses.add(responses.GET, tokens_url, json={"tokens": [{"id": "1", "name": "t"}]}, status=200)
+        responses.add(responses.DELETE, tokens_url + "/t", json={"token": "t"}, status=200)
+
+        cached_client.list_platform_tokens()
+        cached_client.revoke_token(name="t")
+        cached_client.list_platform_tokens()
+
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_token_generation_keeps_reads(self, cached_client: TursoClient) -> None:
+        responses.add(responses.GET, DATABASES_URL + "/my-db", json={"database": database()}, status=200)
+        responses.add(responses.POST, DATABASES_URL + "/my-db/auth/tokens", json={"jwt": "db-token"}, status=200)
+
+        cached_client.db.retrieve(org_name="my-org", db_name="my-db")
+        cached_client.db.generate_token(org_name="my-org", db_name="my-db")
+        cached_client.db.retrieve(org_name="my-org", db_name="my-db")
+
+        assert [call.request.method for call in responses.calls] == ["GET", "POST"]
+
+    @responses.activate
+    def test_streamed_reads_bypass_cache(self, cached_client: TursoClient) -> None:
+        responses.add(responses.GET, DATABASES_URL, json={"databases": []}, status=200)
+
+        cached_client.request("GET", DATABASES_URL, endpoint="list_databases", stream=True).close()
+        cached_client.request("GET", DATABASES_URL, endpoint="list_databases", stream=True).close()
+
+        assert len(responses.calls) == 2
+        assert cached_client.cache is not None
+        assert cached_client.cache.stats()["entries"] == 0
+
+    def test_async_streamed_reads_bypass_cache(self) -> None:
+        streams: List[bool] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"databases": []})
+
+        class StreamingTransport(AsyncTransport):
+            def __init__(self) -> None:
+                """Record whether every request is streamed and answer with an empty listing."""
+                self.inner = mock_async_transport(handler)
+
+            async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+                streams.append(kwargs.pop("stream", False))
+                return await self.inner.request(method, url, **kwargs)
+
+        async def main() -> AsyncTursoClient:
+            client = AsyncTursoClient(platform_token="dummy", transport=StreamingTransport(), cache=True)
+            await client.request("GET", DATABASES_URL, endpoint="list_databases", stream=True)
+            await client.request("GET", DATABASES_URL, endpoint="list_databases", stream=True)
+            return client
+
+        client = asyncio.run(main())
+        assert streams == [False, True, True]  # token validation and two reads
+        assert client.cache is not None
+        assert client.cache.stats()["entries"] == 0
@@ -0,0 +1,78 @@
+import json
+from typing import Any, Dict, cast
+
+import pytest
+import responses
+
+from tests.conftest import DATABASES_URL, TURSO_TOKEN_VALIDATION_URL
+from tursopy import TursoClient
+from tursopy.codec import JSONCodec, StdlibCodec, get_codec
+from tursopy.dataclasses import Usage, UsageRead
+
+
+class TestCodec:
+    def test_stdlib_codec(self) -> None:
+        codec = get_codec("json")
+        assert isinstance(codec, StdlibCodec)
+        assert codec.loads(b'{"a": [1, "\\u00e9"]}') == {"a": [1, "é"]}
+        assert codec.dumps({"a": "é"}) == '{"a":"é"}'.encode()
+
+    def test_default_codec_is_the_fastest_installed(self) -> None:
+        try:
+            import orjson  # noqa: F401, PLC0415
+        except ImportError:
+            return
+        assert get_codec().name == "orjson"
+
+    @pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+    def test_models_are_encoded(self, name: str) -> None:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            pytest.skip(f"{name} is not installed")
+        usage = UsageRead(instances=[], total=Usage(1, 2, 3), uuid="x")
+        expected: Dict[str, Any] = {"instances": [], "total": {"rows_read": 1, "rows_written": 2, "storage_bytes": 3}}
+        assert codec.loads(codec.dumps(usage)) == {**expected, "uuid": "x"}
+        with pytest.raises(TypeError):
+            codec.dumps(object())
+
+    def test_unknown_codec(self) -> None:
+        with pytest.raises(ValueError, match="JSON codec"):
+            get_codec("yaml")
+
+
+class TestClientCodec:
+    @responses.activate
+    def test_custom_codec_is_used_for_bodies_and_responses(self, dummy_settings: Dict[str, str]) -> None:
+        class CountingCodec(StdlibCodec):
+            def __init__(self) -> None:
+                """
+                Stdlib codec counting its calls.
+                """
+                self.calls = 0
+
+            def loads(self, data: Any) -> Any:
+                self.calls += 1
+                return super().loads(data)
+
+            def dumps(self, value: Any) -> bytes:
+                self.calls += 1
+                return super().dumps(value)
+
+        codec = CountingCodec()
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        responses.add(
+            responses.POST,
+            DATABASES_URL,
+            json={
+                "database": {"DbId": "1", "Hostname": "h", "Name": "my-db", "IssuedCertCount": 0, "IssuedCertLimit": 1}
+            },
+            status=200,
+        )
+        client = TursoClient(json_codec=codec, **dummy_settings)
+        assert isinstance(client.codec, JSONCodec)
+
+        client.db.create_database(org_name="my-org", name="my-db")
+        assert json.loads(cast(bytes, responses.calls[1].request.body)) == {"name": "my-db", "group": "default"}
+        assert responses.calls[1].request.headers["Content-Type"] == "application/json"
+        assert codec.calls == 2
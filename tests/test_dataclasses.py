@@ -0,0 +1,72 @@
+import sys
+from dataclasses import asdict
+
+import pytest
+
+from tursopy.dataclasses import ConfigUpdateResponse, DatabaseRead, SingleDBUsage, Usage, UsageRead
+
+
+class TestDataclassLoader:
+    def test_nested_models_are_loaded(self) -> None:
+        data = {
+            "instances": [{"uuid": "a", "usage": {"rows_read": 1, "rows_written": 2, "storage_bytes": 3}}],
+            "total": {"rows_read": 1, "rows_written": 2, "storage_bytes": 3},
+            "uuid": "x",
+        }
+        usage = UsageRead.load(data)
+
+        assert isinstance(usage.total, Usage)
+        assert isinstance(usage.instances[0], SingleDBUsage)
+        assert isinstance(usage.instances[0].usage, Usage)
+        assert usage.to_dict() == data
+
+    def test_unknown_fields_are_ignored_and_defaults_applied(self) -> None:
+        response = ConfigUpdateResponse.load({"size_limit": "1gb", "unknown": True})
+        assert response == ConfigUpdateResponse(allow_attach=None, size_limit="1gb")
+
+    def test_missing_required_field_raises_error(self) -> None:
+        with pytest.raises(TypeError):
+            Usage.load({"rows_read": 1})
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="Slotted dataclasses require Python 3.10")
+    def test_models_are_slotted(self) -> None:
+        usage = Usage.load({"rows_read": 1, "rows_written": 2, "storage_bytes": 3})
+        assert not hasattr(usage, "__dict__")
+        assert "Name" in DatabaseRead.__slots__
+
+
+class TestDataclassDumper:
+    def test_to_dict_matches_asdict(self) -> None:
+        usage = UsageRead.load(
+            {
+                "instances": [{"uuid": "a", "usage": {"rows_read": 1, "rows_written": 2, "storage_bytes": 3}}],
+                "total": {"rows_read": 1, "rows_written": 2, "storage_bytes": 3},
+                "uuid": "x",
+            }
+        )
+        assert usage.to_dict() == asdict(usage)
+        assert ConfigUpdateResponse(allow_attach=None, size_limit="1gb").to_dict() == {
+            "allow_attach": None,
+            "size_limit": "1gb",
+        }
+
+    def test_to_dict_does_not_copy_plain_values(self) -> None:
+        regions = ["lhr", "fra"]
+        database = DatabaseRead(
+            "my-db",
+            "id",
+            "host",
+            False,
+            "",
+            False,
+            False,
+            True,
+            regions,
+            "lhr",
+            "logical",
+            "0.1",
+            "default",
+            False,
+            "h",
+        )
+        assert database.to_dict()["regions"] is regions
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+import responses
+
+from benchmarks.bench_import import IMPORT_BUDGETS, measure
+from tests.conftest import TURSO_TOKEN_VALIDATION_URL
+from tursopy import TursoClient
+from tursopy.transport import RequestsTransport
+
+# Wall-clock budgets depend on the machine, so they are only checked on request. 'python -m benchmarks.bench_import'
+# checks them as well.
+TIMED = os.environ.get("TURSOPY_BENCHMARK_TESTS") == "1"
+
+
+class TestLazyImport:
+    @pytest.mark.parametrize("statement", sorted(IMPORT_BUDGETS))
+    def test_heavy_modules_are_not_imported(self, statement: str) -> None:
+        _, allowed = IMPORT_BUDGETS[statement]
+        _, modules = measure(statement, runs=1)
+        assert [module for module in modules if module not in allowed] == []
+
+    @pytest.mark.skipif(not TIMED, reason="Set TURSOPY_BENCHMARK_TESTS=1 to check the import-time budgets")
+    @pytest.mark.parametrize("statement", sorted(IMPORT_BUDGETS))
+    def test_import_budget(self, statement: str) -> None:
+        budget, _ = IMPORT_BUDGETS[statement]
+        milliseconds, _ = measure(statement)
+        assert milliseconds <= budget
+
+    def test_heavy_modules_are_loaded_on_first_use(self) -> None:
+        _, modules = measure(
+            "from tursopy import TursoClient; TursoClient(platform_token='x', token_validation='lazy').db"
+        )
+        assert modules == ["tursopy.db"]
+
+    @responses.activate
+    def test_session_is_created_with_the_first_call(self, dummy_settings: dict[str, str]) -> None:
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        client = TursoClient(token_validation="lazy", **dummy_settings)
+        assert isinstance(client.transport, RequestsTransport)
+        assert client.transport._session is None
+        assert client.db is client.db
+
+        client._validate_user_token()
+        assert client.transport._session is not None
+        assert client.transport.retryable_errors
@@ -0,0 +1,98 @@
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import responses
+
+from tests.conftest import DATABASES_URL, database, database_callback
+from tursopy import TursoClient
+from tursopy.inventory import InventoryStore
+
+
+def instances(name: str) -> Tuple[int, Dict[str, Any]]:
+    if name == "broken":
+        return 500, {"error": "unavailable"}
+    instance = {"hostname": f"{name}.turso.io", "name": "lhr-1", "region": "lhr", "type": "primary", "uuid": name}
+    return 200, {"instances": [instance]}
+
+
+instances_callback = database_callback(instances)
+
+
+def add_databases(databases: List[Dict[str, Any]]) -> None:
+    responses.add(responses.GET, DATABASES_URL, json={"databases": databases}, status=200)
+
+
+def instance_calls() -> List[str]:
+    return [str(call.request.url).split("/")[-2] for call in responses.calls if "/instances" in str(call.request.url)]
+
+
+class TestInventoryStore:
+    @responses.activate
+    def test_refresh_only_fetches_instances_of_changed_databases(self, client: TursoClient, tmp_path: Path) -> None:
+        responses.add_callback(responses.GET, f"{DATABASES_URL}/a/instances", callback=instances_callback)
+        responses.add_callback(responses.GET, f"{DATABASES_URL}/b/instances", callback=instances_callback)
+        responses.add_callback(responses.GET, f"{DATABASES_URL}/c/instances", callback=instances_callback)
+        add_databases([database("a"), database("b")])
+        add_databases([database("a"), database("b", regions=("lhr", "fra")), database("c")])
+
+        path = tmp_path / "inventory.sqlite"
+        with InventoryStore(path) as store:
+            first = store.refresh(client.db, "my-org")
+            assert first.added == ["a", "b"]
+
+        with InventoryStore(path) as store:
+            second = store.refresh(client.db, "my-org")
+            assert (second.added, second.changed, second.unchanged) == (["c"], ["b"], 1)
+            assert sorted(instance_calls()) == ["a", "b", "b", "c"]
+            assert store.refreshed_at("my-org") is not None
+            assert [instance.uuid for instance in store.instances("my-org", "b")] == ["b"]
+
+    @responses.activate
+    def test_removed_databases_are_dropped(self, client: TursoClient) -> None:
+        responses.add_callback(responses.GET, f"{DATABASES_URL}/a/instances", callback=instances_callback)
+        add_databases([database("a")])
+        add_databases([])
+
+        store = InventoryStore()
+        store.refresh(client.db, "my-org")
+        assert store.refresh(client.db, "my-org").removed == ["a"]
+        assert store.database("my-org", "a") is None
+        assert store.instances("my-org", "a") == []
+
+    @responses.activate
+    def test_failed_instances_are_fetched_again(self, client: TursoClient) -> None:
+        responses.add_callback(responses.GET, f"{DATABASES_URL}/broken/instances", callback=instances_callback)
+        add_databases([database("broken")])
+        add_databases([database("broken")])
+
+        store = InventoryStore()
+        assert [name for name, _ in store.refresh(client.db, "my-org").failures] == ["broken"]
+        store.refresh(client.db, "my-org")
+        assert instance_calls() == ["broken", "broken"]
+
+    @responses.activate
+    def test_local_queries(self, client: TursoClient) -> None:
+        for name in ["a", "b", "c"]:
+            responses.add_callback(responses.GET, f"{DATABASES_URL}/{name}/instances", callback=instances_callback)
+        add_databases(
+            [
+                database("a", group="eu", regions=("lhr", "fra")),
+                database("b", group="eu", regions=("fra",), schema="parent"),
+                database("c", group="us", regions=("iad",), schema="parent"),
+            ]
+        )
+
+        store = InventoryStore()
+        store.refresh(client.db, "my-org")
+
+        def names(**filters: str) -> List[str]:
+            return [db.Name for db in store.databases("my-org", **filters)]
+
+        assert names() == ["a", "b", "c"]
+        assert names(group="eu") == ["a", "b"]
+        assert names(region="fra") == ["a", "b"]
+        assert names(schema="parent", region="fra") == ["b"]
+        assert names(group="us", schema="parent") == ["c"]
+        assert store.databases("other-org") == []
+        db = store.database("my-org", "a")
+        assert db is not None and db.regions == ["lhr", "fra"]
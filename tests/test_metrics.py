@@ -0,0 +1,130 @@
+import asyncio
+from typing import List, Union
+
+import httpx
+import pytest
+import requests
+import responses
+
+from tests.conftest import TURSO_TOKEN_VALIDATION_URL
+from tursopy import AsyncTursoClient, TursoClient
+from tursopy.exceptions import TursoRequestException
+from tursopy.metrics import Histogram, LoadEvent, Metrics, RequestEvent
+from tursopy.transport import HTTPXAsyncTransport
+
+STATS_URL = "https://api.turso.tech/v1/organizations/my-org/databases/my-db/stats"
+STATS = {"top_queries": [{"query": "SELECT 1", "rows_read": 1, "rows_written": 0}]}
+
+
+@pytest.fixture
+@responses.activate
+def metrics_client(dummy_settings: dict[str, str]) -> TursoClient:
+    responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+    return TursoClient(metrics=True, **dummy_settings)
+
+
+class TestHistogram:
+    def test_observations_are_bucketed(self) -> None:
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+        assert histogram.cumulative() == [2, 3, 4]
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(5.65)
+        assert histogram.quantile(0.5) == 0.1
+        assert histogram.quantile(0.99) == float("inf")
+        assert Histogram().quantile(0.5) is None
+
+
+class TestMetrics:
+    def test_snapshot_and_hooks(self) -> None:
+        events: List[Union[RequestEvent, LoadEvent]] = []
+        metrics = Metrics(hooks=[events.append])
+        metrics.observe_request(RequestEvent("get_stats", "GET", 200, 0.02, 100))
+        metrics.observe_request(RequestEvent("get_stats", "GET", None, 0.5, 0, ConnectionError()))
+        with metrics.measure_load("get_stats"):
+            pass
+
+        snapshot = metrics.snapshot()["get_stats"]
+        assert snapshot["calls"] == 2
+        assert snapshot["errors"] == 1
+        assert snapshot["status_codes"] == {200: 1}
+        assert snapshot["response_bytes"] == 100
+        assert snapshot["latency_seconds"]["count"] == 2
+        assert snapshot["loads"] == 1
+        assert [type(event) for event in events] == [RequestEvent, RequestEvent, LoadEvent]
+
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_prometheus_text(self) -> None:
+        metrics = Metrics(buckets=(0.1,))
+        metrics.observe_request(RequestEvent("get_stats", "GET", 200, 0.05, 10))
+        metrics.observe_request(RequestEvent("get_stats", "GET", None, 0.2, 0))
+        text = metrics.to_prometheus()
+
+        assert "# TYPE tursopy_requests_total counter" in text
+        assert 'tursopy_requests_total{endpoint="get_stats",status="200"} 1' in text
+        assert 'tursopy_requests_total{endpoint="get_stats",status="error"} 1' in text
+        assert 'tursopy_request_duration_seconds_bucket{endpoint="get_stats",le="0.1"} 1' in text
+        assert 'tursopy_request_duration_seconds_bucket{endpoint="get_stats",le="+Inf"} 2' in text
+        assert 'tursopy_request_duration_seconds_count{endpoint="get_stats"} 2' in text
+        assert 'tursopy_response_bytes_total{endpoint="get_stats"} 10' in text
+        assert text.endswith("\n")
+
+
+class TestClientMetrics:
+    @responses.activate
+    def test_calls_and_loads_are_recorded_per_endpoint(self, metrics_client: TursoClient) -> None:
+        responses.add(responses.GET, STATS_URL, json=STATS, status=200)
+        responses.add(responses.GET, STATS_URL, json={"error": "boom"}, status=500)
+
+        metrics_client.db.get_stats(org_name="my-org", db_name="my-db")
+        with pytest.raises(TursoRequestException):
+            metrics_client.db.get_stats(org_name="my-org", db_name="my-db")
+
+        assert metrics_client.metrics is not None
+        snapshot = metrics_client.metrics.snapshot()
+        assert set(snapshot) == {"get_stats", "validate_platform_token"}
+        stats = snapshot["get_stats"]
+        assert stats["calls"] == 2
+        assert stats["status_codes"] == {200: 1, 500: 1}
+        assert stats["response_bytes"] > 0
+        assert stats["loads"] == 1
+        assert stats["load_seconds"] > 0
+
+    @responses.activate
+    def test_transport_errors_are_recorded(self, metrics_client: TursoClient) -> None:
+        responses.add(responses.GET, STATS_URL, body=requests.ConnectionError("reset"))
+
+        with pytest.raises(requests.ConnectionError):
+            metrics_client.db.get_stats(org_name="my-org", db_name="my-db")
+        assert metrics_client.metrics is not None
+        assert metrics_client.metrics.snapshot()["get_stats"]["errors"] == 1
+
+    @responses.activate
+    def test_streamed_items_are_loaded_with_metrics(self, metrics_client: TursoClient) -> None:
+        responses.add(responses.GET, STATS_URL, json=STATS, status=200)
+
+        assert len(list(metrics_client.db.iter_stats(org_name="my-org", db_name="my-db"))) == 1
+        assert metrics_client.metrics is not None
+        assert metrics_client.metrics.snapshot()["get_stats"]["loads"] == 1
+
+    def test_metrics_are_disabled_by_default(self) -> None:
+        assert TursoClient(platform_token="dummy", token_validation="lazy").metrics is None
+
+    def test_async_client_records_metrics(self) -> None:
+        metrics = Metrics()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=STATS)
+
+        async def main() -> None:
+            transport = HTTPXAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            client = AsyncTursoClient(platform_token="dummy", transport=transport, metrics=metrics)
+            await client.db.get_stats(org_name="my-org", db_name="my-db")
+
+        asyncio.run(main())
+        snapshot = metrics.snapshot()["get_stats"]
+        assert snapshot["calls"] == 1
+        assert snapshot["loads"] == 1
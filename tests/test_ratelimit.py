@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+import httpx
+import pytest
+import responses
+
+from tests.conftest import TURSO_TOKEN_VALIDATION_URL, mock_async_transport
+from tursopy import AsyncTursoClient, TursoClient
+from tursopy.ratelimit import ClientRateLimiter, RateLimiter
+
+STATS_URL = "https://api.turso.tech/v1/organizations/my-org/databases/my-db/stats"
+
+
+class RecordingRateLimiter(ClientRateLimiter):
+    def __init__(self) -> None:
+        """
+        Rate limiter without limits recording the methods of all acquired calls.
+        """
+        super().__init__()
+        self.methods: List[str] = []
+
+    def _reserve(self, method: str) -> float:
+        self.methods.append(method)
+        return super()._reserve(method)
+
+
+class TestRateLimiter:
+    def test_calls_are_spaced_after_burst(self) -> None:
+        limiter = RateLimiter(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.07
+
+    def test_rate_needs_to_be_positive(self) -> None:
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+
+class TestClientRateLimiter:
+    def test_endpoint_groups(self) -> None:
+        assert ClientRateLimiter.group("GET") == "read"
+        assert ClientRateLimiter.group("head") == "read"
+        assert ClientRateLimiter.group("POST") == "mutation"
+        assert ClientRateLimiter.group("DELETE") == "mutation"
+
+    def test_group_rates_are_independent(self) -> None:
+        limiter = ClientRateLimiter(mutation_rate=1, burst=1)
+        assert limiter._reserve("POST") == 0
+        assert limiter._reserve("POST") > 0.5
+        assert limiter._reserve("GET") == 0
+        assert limiter._reserve("GET") == 0
+
+    def test_global_rate_applies_to_all_groups(self) -> None:
+        limiter = ClientRateLimiter(10, read_rate=1000, burst=1)
+        assert limiter._reserve("GET") == 0
+        assert limiter._reserve("POST") > 0.05
+
+    def test_limiter_is_shared_across_threads(self) -> None:
+        limiter = ClientRateLimiter(100, burst=1)
+
+        def worker() -> None:
+            for _ in range(2):
+                limiter.acquire("GET")
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert time.monotonic() - start >= 0.06
+
+    def test_async_acquire(self) -> None:
+        limiter = ClientRateLimiter(read_rate=50, burst=1)
+
+        async def main() -> None:
+            await asyncio.gather(*(limiter.acquire_async("GET") for _ in range(4)))
+
+        start = time.monotonic()
+        asyncio.run(main())
+        assert time.monotonic() - start >= 0.05
+
+
+class TestClientIntegration:
+    @responses.activate
+    def test_every_call_passes_the_limiter(self, dummy_settings: dict[str, str]) -> None:
+        limiter = RecordingRateLimiter()
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        responses.add(responses.GET, STATS_URL, json={"top_queries": []}, status=200)
+        responses.add(
+            responses.DELETE,
+            "https://api.turso.tech/v1/organizations/my-org/databases/my-db",
+            json={"database": "my-db"},
+            status=200,
+        )
+
+        client = TursoClient(rate_limiter=limiter, **dummy_settings)
+        client.db.get_stats(org_name="my-org", db_name="my-db")
+        client.db.delete_database(org_name="my-org", db_name="my-db")
+        assert limiter.methods == ["GET", "GET", "DELETE"]
+
+    def test_rate_settings_build_a_client_limiter(self) -> None:
+        client = TursoClient(platform_token="dummy", token_validation="lazy", reads_per_second=20)
+        assert isinstance(client.rate_limiter, ClientRateLimiter)
+        assert client.rate_limiter.limiter is None
+        assert set(client.rate_limiter.groups) == {"read"}
+        assert TursoClient(platform_token="dummy", token_validation="lazy").rate_limiter is None
+
+    def test_async_client_calls_pass_the_limiter(self) -> None:
+        limiter = RecordingRateLimiter()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"top_queries": []})
+
+        async def main() -> None:
+            transport = mock_async_transport(handler)
+            client = AsyncTursoClient(platform_token="dummy", transport=transport, rate_limiter=limiter)
+            await client.db.get_stats(org_name="my-org", db_name="my-db")
+
+        asyncio.run(main())
+        assert limiter.methods == ["GET", "GET"]  # token validation and get_stats
@@ -0,0 +1,147 @@
+import asyncio
+from typing import Any, List
+
+import httpx
+import pytest
+import requests
+import responses
+
+from tests.conftest import TURSO_TOKEN_VALIDATION_URL, mock_async_transport
+from tursopy import AsyncTursoClient, TursoClient
+from tursopy.exceptions import TursoRequestException
+from tursopy.retry import RetryBudget, RetryPolicy
+
+STATS_URL = "https://api.turso.tech/v1/organizations/my-org/databases/my-db/stats"
+CREATE_URL = "https://api.turso.tech/v1/organizations/my-org/databases"
+CREATED = {
+    "database": {
+        "DbId": "1",
+        "Hostname": "my-db-my-org.turso.io",
+        "Name": "my-db",
+        "IssuedCertCount": 0,
+        "IssuedCertLimit": 2,
+    }
+}
+
+
+def fast_policy() -> RetryPolicy:
+    return RetryPolicy(backoff_base=0.001)
+
+
+@pytest.fixture
+@responses.activate
+def retry_client(dummy_settings: dict[str, str]) -> TursoClient:
+    responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+    return TursoClient(retry=fast_policy(), **dummy_settings)
+
+
+class TestRetryPolicy:
+    def test_delay_uses_full_jitter_within_bounds(self) -> None:
+        policy = RetryPolicy(max_attempts=10, backoff_base=1.0, backoff_max=4.0)
+        delays = [policy.delay(attempt) for attempt in range(1, 6)]
+        assert all(d is not None and 0 <= d <= 4.0 for d in delays)
+
+    def test_retry_after_is_honored(self) -> None:
+        policy = RetryPolicy(backoff_max=10.0)
+        assert policy.delay(1, "3") == 3.0
+        assert policy.delay(1, "Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert policy.delay(1, "60") is None
+
+    def test_attempts_are_limited(self) -> None:
+        assert RetryPolicy(max_attempts=2).delay(2) is None
+
+    def test_budget_stops_retries(self) -> None:
+        policy = RetryPolicy(max_attempts=10, budget=RetryBudget(ratio=0.5, max_tokens=1))
+        assert policy.delay(1) is not None
+        assert policy.delay(1) is None
+        policy.budget.deposit()
+        policy.budget.deposit()
+        assert policy.delay(1) is not None
+
+    def test_only_idempotent_methods_by_default(self) -> None:
+        policy = RetryPolicy()
+        assert policy.allows_method("GET")
+        assert policy.allows_method("delete")
+        assert not policy.allows_method("POST")
+        assert not policy.allows_method("PATCH")
+        assert policy.allows_method("POST", retry=True)
+        assert not policy.allows_method("GET", retry=False)
+
+
+class TestClientRetries:
+    @responses.activate
+    def test_transient_errors_are_retried(self, retry_client: TursoClient) -> None:
+        responses.add(responses.GET, STATS_URL, json={"error": "busy"}, status=429, headers={"Retry-After": "0"})
+        responses.add(responses.GET, STATS_URL, json={"error": "boom"}, status=503)
+        responses.add(responses.GET, STATS_URL, json={"top_queries": []}, status=200)
+
+        assert retry_client.db.get_stats(org_name="my-org", db_name="my-db") == []
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_error_is_raised_after_last_attempt(self, retry_client: TursoClient) -> None:
+        responses.add(responses.GET, STATS_URL, json={"error": "boom"}, status=500)
+
+        with pytest.raises(TursoRequestException):
+            retry_client.db.get_stats(org_name="my-org", db_name="my-db")
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_connection_errors_are_retried(self, retry_client: TursoClient) -> None:
+        responses.add(responses.GET, STATS_URL, body=requests.ConnectionError("reset"))
+        responses.add(responses.GET, STATS_URL, json={"top_queries": []}, status=200)
+
+        assert retry_client.db.get_stats(org_name="my-org", db_name="my-db") == []
+
+    @responses.activate
+    def test_create_database_is_only_retried_on_opt_in(self, retry_client: TursoClient) -> None:
+        responses.add(responses.POST, CREATE_URL, json={"error": "boom"}, status=503)
+        responses.add(responses.POST, CREATE_URL, json={"error": "boom"}, status=503)
+        responses.add(responses.POST, CREATE_URL, json=CREATED, status=200)
+
+        with pytest.raises(TursoRequestException):
+            retry_client.db.create_database(org_name="my-org", name="my-db")
+        assert len(responses.calls) == 1
+        assert retry_client.db.create_database(org_name="my-org", name="my-db", retry=True).Name == "my-db"
+        assert len(responses.calls) == 3
+
+    def test_async_client_retries(self) -> None:
+        statuses: List[int] = [502, 200]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(statuses.pop(0), json={"top_queries": []})
+
+        async def main() -> None:
+            transport = mock_async_transport(handler)
+            client = AsyncTursoClient(platform_token="dummy", transport=transport, retry=fast_policy())
+            assert await client.db.get_stats(org_name="my-org", db_name="my-db") == []
+
+        asyncio.run(main())
+        assert statuses == []
+
+    def test_async_failed_attempts_are_closed(self) -> None:
+        statuses: List[int] = [502, 200]
+        closed: List[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(statuses.pop(0), json={"top_queries": []})
+
+        async def main() -> None:
+            transport = mock_async_transport(handler)
+            send = transport.request
+
+            async def request(*args: Any, **kwargs: Any) -> httpx.Response:
+                response = await send(*args, **kwargs)
+
+                async def aclose() -> None:
+                    closed.append(response.status_code)
+
+                response.aclose = aclose  # type:ignore [method-assign]
+                return response
+
+            transport.request = request  # type:ignore [method-assign]
+            client = AsyncTursoClient(platform_token="dummy", transport=transport, retry=fast_policy())
+            assert await client.db.get_stats(org_name="my-org", db_name="my-db") == []
+
+        asyncio.run(main())
+        assert closed == [502]
@@ -0,0 +1,194 @@
+import threading
+import time
+from typing import Any, Dict, Generator, List, Tuple
+
+import pytest
+import responses
+
+from benchmarks.sql_stub import SQLStubServer, start_sql_stub_server
+from tests.conftest import TURSO_TOKEN_VALIDATION_URL
+from tursopy import TursoClient
+from tursopy.dataclasses import DbInstance
+from tursopy.exceptions import TursoRequestException
+from tursopy.routing import InstanceRouter, LatencyTable
+
+INSTANCES_URL = "https://api.turso.tech/v1/organizations/my-org/databases/my-db/instances"
+TOKEN_URL = "https://api.turso.tech/v1/organizations/my-org/databases/my-db/auth/tokens"
+
+
+def instance(region: str, kind: str = "replica", hostname: str = "") -> Dict[str, Any]:
+    return {
+        "hostname": hostname or f"{region}.my-db-my-org.turso.io",
+        "name": region,
+        "region": region,
+        "type": kind,
+        "uuid": f"uuid-{region}",
+    }
+
+
+INSTANCES = [instance("lhr", "primary"), instance("fra"), instance("iad")]
+
+
+class FakeProbe:
+    def __init__(self, latencies: Dict[str, float]) -> None:
+        """Probe answering with fixed latencies, negative latencies raise."""
+        self.latencies = latencies
+        self.calls: List[str] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, db_instance: DbInstance) -> float:
+        self.calls.append(db_instance.name)
+        self.release.wait(5)
+        latency = self.latencies[db_instance.name]
+        if latency < 0:
+            raise ConnectionError(db_instance.name)
+        return latency
+
+
+class TestLatencyTable:
+    def test_moving_average(self) -> None:
+        table = LatencyTable(alpha=0.5)
+        assert table.observe("a", 0.1) == 0.1
+        assert table.observe("a", 0.3) == pytest.approx(0.2)
+        table.observe("b", 0.15)
+        assert table.best(["a", "b", "c"]) == "b"
+        table.discard("b")
+        assert table.best(["b", "c"]) is None
+
+    def test_expiry(self) -> None:
+        table = LatencyTable(ttl=0)
+        table.observe("a", 0.1)
+        assert table.get("a") is None
+        assert table.observe("a", 0.5) == 0.5
+
+    def test_invalid_alpha(self) -> None:
+        with pytest.raises(ValueError):
+            LatencyTable(alpha=0)
+
+
+class TestInstanceRouter:
+    @responses.activate
+    def test_reads_go_to_the_nearest_instance(self, client: TursoClient) -> None:
+        responses.add(responses.GET, INSTANCES_URL, json={"instances": INSTANCES}, status=200)
+        probe = FakeProbe({"lhr": 0.08, "fra": 0.01, "iad": 0.09})
+        router = client.db.route("my-org", "my-db", probe=probe)
+
+        assert router.instance().name == "fra"
+        assert router.instance(write=True).name == "lhr"
+        assert router.url() == "https://fra.my-db-my-org.turso.io"
+        assert sorted(probe.calls) == ["fra", "iad", "lhr"]
+        assert client.db.route("my-org", "my-db") is router
+
+    @responses.activate
+    def test_unreachable_instances_are_skipped(self, client: TursoClient) -> None:
+        responses.add(responses.GET, INSTANCES_URL, json={"instances": INSTANCES}, status=200)
+        router = client.db.route("my-org", "my-db", probe=FakeProbe({"lhr": 0.08, "fra": -1, "iad": 0.05}))
+        assert router.probe() == {
+            "lhr.my-db-my-org.turso.io": 0.08,
+            "fra.my-db-my-org.turso.io": None,
+            "iad.my-db-my-org.turso.io": 0.05,
+        }
+        assert router.nearest().name == "iad"
+
+        unreachable = InstanceRouter(client.db, "my-org", "my-db", probe=FakeProbe({"lhr": -1, "fra": -1, "iad": -1}))
+        assert unreachable.nearest().name == "lhr"
+
+    @responses.activate
+    def test_background_probe(self, client: TursoClient) -> None:
+        responses.add(responses.GET, INSTANCES_URL, json={"instances": INSTANCES}, status=200)
+        probe = FakeProbe({"lhr": 0.08, "fra": 0.01, "iad": 0.09})
+        router = InstanceRouter(client.db, "my-org", "my-db", probe=probe, probe_interval=0, alpha=1)
+        assert router.nearest().name == "fra"
+
+        probe.latencies["iad"] = 0.001
+        probe.release.clear()
+        assert router.nearest().name == "fra"
+        probe.release.set()
+        deadline = time.monotonic() + 5
+        while router._probing and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert router.latencies.best([x["hostname"] for x in INSTANCES]) == "iad.my-db-my-org.turso.io"
+
+    @responses.activate
+    def test_concurrent_first_lookups_probe_once(self, client: TursoClient) -> None:
+        responses.add(responses.GET, INSTANCES_URL, json={"instances": INSTANCES}, status=200)
+        probe = FakeProbe({"lhr": 0.08, "fra": 0.01, "iad": 0.09})
+        probe.release.clear()
+        router = InstanceRouter(client.db, "my-org", "my-db", probe=probe)
+        router.instances()
+
+        names: List[str] = []
+        threads = [threading.Thread(target=lambda: names.append(router.nearest().name)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        probe.release.set()
+        for thread in threads:
+            thread.join(5)
+        assert names == ["fra"] * 4
+        assert len(probe.calls) == 3
+
+    @responses.activate
+    def test_health_probe(self, client: TursoClient) -> None:
+        responses.add(responses.GET, INSTANCES_URL, json={"instances": INSTANCES}, status=200)
+        responses.add(responses.GET, "https://lhr.my-db-my-org.turso.io/health", status=200)
+        responses.add(responses.GET, "https://fra.my-db-my-org.turso.io/health", status=503)
+        responses.add(responses.GET, "https://iad.my-db-my-org.turso.io/health", status=503)
+        latencies = client.db.route("my-org", "my-db").probe()
+        assert latencies["lhr.my-db-my-org.turso.io"] is not None
+        assert latencies["fra.my-db-my-org.turso.io"] is None
+
+    @responses.activate
+    def test_missing_primary(self, client: TursoClient) -> None:
+        responses.add(responses.GET, INSTANCES_URL, json={"instances": [instance("fra")]}, status=200)
+        with pytest.raises(TursoRequestException, match="no primary"):
+            client.db.route("my-org", "my-db").instance(write=True)
+
+
+class TestRoutedSQLClient:
+    @pytest.fixture
+    def servers(self) -> Generator[List[Tuple[SQLStubServer, str]], Any, Any]:
+        servers = [start_sql_stub_server(token="db-token") for _ in range(2)]
+        yield servers
+        for server, _ in servers:
+            server.shutdown()
+            server.server_close()
+
+    @responses.activate
+    def test_connect(self, servers: List[Tuple[SQLStubServer, str]]) -> None:
+        for _, url in servers:
+            responses.add_passthru(url)
+        primary, replica = (url.removeprefix("http://") for _, url in servers)
+        instances = [instance("lhr", "primary", primary), instance("fra", hostname=replica)]
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        responses.add(responses.GET, INSTANCES_URL, json={"instances": instances}, status=200)
+        responses.add(responses.POST, TOKEN_URL, json={"jwt": "db-token"}, status=200)
+
+        client = TursoClient(platform_token="dummy", token_cache=True)
+        router = client.db.route("my-org", "my-db", probe=FakeProbe({"lhr": 0.1, "fra": 0.01}), scheme="http")
+        assert router.connect().execute("SELECT 1").rows == [(1,)]
+        assert router.connect(write=True).execute("SELECT 2").rows == [(2,)]
+        assert [server.requests for server, _ in servers] == [1, 1]
+
+    @responses.activate
+    def test_stream_is_closed_on_the_instance_that_opened_it(self, servers: List[Tuple[SQLStubServer, str]]) -> None:
+        for _, url in servers:
+            responses.add_passthru(url)
+        primary, replica = (url.removeprefix("http://") for _, url in servers)
+        instances = [instance("lhr", "primary", primary), instance("fra", hostname=replica)]
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        responses.add(responses.GET, INSTANCES_URL, json={"instances": instances}, status=200)
+        responses.add(responses.POST, TOKEN_URL, json={"jwt": "db-token"}, status=200)
+
+        client = TursoClient(platform_token="dummy", token_cache=True)
+        probe = FakeProbe({"lhr": 0.1, "fra": 0.01})
+        router = client.db.route("my-org", "my-db", probe=probe, scheme="http", alpha=1)
+        stream = router.connect().stream(
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT i FROM n"
+        )
+        assert next(iter(stream)) == (1,)
+        probe.latencies["lhr"] = 0.001
+        router.probe()
+        stream.close()
+        assert [server.closed_batons for server, _ in servers] == [[], ["baton-1"]]
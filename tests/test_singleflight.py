@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import time
+from typing import Any, List, Tuple
+
+import httpx
+import pytest
+import requests
+import responses
+
+from tests.conftest import TURSO_TOKEN_VALIDATION_URL, mock_async_transport
+from tursopy import AsyncTursoClient, TursoClient
+from tursopy.singleflight import AsyncSingleFlight, SingleFlight
+
+STATS_URL = "https://api.turso.tech/v1/organizations/my-org/databases/my-db/stats"
+
+
+def wait_for(condition: Any, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Condition not reached in time."
+        time.sleep(0.001)
+
+
+def run_in_threads(func: Any, count: int) -> Tuple[List[threading.Thread], List[Any]]:
+    results: List[Any] = []
+
+    def target() -> None:
+        try:
+            results.append(func())
+        except Exception as exc:
+            results.append(exc)
+
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self) -> None:
+        group = SingleFlight()
+        release = threading.Event()
+        calls: List[int] = []
+
+        def func() -> object:
+            calls.append(1)
+            release.wait()
+            return object()
+
+        threads, results = run_in_threads(lambda: group.do("key", func), 5)
+        wait_for(lambda: group.shared == 4)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len(results) == 5
+        assert all(result is results[0] for result in results)
+
+    def test_errors_are_shared(self) -> None:
+        group = SingleFlight()
+        release = threading.Event()
+
+        def func() -> None:
+            release.wait()
+            raise ValueError("boom")
+
+        threads, results = run_in_threads(lambda: group.do("key", func), 3)
+        wait_for(lambda: group.shared == 2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 3
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_completed_calls_are_not_reused(self) -> None:
+        group = SingleFlight()
+        assert group.do("key", lambda: 1) == 1
+        assert group.do("key", lambda: 2) == 2
+        assert group.shared == 0
+
+    def test_async_callers_share_one_call(self) -> None:
+        group = AsyncSingleFlight()
+        calls: List[int] = []
+
+        async def func() -> int:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 42
+
+        async def main() -> List[int]:
+            return await asyncio.gather(*(group.do("key", func) for _ in range(5)))
+
+        assert asyncio.run(main()) == [42] * 5
+        assert len(calls) == 1
+        assert group.shared == 4
+
+    def test_cancelled_async_caller_does_not_cancel_the_call(self) -> None:
+        group = AsyncSingleFlight()
+
+        async def func() -> int:
+            await asyncio.sleep(0.01)
+            return 42
+
+        async def main() -> int:
+            first = asyncio.ensure_future(group.do("key", func))
+            second = asyncio.ensure_future(group.do("key", func))
+            await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+        assert asyncio.run(main()) == 42
+
+
+class TestClientSingleFlight:
+    @responses.activate
+    def test_identical_reads_are_sent_once(self, dummy_settings: dict[str, str]) -> None:
+        release = threading.Event()
+
+        def callback(request: requests.PreparedRequest) -> Tuple[int, dict[str, str], str]:
+            release.wait()
+            return 200, {}, '{"top_queries": [{"query": "SELECT 1", "rows_read": 1, "rows_written": 0}]}'
+
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        responses.add_callback(responses.GET, STATS_URL, callback=callback)
+        client = TursoClient(single_flight=True, **dummy_settings)
+        assert client.single_flight is not None
+        single_flight = client.single_flight
+
+        threads, results = run_in_threads(lambda: client.db.get_stats(org_name="my-org", db_name="my-db"), 4)
+        wait_for(lambda: single_flight.shared == 3)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert [len(result) for result in results] == [1, 1, 1, 1]
+        assert len(responses.calls) == 2
+
+    def test_single_flight_is_disabled_by_default(self) -> None:
+        assert TursoClient(platform_token="dummy", token_validation="lazy").single_flight is None
+
+    def test_async_identical_reads_are_sent_once(self) -> None:
+        calls: List[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"top_queries": []})
+
+        async def main() -> None:
+            transport = mock_async_transport(handler)
+            client = AsyncTursoClient(platform_token="dummy", transport=transport, single_flight=True)
+            stats = [client.db.get_stats(org_name="my-org", db_name="my-db") for _ in range(3)]
+            assert await asyncio.gather(*stats) == [[], [], []]
+
+        asyncio.run(main())
+        assert len(calls) == 1
@@ -0,0 +1,198 @@
+from array import array
+from typing import Any, Generator, List, Tuple
+
+import pytest
+import requests
+import responses
+
+from benchmarks.sql_stub import SQLStubServer, start_sql_stub_server
+from tests.conftest import TURSO_TOKEN_VALIDATION_URL, database
+from tursopy import TursoClient
+from tursopy.exceptions import SQLException, TursoRequestException
+from tursopy.sql import RowBlock, SQLClient, decode_value, encode_value
+
+TOKEN_URL = "https://api.turso.tech/v1/organizations/my-org/databases/my-db/auth/tokens"
+DATABASE_URL = "https://api.turso.tech/v1/organizations/my-org/databases/my-db"
+
+
+@pytest.fixture
+def server() -> Generator[Tuple[SQLStubServer, str], Any, Any]:
+    server, url = start_sql_stub_server(token="db-token")
+    yield server, url
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def sql(server: Tuple[SQLStubServer, str]) -> Generator[SQLClient, Any, Any]:
+    with responses.RequestsMock() as mock:
+        mock.add_passthru(server[1])
+        mock.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        mock.add(responses.POST, TOKEN_URL, json={"jwt": "db-token"}, status=200)
+        client = TursoClient(platform_token="dummy", token_cache=True)
+        yield client.db.connect("my-org", "my-db", url=server[1])
+
+
+class TestValues:
+    @pytest.mark.parametrize("value", [None, 0, -(2**63), 2**63 - 1, 1.5, "text", b"\x00\xff"])
+    def test_round_trip(self, value: Any) -> None:
+        assert decode_value(encode_value(value)) == value
+
+    def test_encoding(self) -> None:
+        assert encode_value(True) == {"type": "integer", "value": "1"}
+        assert encode_value(b"ab") == {"type": "blob", "base64": "YWI="}
+        with pytest.raises(TypeError):
+            encode_value(object())  # type:ignore [arg-type]
+
+
+class TestSQLClient:
+    def test_execute(self, sql: SQLClient, server: Tuple[SQLStubServer, str]) -> None:
+        sql.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT, score REAL, data BLOB)")
+        inserted = sql.execute("INSERT INTO t (name, score, data) VALUES (?, ?, ?)", ["a", 1.5, b"\x01"])
+        assert inserted.affected_row_count == 1 and inserted.last_insert_rowid == 1
+        sql.execute("INSERT INTO t (name, score, data) VALUES (:name, :score, NULL)", {":name": "b", ":score": 2})
+
+        result = sql.execute("SELECT id, name, score, data FROM t ORDER BY id")
+        assert result.columns == ["id", "name", "score", "data"]
+        assert result.rows == [(1, "a", 1.5, b"\x01"), (2, "b", 2, None)]
+        assert result.to_dicts()[1] == {"id": 2, "name": "b", "score": 2, "data": None}
+        assert server[0].requests == 4
+
+    def test_batch_is_one_request(self, sql: SQLClient, server: Tuple[SQLStubServer, str]) -> None:
+        sql.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+        results = sql.executemany("INSERT INTO t (name) VALUES (?)", [[f"n{i}"] for i in range(50)])
+        assert len(results) == 50 and results[-1].last_insert_rowid == 50
+
+        lookups = sql.batch([("SELECT name FROM t WHERE id = ?", [i]) for i in (1, 25, 50)])
+        assert [result.rows for result in lookups] == [[("n0",)], [("n24",)], [("n49",)]]
+        assert server[0].requests == 3
+        assert server[0].statements == 1 + 52 + 3
+
+    def test_transaction_rollback(self, sql: SQLClient) -> None:
+        sql.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+        with pytest.raises(SQLException, match="UNIQUE") as info:
+            sql.batch(
+                ["INSERT INTO t VALUES (1)", "INSERT INTO t VALUES (1)", "INSERT INTO t VALUES (2)"], transaction=True
+            )
+        assert info.value.statement == 1
+        assert sql.execute("SELECT count(*) FROM t").rows == [(0,)]
+
+    def test_batch_stops_at_first_error(self, sql: SQLClient) -> None:
+        sql.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+        with pytest.raises(SQLException) as info:
+            sql.batch(["INSERT INTO t VALUES (1)", "SELECT * FROM missing", "INSERT INTO t VALUES (2)"])
+        assert info.value.statement == 1
+        assert sql.execute("SELECT id FROM t").rows == [(1,)]
+
+    def test_execute_error(self, sql: SQLClient) -> None:
+        with pytest.raises(SQLException, match="no such table") as info:
+            sql.execute("SELECT * FROM missing")
+        assert info.value.statement == 0 and info.value.code == "SQLITE_ERROR"
+
+
+class TestRowStream:
+    def test_rows_match_execute(self, sql: SQLClient, server: Tuple[SQLStubServer, str]) -> None:
+        sql.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT, score REAL)")
+        sql.execute(
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 5000) "
+            "INSERT INTO t SELECT i, 'n' || i, i / 2.0 FROM n"
+        )
+        expected = sql.execute("SELECT * FROM t WHERE id > ?", [10]).rows
+
+        with sql.stream("SELECT * FROM t WHERE id > ?", [10]) as stream:
+            assert stream.columns == ["id", "name", "score"]
+            assert list(stream) == expected
+        assert server[0].closed_batons == ["baton-4"]
+
+    def test_blocks(self, sql: SQLClient) -> None:
+        sql.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, score REAL, name TEXT, mixed)")
+        sql.executemany(
+            "INSERT INTO t VALUES (?, ?, ?, ?)", [[i, i * 1.5, f"n{i}", i if i % 2 else "x"] for i in range(5)]
+        )
+
+        blocks = list(sql.stream("SELECT * FROM t ORDER BY id").blocks(size=3))
+        assert [len(block) for block in blocks] == [3, 2]
+        first = blocks[0]
+        assert first.column("id") == array("q", [0, 1, 2])
+        assert first.column("score") == array("d", [0.0, 1.5, 3.0])
+        assert first.column("name") == ["n0", "n1", "n2"]
+        assert first.column("mixed") == ["x", 1, "x"]
+        assert list(blocks[1].rows()) == [(3, 4.5, "n3", 3), (4, 6.0, "n4", "x")]
+        assert len(RowBlock.load([], [])) == 0
+
+    def test_early_close(self, sql: SQLClient, server: Tuple[SQLStubServer, str]) -> None:
+        stream = sql.stream("WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT i FROM n")
+        assert next(iter(stream)) == (1,)
+        stream.close()
+        assert server[0].closed_batons == ["baton-1"]
+        assert sql.execute("SELECT 1").rows == [(1,)]
+
+    def test_error(self, sql: SQLClient, server: Tuple[SQLStubServer, str]) -> None:
+        with pytest.raises(SQLException, match="no such table"):
+            sql.stream("SELECT * FROM missing")
+        assert server[0].closed_batons == ["baton-1"]
+
+
+class TestConnect:
+    @responses.activate
+    def test_rejected_token_is_replaced(self, server: Tuple[SQLStubServer, str]) -> None:
+        responses.add_passthru(server[1])
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        responses.add(responses.POST, TOKEN_URL, json={"jwt": "rotated"}, status=200)
+        responses.add(responses.POST, TOKEN_URL, json={"jwt": "db-token"}, status=200)
+        client = TursoClient(platform_token="dummy", token_cache=True)
+        assert client.db.connect("my-org", "my-db", url=server[1]).execute("SELECT 1").rows == [(1,)]
+
+    @responses.activate
+    def test_rejected_token_without_cache(self, server: Tuple[SQLStubServer, str]) -> None:
+        responses.add_passthru(server[1])
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        responses.add(responses.POST, TOKEN_URL, json={"jwt": "rotated"}, status=200)
+        responses.add(responses.POST, TOKEN_URL, json={"jwt": "db-token"}, status=200)
+        client = TursoClient(platform_token="dummy")
+        assert client.db.connect("my-org", "my-db", url=server[1]).execute("SELECT 1").rows == [(1,)]
+
+    @responses.activate
+    def test_token_is_kept_without_cache(self, server: Tuple[SQLStubServer, str]) -> None:
+        responses.add_passthru(server[1])
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        token = responses.add(responses.POST, TOKEN_URL, json={"jwt": "db-token"}, status=200)
+        sql = TursoClient(platform_token="dummy").db.connect("my-org", "my-db", url=server[1])
+        for i in range(5):
+            assert sql.execute("SELECT ?", [i]).rows == [(i,)]
+        list(sql.stream("SELECT 1"))
+        assert token.call_count == 1
+
+    @responses.activate
+    def test_rejected_token_fails_after_one_retry(self, server: Tuple[SQLStubServer, str]) -> None:
+        responses.add_passthru(server[1])
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        responses.add(responses.POST, TOKEN_URL, json={"jwt": "rotated"}, status=200)
+        client = TursoClient(platform_token="dummy")
+        with pytest.raises(TursoRequestException, match="Unauthorized"):
+            client.db.connect("my-org", "my-db", url=server[1]).execute("SELECT 1")
+
+    @responses.activate
+    def test_failed_stream_is_closed(self, server: Tuple[SQLStubServer, str]) -> None:
+        responses.add_passthru(server[1])
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        responses.add(responses.POST, TOKEN_URL, json={"jwt": "rotated"}, status=200)
+        client = TursoClient(platform_token="dummy")
+        closed: List[int] = []
+        send = client.transport.request
+
+        def request(*args: Any, **kwargs: Any) -> requests.Response:
+            response = send(*args, **kwargs)
+            if response.status_code == 401:
+                response.close = lambda: closed.append(response.status_code)  # type:ignore [method-assign]
+            return response
+
+        client.transport.request = request  # type:ignore [method-assign]
+        with pytest.raises(TursoRequestException, match="Unauthorized"):
+            client.db.connect("my-org", "my-db", url=server[1]).stream("SELECT 1")
+        assert closed == [401, 401]
+
+    @responses.activate
+    def test_url_from_hostname(self, client: TursoClient) -> None:
+        responses.add(responses.GET, DATABASE_URL, json={"database": database()}, status=200)
+        assert client.db.connect("my-org", "my-db").url == "https://my-db-my-org.turso.io"
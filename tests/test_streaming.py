@@ -0,0 +1,94 @@
+import json
+from typing import Any, Iterator, List
+
+import pytest
+import responses
+
+from tests.conftest import DATABASES_URL, database
+from tursopy import TursoClient
+from tursopy.dataclasses import DatabaseRead
+from tursopy.exceptions import TursoRequestException
+from tursopy.streaming import iter_json_array, iter_lines
+
+
+def chunked(document: Any, size: int) -> Iterator[bytes]:
+    payload = json.dumps(document, ensure_ascii=False).encode()
+    for i in range(0, len(payload), size):
+        yield payload[i : i + size]
+
+
+class TestIterJsonArray:
+    @pytest.mark.parametrize("size", [1, 3, 7, 4096])
+    def test_items_are_parsed_across_chunk_boundaries(self, size: int) -> None:
+        document = {
+            "meta": {"nested": [1, 2, {"a": "]"}]},
+            "items": [{"name": "ä-db", "count": 12345}, 67890, "text, with ] brackets", None, [1.5e3]],
+            "after": True,
+        }
+        assert list(iter_json_array(chunked(document, size), "items")) == document["items"]
+
+    def test_empty_and_missing_arrays(self) -> None:
+        assert list(iter_json_array(chunked({"items": []}, 2), "items")) == []
+        assert list(iter_json_array(chunked({"other": [1]}, 2), "items")) == []
+        assert list(iter_json_array(chunked({}, 2), "items")) == []
+
+    def test_items_are_yielded_before_the_stream_ends(self) -> None:
+        consumed: List[bytes] = []
+
+        def chunks() -> Iterator[bytes]:
+            for chunk in [b'{"items": [{"a": 1},', b' {"a": 2}', b"]}"]:
+                consumed.append(chunk)
+                yield chunk
+
+        iterator = iter_json_array(chunks(), "items")
+        assert next(iterator) == {"a": 1}
+        assert len(consumed) == 1
+
+    def test_truncated_document_raises_error(self) -> None:
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'{"items": [{"a": 1}, {"a"'], "items"))
+
+
+class TestIterLines:
+    @pytest.mark.parametrize("size", [1, 2, 5, 4096])
+    def test_lines_across_chunk_boundaries(self, size: int) -> None:
+        payload = b'{"a": 1}\n\n{"b": 2}\n{"c": 3}'
+        chunks = [payload[i : i + size] for i in range(0, len(payload), size)]
+        assert list(iter_lines(chunks)) == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+
+class TestStreamingDatabases:
+    @responses.activate
+    def test_iter_databases(self, client: TursoClient) -> None:
+        record = database()
+        responses.add(
+            responses.GET,
+            DATABASES_URL,
+            json={"databases": [record, {**record, "Name": "other-db"}]},
+            status=200,
+        )
+
+        databases = list(client.db.iter_databases(org_name="my-org"))
+        assert all(isinstance(x, DatabaseRead) for x in databases)
+        assert [x.Name for x in databases] == ["my-db", "other-db"]
+
+    @responses.activate
+    def test_iter_stats(self, client: TursoClient) -> None:
+        responses.add(
+            responses.GET,
+            "https://api.turso.tech/v1/organizations/my-org/databases/my-db/stats",
+            json={"top_queries": [{"query": "SELECT 1", "rows_read": 1, "rows_written": 0}]},
+            status=200,
+        )
+        assert [x.query for x in client.db.iter_stats(org_name="my-org", db_name="my-db")] == ["SELECT 1"]
+
+    @responses.activate
+    def test_iter_instances_fails(self, client: TursoClient) -> None:
+        responses.add(
+            responses.GET,
+            "https://api.turso.tech/v1/organizations/my-org/databases/my-db/instances",
+            json={"error": "not found"},
+            status=404,
+        )
+        with pytest.raises(TursoRequestException):
+            list(client.db.iter_instances(org_name="my-org", db_name="my-db"))
@@ -0,0 +1,84 @@
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+import responses
+
+from tests.conftest import DATABASES_URL, database
+from tursopy import AsyncTursoClient, TursoClient
+from tursopy.dataclasses import DatabaseRead
+from tursopy.table import DatabaseTable
+from tursopy.transport import HTTPXAsyncTransport
+
+RECORDS: List[Dict[str, Any]] = [
+    database("a", group="eu", regions=("lhr", "fra")),
+    database("b", group="eu", regions=("fra",), schema="parent", sleeping=True),
+    database("c", group="us", regions=("iad", "fra"), schema="parent"),
+    database("d", group="us", regions=("iad",)),
+]
+
+
+@pytest.fixture
+def table() -> DatabaseTable:
+    return DatabaseTable.from_records(RECORDS)
+
+
+class TestDatabaseTable:
+    def test_rows_match_database_read(self, table: DatabaseTable) -> None:
+        expected = [DatabaseRead.load(record) for record in RECORDS]
+        assert table.to_list() == expected
+        assert table[-1] == expected[-1]
+        assert DatabaseTable.from_databases(expected).to_list() == expected
+        assert len(table) == 4 and "a" in table and "x" not in table
+
+    def test_lookups(self, table: DatabaseTable) -> None:
+        assert table.get("c") == DatabaseRead.load(RECORDS[2])
+        assert table.get_by_id("id-b") == DatabaseRead.load(RECORDS[1])
+        assert table.get("missing") is None
+        assert table.value(0, "regions") == ["lhr", "fra"]
+        assert table.column("group") == ["eu", "eu", "us", "us"]
+
+    def test_filters(self, table: DatabaseTable) -> None:
+        assert table.filter(group="eu").names == ["a", "b"]
+        assert table.filter(region="fra").names == ["a", "b", "c"]
+        assert table.filter(region="fra", schema="parent").names == ["b", "c"]
+        assert table.filter(region="fra", sleeping=False, group="us").names == ["c"]
+        assert table.filter(primaryRegion="iad").names == ["c", "d"]
+        assert len(table.filter(group="asia")) == 0
+        with pytest.raises(KeyError, match="Unknown column"):
+            table.filter(color="red")
+
+    def test_group_by(self, table: DatabaseTable) -> None:
+        assert {group: rows.names for group, rows in table.group_by("group").items()} == {
+            "eu": ["a", "b"],
+            "us": ["c", "d"],
+        }
+        assert table.group_by("sleeping")[True].names == ["b"]
+        assert table.counts("region") == {"lhr": 1, "fra": 3, "iad": 2}
+        assert table.filter(group="us").group_by("region")["fra"].get("c") == DatabaseRead.load(RECORDS[2])
+        with pytest.raises(KeyError, match="no index"):
+            table.counts("Name")
+
+    def test_missing_fields(self) -> None:
+        with pytest.raises(TypeError, match="version"):
+            DatabaseTable.from_records([{key: value for key, value in RECORDS[0].items() if key != "version"}])
+
+
+class TestListDatabasesTable:
+    @responses.activate
+    def test_list_databases_table(self, client: TursoClient) -> None:
+        responses.add(responses.GET, DATABASES_URL, json={"databases": RECORDS}, status=200)
+        table = client.db.list_databases_table(org_name="my-org")
+        assert table.filter(group="eu").names == ["a", "b"]
+
+    def test_async_list_databases_table(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"databases": RECORDS})
+
+        async def main() -> DatabaseTable:
+            transport = HTTPXAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            client = AsyncTursoClient(platform_token="dummy", transport=transport)
+            return await client.db.list_databases_table(org_name="my-org")
+
+        assert asyncio.run(main()).names == ["a", "b", "c", "d"]
@@ -0,0 +1,190 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+from typing import Any, List, Optional
+
+import httpx
+import pytest
+import responses
+
+from tests.conftest import TURSO_TOKEN_VALIDATION_URL, mock_async_transport
+from tursopy import AsyncTursoClient, TursoClient
+from tursopy.tokens import DatabaseTokenCache, decode_jwt_expiry
+
+TOKEN_URL = "https://api.turso.tech/v1/organizations/my-org/databases/my-db/auth/tokens"
+ROTATE_URL = "https://api.turso.tech/v1/organizations/my-org/databases/my-db/auth/rotate"
+
+
+def make_jwt(exp: Optional[float] = None, subject: str = "db") -> str:
+    claims: dict[str, Any] = {"sub": subject}
+    if exp is not None:
+        claims["exp"] = exp
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"eyJhbGciOiJFZERTQSJ9.{payload}.signature"
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        """
+        Clock returning a manually advanced time.
+        """
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock(1_000.0)
+    monkeypatch.setattr("tursopy.tokens.time", fake)
+    return fake
+
+
+@pytest.fixture
+@responses.activate
+def token_client(dummy_settings: dict[str, str]) -> TursoClient:
+    responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+    return TursoClient(token_cache=True, **dummy_settings)
+
+
+class TestDecodeJwtExpiry:
+    def test_expiry_is_read_from_the_claims(self) -> None:
+        assert decode_jwt_expiry(make_jwt(exp=1_700_000_000)) == 1_700_000_000
+
+    def test_tokens_without_expiry(self) -> None:
+        assert decode_jwt_expiry(make_jwt()) is None
+        assert decode_jwt_expiry("not-a-jwt") is None
+        assert decode_jwt_expiry("a.!!!.c") is None
+
+
+class TestDatabaseTokenCache:
+    def test_tokens_are_cached_until_they_expire(self, clock: FakeClock) -> None:
+        cache = DatabaseTokenCache(refresh_ahead=0, expiry_margin=5)
+        tokens = [make_jwt(exp=1_100, subject="a"), make_jwt(exp=2_000, subject="b")]
+        key = cache.key("my-org", "my-db")
+
+        assert cache.get(key, lambda: tokens.pop(0)) == cache.get(key, lambda: tokens.pop(0))
+        assert len(tokens) == 1
+        clock.now = 1_095
+        assert decode_jwt_expiry(cache.get(key, lambda: tokens.pop(0))) == 2_000
+
+    def test_tokens_are_refreshed_ahead_of_expiry(self, clock: FakeClock) -> None:
+        cache = DatabaseTokenCache(refresh_ahead=30, expiry_margin=5)
+        fetched: List[str] = []
+
+        def fetch() -> str:
+            token = make_jwt(exp=clock.now + 100, subject=str(len(fetched)))
+            fetched.append(token)
+            return token
+
+        key = cache.key("my-org", "my-db")
+        first = cache.get(key, fetch)
+        clock.now = 1_075
+        assert cache.get(key, fetch) == first
+
+        deadline = time.monotonic() + 2
+        while cache.get(key, fetch) == first:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        assert len(fetched) == 2
+
+    def test_keys_include_the_token_options(self) -> None:
+        cache = DatabaseTokenCache()
+        read_only = cache.key("my-org", "my-db", authorization="read-only", expiration=None)
+        assert read_only == cache.key("my-org", "my-db", authorization="read-only")
+        assert read_only != cache.key("my-org", "my-db")
+
+    def test_invalidate_discards_tokens_fetched_concurrently(self) -> None:
+        cache = DatabaseTokenCache()
+        key = cache.key("my-org", "my-db")
+        fetched: List[str] = []
+
+        def fetch() -> str:
+            fetched.append(make_jwt(subject=str(len(fetched))))
+            if len(fetched) == 1:
+                cache.invalidate("my-org", "my-db")
+            return fetched[-1]
+
+        for _ in range(3):
+            cache.get(key, fetch)
+        assert len(fetched) == 2
+
+    def test_concurrent_misses_share_one_fetch(self) -> None:
+        cache = DatabaseTokenCache()
+        fetched: List[str] = []
+
+        def fetch() -> str:
+            time.sleep(0.02)
+            fetched.append(make_jwt(subject=str(len(fetched))))
+            return fetched[-1]
+
+        keys = [cache.key("my-org", f"db-{i % 2}") for i in range(8)]
+        threads = [threading.Thread(target=cache.get, args=(key, fetch)) for key in keys]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        assert len(fetched) == 2
+        assert cache._fetches._calls == {}
+
+    def test_concurrent_async_misses_share_one_fetch(self) -> None:
+        cache = DatabaseTokenCache()
+        fetched: List[str] = []
+
+        async def fetch() -> str:
+            await asyncio.sleep(0.01)
+            fetched.append(make_jwt(subject=str(len(fetched))))
+            return fetched[-1]
+
+        async def main() -> List[str]:
+            keys = [cache.key("my-org", f"db-{i % 2}") for i in range(8)]
+            return await asyncio.gather(*[cache.get_async(key, fetch) for key in keys])
+
+        tokens = asyncio.run(main())
+        assert len(fetched) == 2
+        assert tokens == fetched * 4
+        assert cache._async_fetches._tasks == {}
+
+
+class TestClientTokenCache:
+    @responses.activate
+    def test_generate_token_is_cached_and_invalidated(self, token_client: TursoClient) -> None:
+        responses.add(responses.POST, TOKEN_URL, json={"jwt": make_jwt(subject="first")}, status=200)
+        responses.add(responses.POST, ROTATE_URL, json={}, status=200)
+        responses.add(responses.POST, TOKEN_URL, json={"jwt": make_jwt(subject="second")}, status=200)
+
+        first = token_client.db.generate_token(org_name="my-org", db_name="my-db")
+        assert token_client.db.generate_token(org_name="my-org", db_name="my-db") == first
+        token_client.db.invalidate_tokens(org_name="my-org", db_name="my-db")
+        assert token_client.db.generate_token(org_name="my-org", db_name="my-db") != first
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_token_options_are_sent_as_parameters(self, client: TursoClient) -> None:
+        responses.add(responses.POST, TOKEN_URL, json={"jwt": "token"}, status=200)
+
+        token = client.db.generate_token(org_name="my-org", db_name="my-db", expiration="2w", authorization="read-only")
+        assert token == "token"
+        assert responses.calls[0].request.params == {  # type:ignore [attr-defined]
+            "expiration": "2w",
+            "authorization": "read-only",
+        }
+
+    def test_async_generate_token_is_cached(self) -> None:
+        calls: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json={"jwt": make_jwt()})
+
+        async def main() -> None:
+            transport = mock_async_transport(handler)
+            client = AsyncTursoClient(platform_token="dummy", transport=transport, token_cache=True)
+            first = await client.db.generate_token(org_name="my-org", db_name="my-db")
+            assert await client.db.generate_token(org_name="my-org", db_name="my-db") == first
+
+        asyncio.run(main())
+        assert len(calls) == 1
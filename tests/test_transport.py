@@ -0,0 +1,141 @@
+import asyncio
+from typing import Any, List, Tuple
+
+import httpx
+import requests
+import responses
+
+from benchmarks.h2_stub import start_h2_stub_server
+from benchmarks.stub_server import StubConfig
+from tests.conftest import TURSO_TOKEN_VALIDATION_URL
+from tursopy import AsyncTursoClient, TursoClient
+from tursopy.transport import HTTPXAsyncTransport, HTTPXTransport, RequestsTransport, Transport
+
+
+class RecordingTransport(Transport):
+    def __init__(self) -> None:
+        """Record every request before handing it to a real transport."""
+        self.inner = RequestsTransport()
+        self.calls: List[Tuple[str, str]] = []
+        self.closed = False
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        self.calls.append((method, url))
+        return self.inner.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestRequestsTransport:
+    def test_pool_size_is_applied(self) -> None:
+        transport = RequestsTransport(pool_size=32)
+        adapter = transport.session.get_adapter("https://api.turso.tech")
+        assert adapter._pool_maxsize == 32  # type:ignore [attr-defined]
+
+    def test_keep_alive_can_be_disabled(self) -> None:
+        transport = RequestsTransport(keep_alive=False)
+        assert transport.session.headers["Connection"] == "close"
+
+    @responses.activate
+    def test_default_timeout_is_applied(self) -> None:
+        responses.add(responses.GET, "https://api.turso.tech/ping", json={}, status=200)
+        transport = RequestsTransport(timeout=(1.0, 2.0))
+        transport.request("GET", "https://api.turso.tech/ping")
+        assert responses.calls[0].request.req_kwargs["timeout"] == (1.0, 2.0)  # type:ignore [attr-defined]
+
+
+class TestClientTransport:
+    @responses.activate
+    def test_all_calls_are_routed_through_transport(self, dummy_settings: dict[str, str]) -> None:
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        responses.add(
+            responses.GET,
+            "https://api.turso.tech/v1/organizations/my-org/databases/my-db/stats",
+            json={"top_queries": []},
+            status=200,
+        )
+        transport = RecordingTransport()
+        with TursoClient(transport=transport, **dummy_settings) as client:
+            client.db.get_stats(org_name="my-org", db_name="my-db")
+
+        assert transport.calls == [
+            ("GET", TURSO_TOKEN_VALIDATION_URL),
+            ("GET", "https://api.turso.tech/v1/organizations/my-org/databases/my-db/stats"),
+        ]
+        assert transport.closed
+        assert responses.calls[1].request.headers["Authorization"] == "Bearer dummy"
+
+    @responses.activate
+    def test_base_url_is_configurable(self, dummy_settings: dict[str, str]) -> None:
+        responses.add(responses.GET, "http://localhost:8080/v1/auth/validate", json={}, status=200)
+        client = TursoClient(base_url="http://localhost:8080", **dummy_settings)
+        assert client.base_url == "http://localhost:8080"
+
+
+class TestHTTPXTransport:
+    def test_requests_arguments_are_translated(self) -> None:
+        seen: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(201, json={"ok": True}, headers={"X-Test": "1"})
+
+        transport = HTTPXTransport(client=httpx.Client(transport=httpx.MockTransport(handler)))
+        response = transport.request("POST", "https://api.turso.tech/v1/x", data=b'{"a":1}', timeout=(1, 2))
+        assert seen[0].content == b'{"a":1}'
+        assert seen[0].extensions["timeout"] == {"connect": 1, "read": 2, "write": 2, "pool": 2}
+        assert response.status_code == 201
+        assert response.headers["x-test"] == "1"
+        assert response.content == b'{"ok":true}'
+        assert response.json() == {"ok": True}
+
+    def test_streamed_body(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"abcdef")
+
+        transport = HTTPXTransport(client=httpx.Client(transport=httpx.MockTransport(handler)))
+        with transport.request("GET", "https://api.turso.tech/v1/x", stream=True) as response:
+            assert b"".join(response.iter_content(2)) == b"abcdef"
+
+    def test_transport_errors_are_retryable(self) -> None:
+        transport = HTTPXTransport()
+        assert issubclass(httpx.ConnectError, transport.retryable_errors)
+        transport.close()
+
+    def test_client_uses_http2(self) -> None:
+        client = TursoClient(platform_token="dummy", token_validation="lazy", http2=True)
+        assert isinstance(client.transport, HTTPXTransport)
+        assert client.transport.client._transport._pool._http2  # type:ignore [union-attr]
+        client.close()
+
+
+class TestHTTP2Multiplexing:
+    def test_sync_calls_share_one_connection(self) -> None:
+        server, base_url = start_h2_stub_server(config=StubConfig(latency=0.05))
+        try:
+            transport = HTTPXTransport(client=httpx.Client(http1=False, http2=True))
+            with TursoClient(platform_token="dummy", base_url=base_url, transport=transport) as client:
+                names = [f"db-{i}" for i in range(20)]
+                results = list(client.db.get_usage_many("my-org", names))
+            assert [result.error for result in results] == [None] * 20
+            assert server.connections == 1
+            assert server.calls["get_usage"] == 20
+        finally:
+            server.shutdown()
+
+    def test_async_calls_share_one_connection(self) -> None:
+        server, base_url = start_h2_stub_server(config=StubConfig(latency=0.05))
+
+        async def main() -> None:
+            transport = HTTPXAsyncTransport(client=httpx.AsyncClient(http1=False, http2=True))
+            client = AsyncTursoClient(platform_token="dummy", base_url=base_url, transport=transport)
+            await asyncio.gather(*(client.db.get_usage(org_name="my-org", db_name=f"db-{i}") for i in range(20)))
+            await client.aclose()
+
+        try:
+            asyncio.run(main())
+            assert server.connections == 1
+            assert server.calls["get_usage"] == 20
+        finally:
+            server.shutdown()
@@ -0,0 +1,166 @@
+import asyncio
+import json
+from typing import Any, Callable, Dict, List, Tuple
+
+import httpx
+import pytest
+
+from tests.conftest import database
+from tursopy import AsyncTursoClient
+from tursopy.dataclasses import DatabaseCreated, DatabaseRead
+from tursopy.exceptions import InvalidPlatformTokenException, TursoRequestException
+from tursopy.transport import HTTPXAsyncTransport
+
+Routes = Dict[Tuple[str, str], Tuple[int, Dict[str, Any]]]
+
+
+def make_client(routes: Routes, seen: List[httpx.Request]) -> AsyncTursoClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        status, body = {("GET", "/v1/auth/validate"): (200, {}), **routes}[(request.method, request.url.path)]
+        return httpx.Response(status, json=body)
+
+    transport = HTTPXAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return AsyncTursoClient(platform_token="dummy", transport=transport)
+
+
+def run(coro_factory: Callable[[], Any]) -> Any:
+    return asyncio.run(coro_factory())
+
+
+class TestAsyncTursoClient:
+    def test_context_manager_validates_token(self) -> None:
+        seen: List[httpx.Request] = []
+        routes: Routes = {("GET", "/v1/auth/validate"): (200, {})}
+
+        async def main() -> None:
+            async with make_client(routes, seen) as client:
+                assert isinstance(client, AsyncTursoClient)
+
+        run(main)
+        assert seen[0].headers["Authorization"] == "Bearer dummy"
+
+    def test_invalid_token_raises_error(self) -> None:
+        routes: Routes = {("GET", "/v1/auth/validate"): (401, {"error": "invalid"})}
+
+        async def main() -> None:
+            async with make_client(routes, []):
+                pass
+
+        with pytest.raises(InvalidPlatformTokenException):
+            run(main)
+
+    def test_invalid_token_raises_error_without_context_manager(self) -> None:
+        seen: List[httpx.Request] = []
+        routes: Routes = {("GET", "/v1/auth/validate"): (401, {"error": "invalid"})}
+
+        async def main() -> None:
+            client = make_client(routes, seen)
+            await client.db.list_databases(org_name="my-org")
+
+        with pytest.raises(InvalidPlatformTokenException):
+            run(main)
+        assert [request.url.path for request in seen] == ["/v1/auth/validate"]
+
+    def test_eager_validation_runs_once_without_context_manager(self) -> None:
+        seen: List[httpx.Request] = []
+        routes: Routes = {("GET", "/v1/organizations/my-org/databases"): (200, {"databases": [database()]})}
+
+        async def main() -> None:
+            client = make_client(routes, seen)
+            await asyncio.gather(*[client.db.list_databases(org_name="my-org") for _ in range(3)])
+            async with client:
+                await client.db.list_databases(org_name="my-org")
+
+        run(main)
+        assert [request.url.path for request in seen].count("/v1/auth/validate") == 1
+        assert seen[0].url.path == "/v1/auth/validate"
+
+    def test_list_databases(self) -> None:
+        routes: Routes = {("GET", "/v1/organizations/my-org/databases"): (200, {"databases": [database()]})}
+
+        async def main() -> List[DatabaseRead]:
+            client = make_client(routes, [])
+            databases = await client.db.list_databases(org_name="my-org")
+            await client.aclose()
+            return databases
+
+        databases = run(main)
+        assert [x.to_dict() for x in databases] == [database()]
+
+    def test_create_database_sends_json_body(self) -> None:
+        seen: List[httpx.Request] = []
+        created = {
+            "DbId": "0eb771dd-6906-11ee-8553-eaa7715aeaf2",
+            "Hostname": "my-db-my-org.turso.io",
+            "Name": "my-db",
+            "IssuedCertCount": 0,
+            "IssuedCertLimit": 2,
+        }
+        routes: Routes = {("POST", "/v1/organizations/my-org/databases"): (200, {"database": created})}
+
+        async def main() -> DatabaseCreated:
+            client = make_client(routes, seen)
+            return await client.db.create_database(org_name="my-org", name="my-db", schema="parent-db")
+
+        response = run(main)
+        assert response.to_dict() == created
+        assert json.loads(seen[-1].content) == {"name": "my-db", "group": "default", "schema": "parent-db"}
+
+    def test_create_database_validates_parameters(self) -> None:
+        async def main() -> None:
+            client = make_client({}, [])
+            await client.db.create_database(org_name="my-org", name="my-db", seed_type="dump")
+
+        with pytest.raises(ValueError):
+            run(main)
+
+    def test_get_usage_passes_params(self) -> None:
+        seen: List[httpx.Request] = []
+        usage = {"instances": [], "total": {"rows_read": 1, "rows_written": 2, "storage_bytes": 3}, "uuid": "x"}
+        routes: Routes = {("GET", "/v1/organizations/my-org/databases/my-db/usage"): (200, {"database": usage})}
+
+        async def main() -> None:
+            client = make_client(routes, seen)
+            await client.db.get_usage(org_name="my-org", db_name="my-db", from_ts="2023-01-01T00:00:00Z")
+
+        run(main)
+        assert seen[-1].url.params["from"] == "2023-01-01T00:00:00Z"
+
+    def test_concurrent_calls_share_one_client(self) -> None:
+        routes: Routes = {("GET", "/v1/organizations/my-org/databases/my-db"): (200, {"database": database()})}
+
+        async def main() -> List[DatabaseRead]:
+            client = make_client(routes, [])
+            return await asyncio.gather(*[client.db.retrieve(org_name="my-org", db_name="my-db") for _ in range(50)])
+
+        assert len(run(main)) == 50
+
+    def test_retrieve_fails(self) -> None:
+        routes: Routes = {("GET", "/v1/organizations/my-org/databases/my-db"): (404, {"error": "not found"})}
+
+        async def main() -> None:
+            client = make_client(routes, [])
+            await client.db.retrieve(org_name="my-org", db_name="my-db")
+
+        with pytest.raises(TursoRequestException):
+            run(main)
+
+    def test_lazy_validation_runs_once_for_concurrent_calls(self) -> None:
+        validations: List[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/v1/auth/validate":
+                validations.append(request)
+                await asyncio.sleep(0.01)
+                return httpx.Response(200, json={})
+            return httpx.Response(200, json={"databases": [database()]})
+
+        async def main() -> None:
+            transport = HTTPXAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            client = AsyncTursoClient(platform_token="dummy", transport=transport, token_validation="lazy")
+            results = await asyncio.gather(*[client.db.list_databases(org_name="my-org") for _ in range(10)])
+            assert all(len(databases) == 1 for databases in results)
+
+        run(main)
+        assert len(validations) == 1
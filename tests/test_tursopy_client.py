@@ -1,10 +1,12 @@
 import os
+from pathlib import Path
 
 import pytest
 import responses
 
 from tests.conftest import TURSO_TOKEN_VALIDATION_URL
 from tursopy import TursoClient
+from tursopy.auth import TokenValidationCache
 from tursopy.dataclasses import PlatformTokenRead
 from tursopy.exceptions import InvalidPlatformTokenException, TursoRequestException
 
@@ -57,3 +59,42 @@ class TestTursoClient:
         )
         with pytest.raises(TursoRequestException):
             client.list_platform_tokens()
+
+    def test_lazy_validation_does_no_io_on_construction(self, dummy_settings: dict[str, str]) -> None:
+        client = TursoClient(token_validation="lazy", **dummy_settings)
+        assert isinstance(client, TursoClient)
+
+    @responses.activate
+    def test_lazy_validation_validates_before_first_call(self, dummy_settings: dict[str, str]) -> None:
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={"error": "invalid"}, status=401)
+        client = TursoClient(token_validation="lazy", **dummy_settings)
+        with pytest.raises(InvalidPlatformTokenException):
+            client.list_platform_tokens()
+
+    @responses.activate
+    def test_cached_validation_is_remembered(self, dummy_settings: dict[str, str], tmp_path: Path) -> None:
+        cache = TokenValidationCache(path=tmp_path / "tokens.json", ttl=60)
+        responses.add(responses.GET, TURSO_TOKEN_VALIDATION_URL, json={}, status=200)
+        responses.add(responses.GET, "https://api.turso.tech/v1/auth/api-tokens", json={"tokens": []}, status=200)
+
+        TursoClient(token_validation="cached", token_validation_cache=cache, **dummy_settings).list_platform_tokens()
+        TursoClient(token_validation="cached", token_validation_cache=cache, **dummy_settings).list_platform_tokens()
+
+        assert [call.request.url for call in responses.calls].count(TURSO_TOKEN_VALIDATION_URL) == 1
+        assert cache.is_valid("dummy")
+        assert "dummy" not in (tmp_path / "tokens.json").read_text()
+
+    @responses.activate
+    def test_rejected_token_is_forgotten(self, dummy_settings: dict[str, str], tmp_path: Path) -> None:
+        cache = TokenValidationCache(path=tmp_path / "tokens.json", ttl=60)
+        cache.remember("dummy")
+        responses.add(responses.GET, "https://api.turso.tech/v1/auth/api-tokens", json={"error": "revoked"}, status=401)
+
+        client = TursoClient(token_validation="cached", token_validation_cache=cache, **dummy_settings)
+        with pytest.raises(TursoRequestException):
+            client.list_platform_tokens()
+        assert not cache.is_valid("dummy")
+
+    def test_unknown_validation_mode_raises_error(self, dummy_settings: dict[str, str]) -> None:
+        with pytest.raises(ValueError):
+            TursoClient(token_validation="sometimes", **dummy_settings)
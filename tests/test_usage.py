@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+import responses
+
+from tests.conftest import DATABASES_URL, database, database_callback
+from tursopy import TursoClient
+from tursopy.usage import UsageAggregator, UsageTable, UsageTotals, UsageWindowCache, split_range
+
+
+def usage(name: str) -> Tuple[int, Dict[str, Any]]:
+    if name == "broken":
+        return 500, {"error": "unavailable"}
+    total = {"rows_read": 10, "rows_written": 1, "storage_bytes": 100}
+    return 200, {"database": {"instances": [], "total": total, "uuid": name}}
+
+
+usage_callback = database_callback(usage)
+
+
+def utc(year: int, month: int, day: int, hour: int = 0) -> datetime:
+    return datetime(year, month, day, hour, tzinfo=timezone.utc)
+
+
+class TestSplitRange:
+    def test_calendar_buckets_are_aligned(self) -> None:
+        windows = split_range(utc(2024, 1, 1, 12), utc(2024, 1, 3))
+        assert windows == [(utc(2024, 1, 1, 12), utc(2024, 1, 2)), (utc(2024, 1, 2), utc(2024, 1, 3))]
+
+        months = split_range(datetime(2024, 1, 15), datetime(2024, 3, 2), "month")
+        assert [upper for _, upper in months] == [utc(2024, 2, 1), utc(2024, 3, 1), utc(2024, 3, 2)]
+
+    def test_fixed_buckets(self) -> None:
+        windows = split_range(utc(2024, 1, 1), utc(2024, 1, 1, 5), timedelta(hours=2))
+        assert [lower.hour for lower, _ in windows] == [0, 2, 4]
+
+    def test_invalid_buckets(self) -> None:
+        with pytest.raises(ValueError, match="Bucket"):
+            split_range(utc(2024, 1, 1), utc(2024, 1, 2), "week")
+        with pytest.raises(ValueError, match="positive"):
+            split_range(utc(2024, 1, 1), utc(2024, 1, 2), timedelta(0))
+
+
+class TestUsageTable:
+    def test_group_by(self) -> None:
+        windows = split_range(utc(2024, 1, 1), utc(2024, 1, 3))
+        table = UsageTable(["a", "b"], ["g1", "g1"], ["lhr", "fra"], windows)
+        table.append(0, 0, (1, 2, 100))
+        table.append(0, 1, (3, 4, 300))
+        table.append(1, 0, (5, 6, 50))
+
+        assert table.group_by("database")["a"] == UsageTotals(4, 6, 300)
+        assert table.group_by("group") == {"g1": UsageTotals(9, 12, 350)}
+        assert table.group_by("region")["fra"] == UsageTotals(5, 6, 50)
+        assert table.group_by("bucket")[utc(2024, 1, 1)] == UsageTotals(6, 8, 150)
+        assert table.total() == UsageTotals(9, 12, 350)
+        with pytest.raises(ValueError, match="Group key"):
+            table.group_by("instance")
+
+
+class TestUsageAggregator:
+    @responses.activate
+    def test_closed_windows_are_fetched_once(self, client: TursoClient, tmp_path: Path) -> None:
+        responses.add(
+            responses.GET,
+            DATABASES_URL,
+            json={"databases": [database("db-1", "eu"), database("db-2", "us", ("iad",))]},
+            status=200,
+        )
+        responses.add_callback(responses.GET, f"{DATABASES_URL}/db-1/usage", callback=usage_callback)
+        responses.add_callback(responses.GET, f"{DATABASES_URL}/db-2/usage", callback=usage_callback)
+
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        start, end = today - timedelta(days=2), today + timedelta(days=1)
+        cache = UsageWindowCache(tmp_path / "usage.json")
+
+        table = UsageAggregator(client.db, cache).aggregate("my-org", start, end)
+        assert len(table) == 6
+        assert len(responses.calls) == 7
+        assert table.group_by("group")["eu"] == UsageTotals(30, 3, 100)
+
+        again = UsageAggregator(client.db, UsageWindowCache(tmp_path / "usage.json")).aggregate("my-org", start, end)
+        assert len(again) == 6
+        usage_calls = [call for call in responses.calls[7:] if "/usage" in str(call.request.url)]
+        assert len(usage_calls) == 2
+
+    @responses.activate
+    def test_failures_are_recorded(self, client: TursoClient) -> None:
+        responses.add(
+            responses.GET,
+            DATABASES_URL,
+            json={"databases": [database("db-1", "eu"), database("broken", "eu")]},
+            status=200,
+        )
+        responses.add_callback(responses.GET, f"{DATABASES_URL}/db-1/usage", callback=usage_callback)
+        responses.add_callback(responses.GET, f"{DATABASES_URL}/broken/usage", callback=usage_callback)
+
+        table = client.db.aggregate_usage("my-org", utc(2024, 1, 1), utc(2024, 1, 2))
+        failures: List[str] = [name for name, _, _ in table.failures]
+        assert failures == ["broken"]
+        assert table.group_by("database") == {"db-1": UsageTotals(10, 1, 100)}
+        assert len(client.db.usage_cache) == 1
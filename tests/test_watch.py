@@ -0,0 +1,130 @@
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+import httpx
+import pytest
+import responses
+
+from tests.conftest import DATABASES_URL, database
+from tursopy import AsyncTursoClient, TursoClient
+from tursopy.dataclasses import DatabaseRead
+from tursopy.transport import HTTPXAsyncTransport
+from tursopy.watch import (
+    AdaptiveInterval,
+    DatabaseCreatedEvent,
+    DatabaseDeletedEvent,
+    DatabaseDiffer,
+    DatabaseEvent,
+    DatabaseModifiedEvent,
+)
+
+
+def load(*records: Dict[str, Any]) -> List[DatabaseRead]:
+    return [DatabaseRead.load(r) for r in records]
+
+
+def describe(events: List[DatabaseEvent]) -> List[Tuple[str, str]]:
+    return [(type(event).__name__, event.name) for event in events]
+
+
+class TestDatabaseDiffer:
+    def test_events(self) -> None:
+        differ = DatabaseDiffer()
+        assert describe(differ.diff(load(database("a"), database("b")))) == [
+            ("DatabaseCreatedEvent", "a"),
+            ("DatabaseCreatedEvent", "b"),
+        ]
+        assert differ.diff(load(database("a"), database("b"))) == []
+
+        events = differ.diff(load(database("a", sleeping=True, regions=("lhr", "fra")), database("c")))
+        assert describe(events) == [
+            ("DatabaseDeletedEvent", "b"),
+            ("DatabaseCreatedEvent", "c"),
+            ("DatabaseModifiedEvent", "a"),
+        ]
+        modified = events[2]
+        assert isinstance(modified, DatabaseModifiedEvent)
+        assert modified.changes == {"regions": (["lhr"], ["lhr", "fra"]), "sleeping": (False, True)}
+        assert modified.previous.sleeping is False and modified.database.sleeping is True
+        assert sorted(differ.databases) == ["a", "c"]
+
+    def test_recreated_database(self) -> None:
+        differ = DatabaseDiffer()
+        differ.diff(load(database("a")))
+        events = differ.diff(load(database("a", db_id="new-id")))
+        assert describe(events) == [("DatabaseDeletedEvent", "a"), ("DatabaseCreatedEvent", "a")]
+        assert isinstance(events[0], DatabaseDeletedEvent) and events[0].database.DbId == "id-a"
+        assert isinstance(events[1], DatabaseCreatedEvent) and events[1].database.DbId == "new-id"
+
+    def test_watched_fields(self) -> None:
+        differ = DatabaseDiffer(fields=["sleeping"])
+        differ.diff(load(database("a")))
+        assert differ.diff(load(database("a", regions=("fra",)))) == []
+        assert describe(differ.diff(load(database("a", regions=("fra",), sleeping=True)))) == [
+            ("DatabaseModifiedEvent", "a")
+        ]
+        with pytest.raises(ValueError, match="color"):
+            DatabaseDiffer(fields=["color"])
+
+
+class TestAdaptiveInterval:
+    def test_backoff_and_reset(self) -> None:
+        interval = AdaptiveInterval(min_interval=1, max_interval=5, backoff=2)
+        assert [interval.update(False) for _ in range(4)] == [2, 4, 5, 5]
+        assert interval.update(True) == 1
+        assert interval.update(False) == 2
+
+    def test_invalid_settings(self) -> None:
+        with pytest.raises(ValueError):
+            AdaptiveInterval(min_interval=2, max_interval=1)
+        with pytest.raises(ValueError):
+            AdaptiveInterval(backoff=0.5)
+
+
+class TestWatchDatabases:
+    @responses.activate
+    def test_watch_databases(self, client: TursoClient) -> None:
+        listings = [
+            [database("a"), database("b")],
+            [database("a"), database("b")],
+            [database("a", sleeping=True)],
+        ]
+        for listing in listings:
+            responses.add(responses.GET, DATABASES_URL, json={"databases": listing}, status=200)
+
+        watcher = client.db.watch_databases("my-org", fields=["sleeping"], min_interval=0.001, max_interval=0.002)
+        events: List[DatabaseEvent] = []
+
+        def on_event(event: DatabaseEvent) -> None:
+            events.append(event)
+            if len(events) == 2:
+                watcher.stop()
+
+        watcher.run(on_event)
+        assert describe(events) == [("DatabaseDeletedEvent", "b"), ("DatabaseModifiedEvent", "a")]
+        assert watcher.polls == 3
+
+    @responses.activate
+    def test_initial_databases(self, client: TursoClient) -> None:
+        responses.add(responses.GET, DATABASES_URL, json={"databases": [database("a")]}, status=200)
+        watcher = client.db.watch_databases("my-org", initial=True)
+        assert describe(watcher.poll()) == [("DatabaseCreatedEvent", "a")]
+
+    def test_async_watch_databases(self) -> None:
+        listings = iter([[database("a")], [database("a")], [database("a"), database("b")]])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/auth/validate"):
+                return httpx.Response(200, json={})
+            return httpx.Response(200, json={"databases": next(listings)})
+
+        async def main() -> List[DatabaseEvent]:
+            transport = HTTPXAsyncTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+            client = AsyncTursoClient(platform_token="dummy", transport=transport)
+            watcher = client.db.watch_databases("my-org", min_interval=0.001, max_interval=0.002)
+            async for event in watcher:
+                watcher.stop()
+                return [event]
+            return []
+
+        assert describe(asyncio.run(main())) == [("DatabaseCreatedEvent", "b")]
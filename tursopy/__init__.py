@@ -1 +1,33 @@
-from .tursopy import TursoClient
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_tursopy import AsyncTursoClient
+    from .tursopy import TursoClient
+
+__all__ = ["AsyncTursoClient", "TursoClient"]
+
+# The clients are imported on first access, so 'import tursopy' stays cheap for tools that may not need them.
+_LAZY_ATTRIBUTES = {"TursoClient": ".tursopy", "AsyncTursoClient": ".async_tursopy"}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the clients lazily.
+    :param name: Attribute name
+    :return: Client class
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> Any:
+    """
+    List the module attributes including the lazily imported clients.
+    :return: Attribute names
+    """
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
@@ -0,0 +1,201 @@
+import heapq
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .dataclasses import StatQuery
+    from .db import DatabasesClient
+
+METRICS = ("rows", "rows_read", "rows_written")
+
+_TOKENS = re.compile(
+    r"""
+      (?P<comment>--[^\n]*|/\*.*?(?:\*/|$))
+    | (?P<literal>[xX]'[0-9a-fA-F]*'|'(?:[^']|'')*'|\b0[xX][0-9a-fA-F]+\b|\b\d+(?:\.\d*)?(?:[eE][-+]?\d+)?\b|\.\d+\b)
+    | (?P<parameter>\?\d*|[:@$][A-Za-z_]\w*)
+    | (?P<identifier>"(?:[^"]|"")*"|`[^`]*`|\[[^\]]*\])
+    | (?P<word>[A-Za-z_]\w*)
+    | (?P<space>\s+)
+    | (?P<symbol>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+# Lists of placeholders, e.g. 'IN (?, ?, ?)' or multi-row 'VALUES (?, ?), (?, ?)', collapse to a single entry.
+_PLACEHOLDER_LIST = re.compile(r"\(\?(?:, \?)+\)")
+_REPEATED_GROUP = re.compile(r"\(\?\)(?:, \(\?\))+")
+_NO_SPACE_BEFORE = frozenset(",).;")
+_NO_SPACE_AFTER = frozenset("(.")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(query: str) -> str:
+    """
+    Normalize a SQL query to its pattern. Literals and parameters are replaced by '?', comments are removed,
+    keywords are lowercased, whitespace is collapsed and lists of placeholders are reduced to one entry.
+    Queries that only differ in their values share the same fingerprint.
+    :param query: SQL query
+    :return: Fingerprint, e.g. 'select * from users where id in (?)'.
+    """
+    parts: List[str] = []
+    glue = True
+    for match in _TOKENS.finditer(query):
+        kind, token = match.lastgroup, match.group()
+        if kind in ("comment", "space"):
+            continue
+        if kind in ("literal", "parameter"):
+            token = "?"
+        elif kind == "word":
+            token = token.lower()
+        if parts and not glue and token not in _NO_SPACE_BEFORE:
+            parts.append(" ")
+        parts.append(token)
+        glue = token in _NO_SPACE_AFTER
+
+    text = "".join(parts).rstrip(";").rstrip()
+    text = _PLACEHOLDER_LIST.sub("(?)", text)
+    return _REPEATED_GROUP.sub("(?)", text)
+
+
+@dataclass
+class QueryPattern:
+    """
+    Rows read and written by all queries sharing a fingerprint, in total and per database.
+    """
+
+    fingerprint: str
+    example: str
+    rows_read: int = 0
+    rows_written: int = 0
+    databases: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+
+    @property
+    def rows(self) -> int:
+        """
+        Rows read and written.
+        :return: int
+        """
+        return self.rows_read + self.rows_written
+
+    def top_databases(self, n: Optional[int] = None, by: str = "rows") -> List[Tuple[str, int]]:
+        """
+        Return the databases running this pattern, most expensive first.
+        :param n: Number of databases. Defaults to all.
+        :param by: 'rows', 'rows_read' or 'rows_written'.
+        :return: List of (database name, rows) tuples.
+        """
+        costs = [(name, _cost(read, written, by)) for name, (read, written) in self.databases.items()]
+        if n is None:
+            return sorted(costs, key=lambda item: item[1], reverse=True)
+        return heapq.nlargest(n, costs, key=lambda item: item[1])
+
+
+@dataclass
+class HotQueryReport:
+    """
+    Result of a fleet-wide query analysis.
+    """
+
+    patterns: List[QueryPattern]
+    databases: int
+    failures: List[Tuple[str, Exception]] = field(default_factory=list)
+
+
+def _cost(rows_read: int, rows_written: int, by: str) -> int:
+    """
+    Compute the cost of a query by a metric.
+    :param rows_read: Rows read.
+    :param rows_written: Rows written.
+    :param by: 'rows', 'rows_read' or 'rows_written'.
+    :return: int
+    """
+    if by == "rows_read":
+        return rows_read
+    if by == "rows_written":
+        return rows_written
+    return rows_read + rows_written
+
+
+class QueryAggregator:
+    """
+    Merges the top queries of many databases by fingerprint.
+
+    Memory is bounded by the number of distinct patterns rather than the number of queries, and 'top' selects the
+    heaviest patterns with a heap of size k instead of sorting all of them.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty aggregator.
+        """
+        self.patterns: Dict[str, QueryPattern] = {}
+        self.databases = 0
+
+    def add(self, db_name: str, stats: Iterable["StatQuery"]) -> None:
+        """
+        Merge the top queries of a database.
+        :param db_name: The name of the database.
+        :param stats: Top queries as returned by 'get_stats'.
+        :return: None
+        """
+        self.databases += 1
+        for stat in stats:
+            key = fingerprint(stat.query)
+            pattern = self.patterns.get(key)
+            if pattern is None:
+                pattern = self.patterns[key] = QueryPattern(key, stat.query)
+            pattern.rows_read += stat.rows_read
+            pattern.rows_written += stat.rows_written
+            read, written = pattern.databases.get(db_name, (0, 0))
+            pattern.databases[db_name] = read + stat.rows_read, written + stat.rows_written
+
+    def top(self, k: int = 10, by: str = "rows") -> List[QueryPattern]:
+        """
+        Return the heaviest patterns.
+        :param k: Number of patterns.
+        :param by: 'rows', 'rows_read' or 'rows_written'.
+        :return: List of QueryPatterns, most expensive first.
+        """
+        if by not in METRICS:
+            raise ValueError(f"Metric needs to be one of {METRICS}.")
+        return heapq.nlargest(
+            k, self.patterns.values(), key=lambda pattern: _cost(pattern.rows_read, pattern.rows_written, by)
+        )
+
+
+def analyze_hot_queries(
+    db_client: "DatabasesClient",
+    org_name: str,
+    *,
+    top: int = 10,
+    by: str = "rows",
+    db_names: Optional[Sequence[str]] = None,
+    max_concurrency: Optional[int] = None,
+) -> HotQueryReport:
+    """
+    Collect the top queries of many databases concurrently and return the query patterns reading or writing the
+    most rows across all of them. Databases whose stats cannot be fetched are reported on the 'failures' of the
+    report.
+
+    :param db_client: DatabasesClient used to fetch the stats.
+    :param org_name: The name of the organization or user.
+    :param top: Number of patterns.
+    :param by: 'rows', 'rows_read' or 'rows_written'.
+    :param db_names: Names of the databases. Defaults to all databases of the organization.
+    :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+    :return: HotQueryReport
+    """
+    if by not in METRICS:
+        raise ValueError(f"Metric needs to be one of {METRICS}.")
+    if db_names is None:
+        db_names = [database.Name for database in db_client.list_databases(org_name)]
+
+    aggregator = QueryAggregator()
+    failures: List[Tuple[str, Exception]] = []
+    for result in db_client.get_stats_many(org_name, db_names, ordered=False, max_concurrency=max_concurrency):
+        if result.error is not None:
+            failures.append((result.key, result.error))
+        else:
+            aggregator.add(result.key, result.unwrap())
+    return HotQueryReport(aggregator.top(top, by), aggregator.databases, failures)
@@ -0,0 +1,406 @@
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from .batch import BatchResult, run_batch_async
+from .dataclasses import (
+    ConfigUpdateResponse,
+    DatabaseCreated,
+    DatabaseRead,
+    DatabaseSpec,
+    DbInstance,
+    StatQuery,
+    UsageRead,
+)
+from .db import BaseDatabasesClient, OptBool, OptStr, _ApiCall
+from .table import DatabaseTable
+from .watch import DEFAULT_BACKOFF, DEFAULT_MAX_INTERVAL, DEFAULT_MIN_INTERVAL, AsyncDatabaseWatcher
+
+if TYPE_CHECKING:
+    from .async_tursopy import AsyncTursoClient
+
+T = TypeVar("T")
+
+
+class AsyncDatabasesClient(BaseDatabasesClient):
+    """
+    Asynchronous databases client managing the databases endpoints.
+    """
+
+    client: "AsyncTursoClient"
+
+    def __init__(self, base_client: "AsyncTursoClient") -> None:
+        """
+        Initialize the database client for api request management.
+        :param base_client: Base AsyncTursoClient.
+        """
+        self.client = base_client
+
+    async def _send(self, call: _ApiCall[T]) -> T:
+        """
+        Send a call through the client and parse its response.
+        :param call: _ApiCall
+        :return: Result of the call.
+        """
+        response = await self.client.request(call.method, call.url, endpoint=call.endpoint, **call.kwargs)
+        return call.parse(response)
+
+    async def generate_token(
+        self, org_name: str, db_name: str, expiration: OptStr = None, authorization: OptStr = None
+    ) -> str:
+        """
+        Generates an authorization token for the specified database. If the client has a token cache, cached
+        tokens are returned until shortly before they expire and refreshed in the background.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :param expiration: Expiration time of the token, e.g. '2w1d30m'. Defaults to a token that never expires.
+        :param authorization: Access level of the token, either 'full-access' (default) or 'read-only'.
+        :return: JWT token
+        """
+        call = self._generate_token_call(org_name, db_name, expiration, authorization)
+        cache = self.client.token_cache
+        if cache is None:
+            return await self._send(call)
+        key = cache.key(org_name, db_name, expiration=expiration, authorization=authorization)
+        return await cache.get_async(key, lambda: self._send(call))
+
+    async def invalidate_tokens(self, org_name: str, db_name: str) -> None:
+        """
+        Invalidates all authorization tokens for the specified database.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: None
+        """
+        try:
+            await self._send(self._invalidate_tokens_call(org_name, db_name))
+        finally:
+            self._forget_tokens(org_name, db_name)
+
+    async def list_databases(self, org_name: str) -> List[DatabaseRead]:
+        """
+        Return a list of databases belonging to the organization or user.
+        :param org_name: Organization or username.
+        :return: List of databases.
+        """
+        return await self._send(self._list_databases_call(org_name))
+
+    async def list_databases_table(self, org_name: str) -> DatabaseTable:
+        """
+        Return the databases belonging to the organization or user as a column-oriented table. Repeated values are
+        stored once and lookups by name, id, group, region or schema use indexes instead of scanning a list.
+        :param org_name: Organization or username.
+        :return: DatabaseTable
+        """
+        return await self._send(self._list_databases_table_call(org_name))
+
+    def watch_databases(
+        self,
+        org_name: str,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = DEFAULT_BACKOFF,
+        initial: bool = False,
+    ) -> AsyncDatabaseWatcher:
+        """
+        Watch the databases of the organization or user for changes. The returned watcher polls 'list_databases'
+        when iterated and yields typed events for created, deleted and modified databases. The time between polls
+        drops to 'min_interval' after a change and grows by 'backoff' up to 'max_interval' while nothing changes.
+
+        :param org_name: Organization or username.
+        :param fields: DatabaseRead fields to watch for modifications, e.g. ('sleeping', 'regions'). Defaults to
+                       all fields.
+        :param min_interval: Seconds between polls after a change.
+        :param max_interval: Upper bound of the seconds between polls.
+        :param backoff: Factor the interval grows by after a poll without changes.
+        :param initial: Report the databases found by the first poll as created.
+        :return: AsyncDatabaseWatcher
+        """
+        return AsyncDatabaseWatcher(
+            self,
+            org_name,
+            fields=fields,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            initial=initial,
+        )
+
+    async def list_instances(self, org_name: str, db_name: str) -> List[DbInstance]:
+        """
+        Returns a list of instances of a database. Instances are the individual primary or replica databases in each region defined by the group.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: List of database instances.
+        """
+        return await self._send(self._list_instances_call(org_name, db_name))
+
+    async def get_instance(self, org_name: str, db_name: str, instance_name: str) -> DbInstance:
+        """
+        Return the individual database instance by name.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :param instance_name: The name of the instance (location code).
+        :return: Database Instance
+        """
+        return await self._send(self._get_instance_call(org_name, db_name, instance_name))
+
+    async def create_database(
+        self,
+        org_name: str,
+        name: str,
+        is_schema: OptBool = None,
+        schema: OptStr = None,
+        seed_name: OptStr = None,
+        seed_ts: OptStr = None,
+        seed_type: Optional[Literal["database", "dump"]] = None,
+        seed_url: OptStr = None,
+        size_limit: OptStr = None,
+        group: str = "default",
+        retry: OptBool = None,
+    ) -> DatabaseCreated:
+        """
+        Creates a new database in a group for the organization or user.
+
+        :param org_name: The name of the organization or user.
+        :param name: The name of the new database. Must contain only lowercase letters, numbers, dashes. No longer than 32 characters.
+        :param is_schema: Mark this database as the parent schema database that updates child databases with any schema changes.
+        :param schema: The name of the parent database to use as the schema. See Multi-DB Schemas.
+        :param seed_name: The name of the existing database when database is used as a seed type.
+        :param seed_ts: A formatted ISO 8601 recovery point to create a database from. This must be within the last 24 hours, or 30 days on the scaler plan.
+        :param seed_type: The type of seed to be used to create a new database. Either 'database' or 'dump'.
+        :param seed_url: The URL returned by upload dump can be used with the dump seed type.
+        :param size_limit: The maximum size of the database in bytes. Values with units are also accepted, e.g. '1mb', '256mb', '1gb'.
+        :param group: The name of the group where the database should be created. The group must already exist. Defaults to 'default'.
+        :param retry: Retry this call on transient failures. Database creation is not idempotent, so it is only retried when enabled here and a retry policy is configured on the client.
+        :return: DatabaseCreated
+        """
+        data = self._build_create_database_body(
+            name=name,
+            is_schema=is_schema,
+            schema=schema,
+            seed_name=seed_name,
+            seed_ts=seed_ts,
+            seed_type=seed_type,
+            seed_url=seed_url,
+            size_limit=size_limit,
+            group=group,
+        )
+
+        return await self._send(self._create_database_call(org_name, data, retry))
+
+    async def create_databases(
+        self,
+        org_name: str,
+        specs: Sequence[Union[DatabaseSpec, str]],
+        *,
+        rollback: bool = False,
+        retry: OptBool = None,
+        ordered: bool = True,
+        max_concurrency: Optional[int] = None,
+    ) -> List[BatchResult[DatabaseCreated]]:
+        """
+        Create many databases concurrently and wait for all of them. Every spec is validated before the first
+        request is sent, so an invalid spec raises a ValueError without creating any database. Failures are
+        reported per database.
+
+        With 'rollback' the databases that were created are deleted again if any creation failed, and a
+        BulkOperationException holding the results is raised.
+
+        :param org_name: The name of the organization or user.
+        :param specs: DatabaseSpecs of the new databases. A plain name creates a database with the default settings.
+        :param rollback: Delete the created databases again if any creation failed.
+        :param retry: Retry the creations on transient failures, see 'create_database'.
+        :param ordered: Return results in the order of 'specs'. Otherwise, results are listed as they completed.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: List of BatchResults holding a DatabaseCreated each.
+        """
+        bodies = self._build_create_database_bodies(specs)
+        results = [
+            result
+            async for result in self._run_many(
+                lambda name: self._send(self._create_database_call(org_name, bodies[name], retry)),
+                list(bodies),
+                ordered,
+                max_concurrency,
+            )
+        ]
+        failed = [result.key for result in results if not result.ok]
+        if rollback and failed:
+            created = [result.key for result in results if result.ok]
+            deletions = await self.delete_databases(org_name, created, max_concurrency=max_concurrency)
+            raise self._rollback_exception(failed, deletions, results)
+        return results
+
+    async def delete_databases(
+        self,
+        org_name: str,
+        db_names: Sequence[str],
+        *,
+        ordered: bool = True,
+        max_concurrency: Optional[int] = None,
+    ) -> List[BatchResult[str]]:
+        """
+        Delete many databases concurrently and wait for all of them. Failures are reported per database.
+
+        :param org_name: The name of the organization or user.
+        :param db_names: The names of the databases.
+        :param ordered: Return results in the order of 'db_names'. Otherwise, results are listed as they completed.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: List of BatchResults holding the name of the deleted database each.
+        """
+        return [
+            result
+            async for result in self._run_many(
+                lambda db_name: self.delete_database(org_name, db_name), db_names, ordered, max_concurrency
+            )
+        ]
+
+    async def delete_database(self, org_name: str, db_name: str) -> str:
+        """
+        Delete a database belonging to the organization or user.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: Name of deleted database.
+        """
+        return await self._send(self._delete_database_call(org_name, db_name))
+
+    async def retrieve(self, org_name: str, db_name: str) -> DatabaseRead:
+        """
+        Retrieve database information belonging to the organization or user.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: DatabaseRead
+        """
+        return await self._send(self._retrieve_call(org_name, db_name))
+
+    async def update(
+        self, org_name: str, db_name: str, allow_attach: OptBool = None, size_limit: OptStr = None
+    ) -> ConfigUpdateResponse:
+        """
+        Update a database configuration belonging to the organization or user. A return value of None just declares
+        that no value has been updated for that parameter.
+
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :param allow_attach: Allow or disallow attaching databases to the current database.
+        :param size_limit: The maximum size of the database in bytes. Values with units are also accepted, e.g. 1mb, 256mb, 1gb.
+        :return: ConfigUpdateResponse
+        """
+        return await self._send(self._update_call(org_name, db_name, allow_attach, size_limit))
+
+    async def get_usage(self, org_name: str, db_name: str, from_ts: OptStr = None, to_ts: OptStr = None) -> UsageRead:
+        """
+        Get the usage statistics for a database in the given timeframe.
+
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :param from_ts: The datetime to retrieve usage from in ISO 8601 format. Defaults to the current calendar
+         month if not provided. Example: 2023-01-01T00:00:00Z
+        :param to_ts: The datetime to retrieve usage to in ISO 8601 format. Defaults to the current calendar
+         month if not provided. Example: 2023-02-01T00:00:00Z
+        :return: UsageRead
+        """
+        return await self._send(self._get_usage_call(org_name, db_name, from_ts, to_ts))
+
+    async def get_stats(self, org_name: str, db_name: str) -> List[StatQuery]:
+        """
+        Fetch the top queries of a database, including the count of rows read and written.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: List of top queries
+        """
+        return await self._send(self._get_stats_call(org_name, db_name))
+
+    def get_usage_many(
+        self,
+        org_name: str,
+        db_names: Sequence[str],
+        from_ts: OptStr = None,
+        to_ts: OptStr = None,
+        *,
+        ordered: bool = True,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[BatchResult[UsageRead]]:
+        """
+        Get the usage statistics for many databases concurrently. Failures are reported per database.
+
+        :param org_name: The name of the organization or user.
+        :param db_names: The names of the databases.
+        :param from_ts: The datetime to retrieve usage from in ISO 8601 format.
+        :param to_ts: The datetime to retrieve usage to in ISO 8601 format.
+        :param ordered: Yield results in the order of 'db_names'. Otherwise, results are yielded as they complete.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: Async iterator of BatchResults holding a UsageRead each.
+        """
+        return self._run_many(
+            lambda db_name: self.get_usage(org_name, db_name, from_ts=from_ts, to_ts=to_ts),
+            db_names,
+            ordered,
+            max_concurrency,
+        )
+
+    def get_stats_many(
+        self,
+        org_name: str,
+        db_names: Sequence[str],
+        *,
+        ordered: bool = True,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[BatchResult[List[StatQuery]]]:
+        """
+        Fetch the top queries of many databases concurrently. Failures are reported per database.
+
+        :param org_name: The name of the organization or user.
+        :param db_names: The names of the databases.
+        :param ordered: Yield results in the order of 'db_names'. Otherwise, results are yielded as they complete.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: Async iterator of BatchResults holding a list of top queries each.
+        """
+        return self._run_many(lambda db_name: self.get_stats(org_name, db_name), db_names, ordered, max_concurrency)
+
+    def retrieve_many(
+        self,
+        org_name: str,
+        db_names: Sequence[str],
+        *,
+        ordered: bool = True,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[BatchResult[DatabaseRead]]:
+        """
+        Retrieve many databases concurrently. Failures are reported per database.
+
+        :param org_name: The name of the organization or user.
+        :param db_names: The names of the databases.
+        :param ordered: Yield results in the order of 'db_names'. Otherwise, results are yielded as they complete.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: Async iterator of BatchResults holding a DatabaseRead each.
+        """
+        return self._run_many(lambda db_name: self.retrieve(org_name, db_name), db_names, ordered, max_concurrency)
+
+    def _run_many(
+        self,
+        func: Callable[[str], Awaitable[T]],
+        db_names: Sequence[str],
+        ordered: bool,
+        max_concurrency: Optional[int],
+    ) -> AsyncIterator[BatchResult[T]]:
+        """
+        Run a single-database call for many databases with the concurrency settings of the client.
+        """
+        return run_batch_async(
+            func,
+            db_names,
+            max_concurrency=max_concurrency or self.client.max_concurrency,
+            ordered=ordered,
+        )
@@ -0,0 +1,332 @@
+import asyncio
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, List, Optional, Type
+
+from .cache import ResponseCache
+from .dataclasses import PlatformTokenCreated, PlatformTokenRead
+from .endpoints import API_PATH
+from .exceptions import (
+    InvalidPlatformTokenException,
+    TokenAlreadyExistsException,
+    TokenNotFoundException,
+    TursoRequestException,
+)
+from .metrics import UNKNOWN_ENDPOINT, RequestEvent
+from .singleflight import AsyncSingleFlight
+from .transport import DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT, AsyncTransport, HTTPXAsyncTransport
+from .tursopy import BaseTursoClient
+
+if TYPE_CHECKING:
+    import httpx
+
+    from .async_db import AsyncDatabasesClient
+
+
+class AsyncTursoClient(BaseTursoClient):
+    """
+    Asynchronous TursoClient. All Platform API calls are awaitables sharing one async connection pool.
+
+    With the default 'eager' token validation the platform token is validated when entering the client as an
+    async context manager, by awaiting 'validate' explicitly or, for a client used without 'async with', right
+    before its first call. The 'lazy' and 'cached' modes behave like they do for the TursoClient.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """
+        Initialize an asynchronous Turso client.
+
+        :param: token: Turso access token.
+        :param base_url: Platform API base url. Defaults to 'https://api.turso.tech'.
+        :param transport: AsyncTransport used for all Platform API calls. Defaults to a pooled HTTPXAsyncTransport.
+        :param pool_size: Maximum number of concurrent connections of the default transport.
+        :param timeout: Default (connect, read) timeout in seconds of the default transport.
+        :param keep_alive: Reuse connections between calls of the default transport.
+        :param http2: Speak HTTP/2 with the default transport, multiplexing concurrent calls over one connection.
+         Requires the optional 'h2' dependency.
+        :param token_validation: When to validate the platform token: 'eager' (default), 'lazy' or 'cached'.
+        :param token_validation_cache: TokenValidationCache used by the 'cached' validation mode.
+        :param single_flight: Share the response of identical GET calls that are in flight at the same time.
+        :param max_concurrency: Default number of calls bulk operations like 'get_usage_many' keep in flight.
+        :param requests_per_second: Optional cap on the calls per second issued by this client.
+        :param reads_per_second: Optional cap on the read (GET) calls per second issued by this client.
+        :param mutations_per_second: Optional cap on the mutating calls per second issued by this client.
+        :param rate_limiter: ClientRateLimiter used instead of the rate settings, e.g. to share it between clients.
+        :param cache: Enable the in-memory read cache. Either True for the default settings or a ResponseCache.
+        :param metrics: Record per-endpoint metrics. Either True for a new Metrics instance or a Metrics instance.
+        """
+        super().__init__(**kwargs)
+        transport: Optional[AsyncTransport] = kwargs.get("transport", None)
+        self.transport = (
+            transport
+            if transport is not None
+            else HTTPXAsyncTransport(
+                pool_size=kwargs.get("pool_size", DEFAULT_POOL_SIZE),
+                timeout=kwargs.get("timeout", DEFAULT_TIMEOUT),
+                keep_alive=kwargs.get("keep_alive", True),
+                http2=kwargs.get("http2", False),
+            )
+        )
+        self.single_flight = AsyncSingleFlight() if kwargs.get("single_flight", False) else None
+        self._db: Optional["AsyncDatabasesClient"] = None
+        # Created with the first call, so the lock belongs to the running event loop on Python < 3.10.
+        self._async_validation_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def db(self) -> "AsyncDatabasesClient":
+        """
+        Client of the database endpoints. It is imported and created on first access.
+        :return: AsyncDatabasesClient
+        """
+        if self._db is None:
+            from .async_db import AsyncDatabasesClient  # noqa: PLC0415
+
+            self._db = AsyncDatabasesClient(base_client=self)
+        return self._db
+
+    async def request(
+        self,
+        method: str,
+        request_url: str,
+        endpoint: Optional[str] = None,
+        retry: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        """
+        Send a request to the Platform API through the client transport. The authorization header is added
+        automatically. Reads of cacheable endpoints are served from the read cache if it is enabled and
+        identical reads in flight at the same time are sent once if single-flight is enabled.
+        A platform token that has not been validated yet is validated before the first call.
+        :param method: HTTP method, e.g. 'GET'.
+        :param request_url: Fully qualified request url.
+        :param endpoint: API_PATH key of the request.
+        :param retry: Allow or forbid retries of this call. Defaults to retrying idempotent methods only.
+        :param kwargs: Additional keyword arguments passed on to the transport (params, json, ...).
+        :return: Response
+        """
+        if not self._token_validated and endpoint != "validate_platform_token":
+            if self._async_validation_lock is None:
+                self._async_validation_lock = asyncio.Lock()
+            async with self._async_validation_lock:
+                if not self._token_validated:
+                    await self.validate()
+
+        if self.cache is None:
+            return await self._dispatch(method, request_url, endpoint=endpoint, retry=retry, **kwargs)
+
+        if method != "GET":
+            response = await self._dispatch(method, request_url, endpoint=endpoint, retry=retry, **kwargs)
+            if self.cache.invalidates(endpoint):
+                self.cache.invalidate(request_url)
+            return response
+
+        if endpoint is None or not self.cache.is_cacheable(endpoint) or kwargs.get("stream"):
+            return await self._dispatch(method, request_url, endpoint=endpoint, retry=retry, **kwargs)
+
+        cache_key = self.cache.key(request_url, kwargs.get("params"))
+        cached: Optional[httpx.Response] = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        response = await self._dispatch(method, request_url, endpoint=endpoint, retry=retry, **kwargs)
+        self.cache.set(endpoint, cache_key, response)
+        return response
+
+    async def _dispatch(
+        self,
+        method: str,
+        request_url: str,
+        endpoint: Optional[str] = None,
+        retry: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        """
+        Send a request, sharing the response of an identical read that is already in flight if single-flight
+        deduplication is enabled.
+        :param method: HTTP method, e.g. 'GET'.
+        :param request_url: Fully qualified request url.
+        :param endpoint: API_PATH key of the request.
+        :param retry: Allow or forbid retries of this call.
+        :param kwargs: Additional keyword arguments passed on to the transport.
+        :return: Response
+        """
+        if self.single_flight is None or method != "GET" or kwargs.get("stream"):
+            return await self._send(method, request_url, endpoint=endpoint, retry=retry, **kwargs)
+        key = ResponseCache.key(request_url, kwargs.get("params"))
+        return await self.single_flight.do(
+            key, lambda: self._send(method, request_url, endpoint=endpoint, retry=retry, **kwargs)
+        )
+
+    async def _send(
+        self,
+        method: str,
+        request_url: str,
+        endpoint: Optional[str] = None,
+        retry: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        """
+        Send a request through the transport. Failed calls are retried according to the retry policy.
+        :param method: HTTP method, e.g. 'GET'.
+        :param request_url: Fully qualified request url.
+        :param endpoint: API_PATH key of the request.
+        :param retry: Allow or forbid retries of this call. Defaults to the method rule of the retry policy.
+        :param kwargs: Additional keyword arguments passed on to the transport.
+        :return: Response
+        """
+        headers = {**self.base_header, **kwargs.pop("headers", {})}
+        if "json" in kwargs:
+            kwargs["content"] = self.codec.dumps(kwargs.pop("json"))
+        policy = self.retry_policy
+        if policy is None or not policy.allows_method(method, retry):
+            response = await self._attempt(method, request_url, endpoint, headers=headers, **kwargs)
+        else:
+            policy.budget.deposit()
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    response = await self._attempt(method, request_url, endpoint, headers=headers, **kwargs)
+                except self.transport.retryable_errors:
+                    delay = policy.delay(attempt)
+                    if delay is None:
+                        raise
+                else:
+                    if response.status_code not in policy.retry_statuses:
+                        break
+                    delay = policy.delay(attempt, response.headers.get("Retry-After"))
+                    if delay is None:
+                        break
+                    await response.aclose()
+                await asyncio.sleep(delay)
+
+        if response.status_code == 401:
+            self._token_rejected()
+        return response
+
+    async def _attempt(self, method: str, request_url: str, endpoint: Optional[str], **kwargs: Any) -> "httpx.Response":
+        """
+        Send a single attempt of a call through the rate limiter and the transport and record its metrics.
+        :param method: HTTP method, e.g. 'GET'.
+        :param request_url: Fully qualified request url.
+        :param endpoint: API_PATH key of the request.
+        :param kwargs: Additional keyword arguments passed on to the transport.
+        :return: Response
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(method)
+        if self.metrics is None:
+            return await self.transport.request(method, request_url, **kwargs)
+
+        endpoint = endpoint or UNKNOWN_ENDPOINT
+        start = time.perf_counter()
+        try:
+            response = await self.transport.request(method, request_url, **kwargs)
+        except Exception as exc:
+            self.metrics.observe_request(RequestEvent(endpoint, method, None, time.perf_counter() - start, 0, exc))
+            raise
+        seconds = time.perf_counter() - start
+        if kwargs.get("stream"):
+            response_bytes = int(response.headers.get("Content-Length", 0))
+        else:
+            response_bytes = len(response.content)
+        self.metrics.observe_request(RequestEvent(endpoint, method, response.status_code, seconds, response_bytes))
+        return response
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying transport and release pooled connections.
+        :return: None
+        """
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> "AsyncTursoClient":
+        """
+        Validate the platform token if the eager validation mode is used and enter the client context.
+        :return: AsyncTursoClient
+        """
+        if self.token_validation == "eager" and not self._token_validated:
+            await self.validate()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """
+        Close the client when leaving the context.
+        :return: None
+        """
+        await self.aclose()
+
+    async def validate(self) -> bool:
+        """
+        Validate the current platform api token.
+        :return:
+        """
+        endpoint = API_PATH["validate_platform_token"]
+        request_url = self.base_url + endpoint
+        response = await self.request("GET", request_url, endpoint="validate_platform_token")
+
+        if response.status_code == 401:
+            error_message = self.decode(response)["error"]
+            raise InvalidPlatformTokenException(error_message)
+        elif response.status_code != 200:
+            raise TursoRequestException(f"Something went wrong: {response.content!r}")
+
+        self._token_validation_succeeded()
+        return True
+
+    async def create_platform_api_token(self, name: str) -> PlatformTokenCreated:
+        """
+        Request a Bearer token for platform access.
+        :return: Platform API token.
+        """
+        endpoint = API_PATH["create_platform_token"].format(name=name)
+        request_url = self.base_url + endpoint
+
+        response = await self.request("POST", request_url, endpoint="create_platform_token")
+
+        if response.status_code == 409:
+            raise TokenAlreadyExistsException(f"Token with name <{name}> already exists.")
+        elif response.status_code != 200:
+            raise TursoRequestException(f"Something went wrong: {response.content!r}")
+
+        content = self.decode(response)
+        with self.measure_load("create_platform_token"):
+            return PlatformTokenCreated.load(content)
+
+    async def list_platform_tokens(self) -> List[PlatformTokenRead]:
+        """
+        Returns a list of API tokens belonging to a user.
+        :return:
+        """
+        endpoint = API_PATH["list_platform_tokens"]
+        request_url = self.base_url + endpoint
+        response = await self.request("GET", request_url, endpoint="list_platform_tokens")
+
+        if response.status_code != 200:
+            raise TursoRequestException(f"Something went wrong: {response.content!r}")
+
+        content = self.decode(response)
+        with self.measure_load("list_platform_tokens"):
+            return [PlatformTokenRead.load(token) for token in content["tokens"]]
+
+    async def revoke_token(self, name: str) -> str:
+        """
+        Revokes the provided API token belonging to a user.
+        :param name: Name of the api token.
+        :return:
+        """
+        endpoint = API_PATH["revoke_platform_token"].format(name=name)
+        request_url = self.base_url + endpoint
+        response = await self.request("DELETE", request_url, endpoint="revoke_platform_token")
+
+        if response.status_code == 404:
+            raise TokenNotFoundException(f"Token with name <{name}> not found.")
+        if response.status_code != 200:
+            raise TursoRequestException(f"Something went wrong: {response.content!r}")
+
+        content: str = self.decode(response)["token"]
+        return content
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+TOKEN_VALIDATION_MODES = ("eager", "lazy", "cached")
+DEFAULT_TOKEN_VALIDATION_TTL = 12 * 60 * 60
+
+
+def default_token_validation_path() -> Path:
+    """
+    Return the default location of the token validation cache file.
+    :return: Path inside the user cache directory.
+    """
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "tursopy" / "validated_tokens.json"
+
+
+class TokenValidationCache:
+    """
+    Local file remembering successfully validated platform tokens for a limited time.
+    Tokens are stored as SHA-256 hashes only.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None, ttl: float = DEFAULT_TOKEN_VALIDATION_TTL) -> None:
+        """
+        Initialize the token validation cache.
+        :param path: Location of the cache file. Defaults to '$XDG_CACHE_HOME/tursopy/validated_tokens.json'.
+        :param ttl: Seconds a successful validation is trusted.
+        """
+        self.path = Path(path) if path is not None else default_token_validation_path()
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _hash(token: str) -> str:
+        """
+        Hash a platform token.
+        :param token: Platform token.
+        :return: Hex digest
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _read(self) -> Dict[str, float]:
+        """
+        Read the cache file. A missing or corrupt file is treated as empty.
+        :return: Mapping of token hash to expiry timestamp.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                content = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return content if isinstance(content, dict) else {}
+
+    def _write(self, entries: Dict[str, float]) -> None:
+        """
+        Atomically replace the cache file. Failing to write is not an error, the validation is just not remembered.
+        :param entries: Mapping of token hash to expiry timestamp.
+        :return: None
+        """
+        import tempfile  # noqa: PLC0415
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".validated_tokens")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def is_valid(self, token: str) -> bool:
+        """
+        Whether the token has been validated successfully within the ttl.
+        :param token: Platform token.
+        :return: bool
+        """
+        expires: Optional[float] = self._read().get(self._hash(token))
+        return expires is not None and expires > time.time()
+
+    def remember(self, token: str) -> None:
+        """
+        Remember a successful validation of the token.
+        :param token: Platform token.
+        :return: None
+        """
+        now = time.time()
+        with self._lock:
+            entries = {k: v for k, v in self._read().items() if v > now}
+            entries[self._hash(token)] = now + self.ttl
+            self._write(entries)
+
+    def forget(self, token: str) -> None:
+        """
+        Drop a remembered validation, e.g. after the API rejected the token.
+        :param token: Platform token.
+        :return: None
+        """
+        with self._lock:
+            entries = self._read()
+            if entries.pop(self._hash(token), None) is not None:
+                self._write(entries)
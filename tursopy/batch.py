@@ -0,0 +1,121 @@
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """
+    Outcome of a single item of a bulk operation. Either 'value' or 'error' is set.
+    """
+
+    index: int
+    key: str
+    value: Optional[T] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the call for this item succeeded.
+        :return: bool
+        """
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """
+        Return the value or raise the error of this item.
+        :return: Value of the call.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value  # type:ignore [return-value]
+
+
+def run_batch(
+    func: Callable[[str], T],
+    keys: Sequence[str],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ordered: bool = True,
+) -> Iterator[BatchResult[T]]:
+    """
+    Call 'func' for every key on a thread pool with bounded concurrency.
+    A failing call is reported on its BatchResult and does not abort the remaining calls.
+
+    :param func: Callable executed for every key.
+    :param keys: Keys to process, e.g. database names.
+    :param max_concurrency: Maximum number of calls in flight.
+    :param ordered: Yield results in input order. Otherwise, results are yielded as soon as they complete.
+    :return: Iterator of BatchResults.
+    """
+
+    def call(index: int, key: str) -> BatchResult[T]:
+        try:
+            return BatchResult(index=index, key=key, value=func(key))
+        except Exception as e:
+            return BatchResult(index=index, key=key, error=e)
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed  # noqa: PLC0415
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency))
+    futures: List["Future[BatchResult[T]]"] = [executor.submit(call, i, key) for i, key in enumerate(keys)]
+    try:
+        for future in futures if ordered else as_completed(futures):
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def run_batch_async(
+    func: Callable[[str], Awaitable[T]],
+    keys: Sequence[str],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ordered: bool = True,
+) -> AsyncIterator[BatchResult[T]]:
+    """
+    Await 'func' for every key with bounded concurrency on the running event loop.
+    A failing call is reported on its BatchResult and does not abort the remaining calls.
+
+    :param func: Coroutine function executed for every key.
+    :param keys: Keys to process, e.g. database names.
+    :param max_concurrency: Maximum number of calls in flight.
+    :param ordered: Yield results in input order. Otherwise, results are yielded as soon as they complete.
+    :return: Async iterator of BatchResults.
+    """
+    import asyncio  # noqa: PLC0415
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def call(index: int, key: str) -> BatchResult[T]:
+        async with semaphore:
+            try:
+                return BatchResult(index=index, key=key, value=await func(key))
+            except Exception as e:
+                return BatchResult(index=index, key=key, error=e)
+
+    tasks = [asyncio.ensure_future(call(i, key)) for i, key in enumerate(keys)]
+    try:
+        for task in tasks if ordered else asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,155 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_CACHE_TTL: Dict[str, float] = {
+    "list_databases": 5.0,
+    "retrieve_database": 5.0,
+    "list_instances": 30.0,
+    "retrieve_instance": 30.0,
+    "list_platform_tokens": 30.0,
+}
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+# Non-GET endpoints that do not change any resource a read returns.
+NON_MUTATING_ENDPOINTS = frozenset({"generate_db_token"})
+
+CacheKey = Tuple[str, Hashable]
+
+
+def _path_segments(request_url: str) -> Tuple[str, ...]:
+    """
+    Split the path of a request url into its segments.
+    :param request_url: Fully qualified request url.
+    :return: Path segments.
+    """
+    return tuple(segment for segment in urlsplit(request_url).path.split("/") if segment)
+
+
+def _database_scope(segments: Tuple[str, ...]) -> Optional[Tuple[str, ...]]:
+    """
+    Return the database a mutation belongs to. Mutations of a database affect every resource below it.
+    :param segments: Path segments of the mutation.
+    :return: Path segments of the database or None if the mutation does not target a database.
+    """
+    if segments[:2] == ("v1", "organizations") and len(segments) >= 5 and segments[3] == "databases":
+        return segments[:5]
+    return None
+
+
+class ResponseCache:
+    """
+    In-memory TTL cache for successful read responses with an LRU bound on the number of entries.
+
+    Mutations sent through the owning client invalidate every cached read of the mutated resource,
+    its parent collections and, for databases, everything below the database.
+    """
+
+    def __init__(self, ttl: Optional[Mapping[str, float]] = None, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES) -> None:
+        """
+        Initialize the cache.
+        :param ttl: Seconds a response stays valid per API_PATH key. Endpoints without a ttl are not cached.
+        :param max_entries: Maximum number of cached responses. The least recently used entry is evicted first.
+        """
+        self.ttl = dict(DEFAULT_CACHE_TTL if ttl is None else ttl)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Tuple[str, ...], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_cacheable(self, endpoint: str) -> bool:
+        """
+        Whether responses of the endpoint are cached.
+        :param endpoint: API_PATH key of the request.
+        :return: bool
+        """
+        return self.ttl.get(endpoint, 0) > 0
+
+    @staticmethod
+    def invalidates(endpoint: Optional[str]) -> bool:
+        """
+        Whether a non-GET call of the endpoint invalidates cached reads. Calls without an endpoint do.
+        :param endpoint: API_PATH key of the request.
+        :return: bool
+        """
+        return endpoint not in NON_MUTATING_ENDPOINTS
+
+    @staticmethod
+    def key(request_url: str, params: Optional[Mapping[str, Any]] = None) -> CacheKey:
+        """
+        Build the cache key of a read request.
+        :param request_url: Fully qualified request url.
+        :param params: Query parameters of the request.
+        :return: Cache key
+        """
+        return request_url, tuple(sorted((params or {}).items()))
+
+    def get(self, key: CacheKey) -> Any:
+        """
+        Return the cached response for the key or None if there is no valid entry.
+        :param key: Cache key
+        :return: Cached response or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, endpoint: str, key: CacheKey, response: Any) -> None:
+        """
+        Store a response. Only successful responses of cacheable endpoints are kept.
+        :param endpoint: API_PATH key of the request.
+        :param key: Cache key
+        :param response: Response to cache.
+        :return: None
+        """
+        if not self.is_cacheable(endpoint) or response.status_code != 200:
+            return
+        expires = time.monotonic() + self.ttl[endpoint]
+        with self._lock:
+            self._entries[key] = (expires, _path_segments(key[0]), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, request_url: str) -> int:
+        """
+        Drop all cached reads affected by a mutation of the given url.
+        :param request_url: Fully qualified url of the mutation.
+        :return: Number of dropped entries.
+        """
+        mutated = _path_segments(request_url)
+        scope = _database_scope(mutated)
+        with self._lock:
+            stale = [
+                key
+                for key, (_, path, _) in self._entries.items()
+                if mutated[: len(path)] == path or (scope is not None and path[: len(scope)] == scope)
+            ]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """
+        Drop all cached responses.
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the hit and miss counters and the current number of entries.
+        :return: Cache statistics.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
@@ -0,0 +1,160 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Type, Union
+
+CODEC_NAMES = ("orjson", "msgspec", "json")
+
+
+def _default(value: Any) -> Any:
+    """
+    Serialize objects the stdlib encoder does not know. Models are encoded through their 'to_dict'.
+    :param value: Object to serialize.
+    :return: JSON serializable representation.
+    """
+    to_dict = getattr(value, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return to_dict()
+
+
+class JSONCodec(ABC):
+    """
+    Base class of the JSON codecs used to decode responses and encode request bodies.
+    """
+
+    name: str
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document.
+        :param data: UTF-8 encoded or text JSON document.
+        :return: Decoded value
+        """
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encode a value as compact UTF-8 JSON. Models of tursopy.dataclasses are supported as well.
+        :param value: Value to encode.
+        :return: JSON document
+        """
+
+
+class StdlibCodec(JSONCodec):
+    """
+    Codec backed by the json module of the standard library.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document.
+        :param data: UTF-8 encoded or text JSON document.
+        :return: Decoded value
+        """
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encode a value as compact UTF-8 JSON.
+        :param value: Value to encode.
+        :return: JSON document
+        """
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_default).encode()
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Codec backed by the optional orjson package.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """
+        Initialize the codec. Raises ImportError if orjson is not installed.
+        """
+        import orjson  # noqa: PLC0415
+
+        self._loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+        self._dumps: Callable[..., bytes] = orjson.dumps
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document.
+        :param data: UTF-8 encoded or text JSON document.
+        :return: Decoded value
+        """
+        return self._loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encode a value as compact UTF-8 JSON. Dataclasses are serialized natively by orjson.
+        :param value: Value to encode.
+        :return: JSON document
+        """
+        return self._dumps(value, default=_default)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    Codec backed by the optional msgspec package.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """
+        Initialize the codec. Raises ImportError if msgspec is not installed.
+        """
+        import msgspec  # noqa: PLC0415
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document.
+        :param data: UTF-8 encoded or text JSON document.
+        :return: Decoded value
+        """
+        return self._decoder.decode(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encode a value as compact UTF-8 JSON. Dataclasses are serialized natively by msgspec.
+        :param value: Value to encode.
+        :return: JSON document
+        """
+        encoded: bytes = self._encoder.encode(value)
+        return encoded
+
+
+_CODECS: Dict[str, Type[JSONCodec]] = {"orjson": OrjsonCodec, "msgspec": MsgspecCodec, "json": StdlibCodec}
+_INSTANCES: Dict[str, JSONCodec] = {}
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Return a JSON codec. Without a name the fastest installed codec is used: orjson, then msgspec, then the
+    json module of the standard library.
+    :param name: 'orjson', 'msgspec' or 'json'.
+    :return: JSONCodec
+    """
+    if name is not None and name not in _CODECS:
+        raise ValueError(f"JSON codec needs to be one of {CODEC_NAMES}.")
+
+    for candidate in [name] if name is not None else CODEC_NAMES:
+        codec = _INSTANCES.get(candidate)
+        if codec is not None:
+            return codec
+        try:
+            codec = _INSTANCES[candidate] = _CODECS[candidate]()
+        except ImportError as e:
+            if name is not None:
+                raise ImportError(f"The '{name}' JSON codec requires the optional '{name}' dependency.") from e
+            continue
+        return codec
+    raise AssertionError("The stdlib codec is always available.")  # pragma: no cover
@@ -1,8 +1,15 @@
-from dataclasses import asdict, dataclass, fields
-from typing import Any, Dict, List, Optional, Type, TypeVar
+import sys
+from dataclasses import MISSING, dataclass, fields, is_dataclass
+from typing import Any, Callable, Dict, List, Literal, Optional, Type, TypeVar, Union, get_type_hints
 
 T = TypeVar("T")
 
+# Slotted models are smaller and faster to build. Slots are available for dataclasses from Python 3.10 on.
+MODEL_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_LOADERS: Dict[type, Callable[[Dict[str, Any]], Any]] = {}
+_DUMPERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
 
 @dataclass
 class BaseDataClass:
@@ -10,29 +17,153 @@ class BaseDataClass:
     Base dataclass implementing useful utility functionality.
     """
 
+    __slots__ = ()
+
     def to_dict(self) -> dict[str, Any]:
         """
-        Return dictionary representation.
+        Return dictionary representation. Nested models are converted as well, other values are not copied, so
+        lists of plain values are shared with the model.
         :return:
         """
-        return asdict(self)
+        dumper = _DUMPERS.get(type(self))
+        if dumper is None:
+            dumper = _DUMPERS[type(self)] = _build_dumper(type(self))
+        return dumper(self)
 
     @classmethod
     def load(cls: Type[T], data: Dict[str, Any]) -> T:
         """
         Load data from a dictionary into the type-hinted dataclass. Fields not in the dataclass will be ignored.
+        Nested dataclasses and lists of them are loaded as well.
         :param data: Dictionary containing data for the dataclass.
         :return: Dataclass instance.
         """
-        field_names = {f.name for f in fields(cls)}  # type:ignore [arg-type]
-        reduced_data = {k: v for k, v in data.items() if k in field_names}
-        return cls(**reduced_data)
+        loader = _LOADERS.get(cls)
+        if loader is None:
+            loader = _LOADERS[cls] = _build_loader(cls)
+        result: T = loader(data)
+        return result
+
+
+def _value_converter(hint: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Return the converter for a field value or None if the raw value can be used as is.
+    :param hint: Type hint of the field.
+    :return: Converter
+    """
+    origin = getattr(hint, "__origin__", None)
+    args = getattr(hint, "__args__", ())
+    if isinstance(hint, type) and issubclass(hint, BaseDataClass):
+        return hint.load
+    if origin in (list, List) and args:
+        item_converter = _value_converter(args[0])
+        if item_converter is None:
+            return None
+        return lambda values: [item_converter(v) for v in values]
+    if origin is Union and type(None) in args:
+        inner = [arg for arg in args if arg is not type(None)]
+        converter = _value_converter(inner[0]) if len(inner) == 1 else None
+        if converter is None:
+            return None
+        return lambda value: None if value is None else converter(value)
+    return None
+
+
+def _build_loader(cls: type) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Generate the loader function of a dataclass. The field lookup and nested type resolution happen once
+    per class, the generated function only reads the dictionary and calls the constructor with positional
+    arguments in field order.
+    :param cls: Dataclass to generate the loader for.
+    :return: Loader function
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} is not a dataclass.")
+
+    hints = get_type_hints(cls)
+    namespace: Dict[str, Any] = {"cls": cls}
+    arguments = []
+    for field in fields(cls):
+        if not field.init:
+            continue
+        if field.default is not MISSING:
+            namespace[f"default_{field.name}"] = field.default
+            value = f"data.get({field.name!r}, default_{field.name})"
+        elif field.default_factory is not MISSING:
+            namespace[f"factory_{field.name}"] = field.default_factory
+            value = f"(data[{field.name!r}] if {field.name!r} in data else factory_{field.name}())"
+        else:
+            value = f"data[{field.name!r}]"
+
+        converter = _value_converter(hints[field.name])
+        if converter is not None:
+            namespace[f"convert_{field.name}"] = converter
+            value = f"convert_{field.name}({value})"
+        arguments.append(f"{field.name}={value}" if getattr(field, "kw_only", False) else value)
+
+    source = (
+        "def load(data):\n"
+        "    try:\n"
+        f"        return cls({', '.join(arguments)})\n"
+        "    except KeyError as e:\n"
+        f"        raise TypeError(f'{cls.__name__} is missing the required field {{e}}.') from None\n"
+    )
+    exec(source, namespace)
+    loader: Callable[[Dict[str, Any]], Any] = namespace["load"]
+    return loader
+
+
+def _dump_converter(hint: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Return the converter turning a field value into plain data or None if the value can be used as is.
+    :param hint: Type hint of the field.
+    :return: Converter
+    """
+    origin = getattr(hint, "__origin__", None)
+    args = getattr(hint, "__args__", ())
+    if isinstance(hint, type) and issubclass(hint, BaseDataClass):
+        return lambda value: value.to_dict()
+    if origin in (list, List) and args:
+        item_converter = _dump_converter(args[0])
+        if item_converter is None:
+            return None
+        return lambda values: [item_converter(v) for v in values]
+    if origin is Union and type(None) in args:
+        inner = [arg for arg in args if arg is not type(None)]
+        converter = _dump_converter(inner[0]) if len(inner) == 1 else None
+        if converter is None:
+            return None
+        return lambda value: None if value is None else converter(value)
+    return None
+
+
+def _build_dumper(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Generate the to_dict function of a dataclass. Like the loader it resolves the fields once per class and
+    builds the dictionary with a single literal instead of the recursive deep copy of dataclasses.asdict.
+    :param cls: Dataclass to generate the function for.
+    :return: Dumper function
+    """
+    hints = get_type_hints(cls)
+    namespace: Dict[str, Any] = {}
+    items = []
+    for field in fields(cls):
+        value = f"obj.{field.name}"
+        converter = _dump_converter(hints[field.name])
+        if converter is not None:
+            namespace[f"convert_{field.name}"] = converter
+            value = f"convert_{field.name}({value})"
+        items.append(f"{field.name!r}: {value}")
+
+    exec(f"def dump(obj):\n    return {{{', '.join(items)}}}\n", namespace)
+    dumper: Callable[[Any], Dict[str, Any]] = namespace["dump"]
+    return dumper
 
 
 #############################################################
 #                   PLATFORM API TOKENS                     #
 #############################################################
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class PlatformTokenRead(BaseDataClass):
     """
     Platform token read response model.
@@ -42,7 +173,7 @@ class PlatformTokenRead(BaseDataClass):
     name: str
 
 
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class PlatformTokenCreated(BaseDataClass):
     """
     Platform token created response model.
@@ -56,7 +187,7 @@ class PlatformTokenCreated(BaseDataClass):
 #############################################################
 #                        DATABASES                          #
 #############################################################
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class DatabaseRead(BaseDataClass):
     """
     Database read response model.
@@ -79,7 +210,25 @@ class DatabaseRead(BaseDataClass):
     hostname: str
 
 
-@dataclass
+@dataclass(**MODEL_OPTIONS)
+class DatabaseSpec:
+    """
+    Database creation request model used by 'create_databases'. The fields match the parameters of
+    'create_database'.
+    """
+
+    name: str
+    is_schema: Optional[bool] = None
+    schema: Optional[str] = None
+    seed_name: Optional[str] = None
+    seed_ts: Optional[str] = None
+    seed_type: Optional[Literal["database", "dump"]] = None
+    seed_url: Optional[str] = None
+    size_limit: Optional[str] = None
+    group: str = "default"
+
+
+@dataclass(**MODEL_OPTIONS)
 class DatabaseCreated(BaseDataClass):
     """
     Database created response model.
@@ -92,7 +241,7 @@ class DatabaseCreated(BaseDataClass):
     IssuedCertLimit: int
 
 
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class ConfigUpdateResponse(BaseDataClass):
     """
     Response model for database config updates.
@@ -102,7 +251,7 @@ class ConfigUpdateResponse(BaseDataClass):
     size_limit: Optional[str] = None
 
 
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class Usage(BaseDataClass):
     """
     Raw usage data.
@@ -110,10 +259,10 @@ class Usage(BaseDataClass):
 
     rows_read: int
     rows_written: int
-    storage_byte: int
+    storage_bytes: int
 
 
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class SingleDBUsage(BaseDataClass):
     """
     Usage statistics for a single database.
@@ -123,7 +272,7 @@ class SingleDBUsage(BaseDataClass):
     usage: Usage
 
 
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class UsageRead(BaseDataClass):
     """
     Response model for database usage statistics.
@@ -134,7 +283,7 @@ class UsageRead(BaseDataClass):
     uuid: str
 
 
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class StatQuery(BaseDataClass):
     """
     Response model for a query in the database statistics.
@@ -145,7 +294,7 @@ class StatQuery(BaseDataClass):
     rows_written: int
 
 
-@dataclass
+@dataclass(**MODEL_OPTIONS)
 class DbInstance(BaseDataClass):
     """
     Response model for a database instance.
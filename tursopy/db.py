@@ -1,149 +1,381 @@
-import json
-from typing import TYPE_CHECKING, List, Literal, Optional
-
-import requests
-
-from .dataclasses import ConfigUpdateResponse, DatabaseCreated, DatabaseRead, DbInstance, StatQuery, UsageRead
+from dataclasses import asdict
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .analysis import HotQueryReport, analyze_hot_queries
+from .batch import BatchResult, run_batch
+from .dataclasses import (
+    ConfigUpdateResponse,
+    DatabaseCreated,
+    DatabaseRead,
+    DatabaseSpec,
+    DbInstance,
+    StatQuery,
+    UsageRead,
+)
 from .endpoints import API_PATH
-from .exceptions import TursoRequestException
+from .exceptions import BulkOperationException, TursoRequestException
+from .routing import InstanceRouter
+from .sql import SQLClient
+from .streaming import iter_json_array
+from .table import DatabaseTable
+from .usage import Bucket, UsageAggregator, UsageTable, UsageWindowCache
+from .watch import DEFAULT_BACKOFF, DEFAULT_MAX_INTERVAL, DEFAULT_MIN_INTERVAL, DatabaseWatcher
 
 if TYPE_CHECKING:
     import tursopy
+    from tursopy.tursopy import BaseTursoClient
 
 OptStr = Optional[str]
 OptBool = Optional[bool]
+T = TypeVar("T")
+
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
-class DatabasesClient:
+class _ApiCall(Generic[T]):
     """
-    Databases client managing the databases endpoints.
+    Request of a databases endpoint together with the parser of its response.
     """
 
-    def __init__(self, base_client: "tursopy.TursoClient") -> None:
+    __slots__ = ("endpoint", "kwargs", "method", "parse", "url")
+
+    def __init__(self, method: str, url: str, endpoint: str, parse: Callable[[Any], T], **kwargs: Any) -> None:
         """
-        Initialize the database client for api request management.
-        :param base_client: Base TursoClient.
+        Initialize the call.
+        :param method: HTTP method, e.g. 'GET'.
+        :param url: Fully qualified request url.
+        :param endpoint: API_PATH key of the request.
+        :param parse: Checks the response and returns the result of the call.
+        :param kwargs: Additional keyword arguments passed on to the client request (params, json, retry, ...).
         """
-        self.client = base_client
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.parse = parse
+        self.kwargs = kwargs
+
+
+class BaseDatabasesClient:
+    """
+    Request building and response parsing shared by the synchronous and the asynchronous databases client.
 
-    def generate_token(self, org_name: str, db_name: str) -> str:
+    Every endpoint is described by an _ApiCall built here, the subclasses only send it through their client.
+    """
+
+    client: "BaseTursoClient"
+
+    def _url(self, endpoint: str, **path: str) -> str:
+        """
+        Build the request url of an endpoint.
+        :param endpoint: API_PATH key
+        :param path: Values of the placeholders in the path, e.g. org_name.
+        :return: Fully qualified request url.
+        """
+        return self.client.base_url + API_PATH[endpoint].format(**path)
+
+    def _call(
+        self, method: str, endpoint: str, path: Dict[str, str], parse: Callable[[Any], T], **kwargs: Any
+    ) -> _ApiCall[T]:
+        """
+        Build the call of an endpoint.
+        :param method: HTTP method, e.g. 'GET'.
+        :param endpoint: API_PATH key
+        :param path: Values of the placeholders in the path, e.g. org_name.
+        :param parse: Checks the response and returns the result of the call.
+        :param kwargs: Additional keyword arguments passed on to the client request.
+        :return: _ApiCall
+        """
+        return _ApiCall(method, self._url(endpoint, **path), endpoint, parse, **kwargs)
+
+    def _raise_for_status(self, response: Any, *, raw: bool = False) -> None:
+        """
+        Raise a TursoRequestException for a failed call.
+        :param response: Response of the call.
+        :param raw: Report the raw response body instead of the decoded error message.
+        :return: None
         """
-        Generates an authorization token for the specified database.
-        TODO: Add attach body
+        if response.status_code == 200:
+            return
+        if raw:
+            raise TursoRequestException(f"Something went wrong: {response.content!r}")
+        error_message = self.client.decode(response)["error"]
+        raise TursoRequestException(f"Something went wrong: {error_message}")
+
+    def _loader(
+        self, endpoint: str, load: Callable[[Any], T], key: OptStr = None, *, raw: bool = False
+    ) -> Callable[[Any], T]:
+        """
+        Build the parser of an endpoint returning dataclasses.
+        :param endpoint: API_PATH key, used to record the load time.
+        :param load: Builds the result from the decoded content.
+        :param key: Key of the content passed to 'load'. Defaults to the whole content.
+        :param raw: Report the raw response body of a failed call instead of the decoded error message.
+        :return: Parser
+        """
+
+        def parse(response: Any) -> T:
+            self._raise_for_status(response, raw=raw)
+            content = self.client.decode(response)
+            with self.client.measure_load(endpoint):
+                return load(content if key is None else content[key])
+
+        return parse
+
+    def _generate_token_call(
+        self, org_name: str, db_name: str, expiration: OptStr, authorization: OptStr
+    ) -> _ApiCall[str]:
+        """
+        Build the call requesting a new authorization token for the specified database.
         :param org_name: The name of the organization or user.
         :param db_name: The name of the database.
-        :return: JWT token
+        :param expiration: Expiration time of the token.
+        :param authorization: Access level of the token.
+        :return: _ApiCall returning the JWT token.
         """
-        endpoint = API_PATH["generate_db_token"].format(org_name=org_name, name=db_name)
-        request_url = self.client.base_url + endpoint
-        response = requests.post(request_url, headers=self.client.base_header)
 
-        if response.status_code != 200:
-            raise TursoRequestException(f"Something went wrong: {response.content!r}")
+        def parse(response: Any) -> str:
+            self._raise_for_status(response, raw=True)
+            res: str = self.client.decode(response)["jwt"]
+            return res
+
+        params = {"expiration": expiration, "authorization": authorization}
+        return self._call(
+            "POST",
+            "generate_db_token",
+            {"org_name": org_name, "name": db_name},
+            parse,
+            params={k: v for k, v in params.items() if v is not None},
+        )
 
-        content = response.json()
-        res: str = content["jwt"]
-        return res
+    def _invalidate_tokens_call(self, org_name: str, db_name: str) -> _ApiCall[None]:
+        """
+        Build the call invalidating all authorization tokens for the specified database.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: _ApiCall
+        """
+        return self._call(
+            "POST",
+            "invalidate_tokens",
+            {"org_name": org_name, "name": db_name},
+            lambda response: self._raise_for_status(response, raw=True),
+        )
 
-    def invalidate_tokens(self, org_name: str, db_name: str) -> None:
+    def _forget_tokens(self, org_name: str, db_name: str) -> None:
         """
-        Invalidates all authorization tokens for the specified database.
+        Drop the cached tokens of a database if the client has a token cache.
         :param org_name: The name of the organization or user.
         :param db_name: The name of the database.
         :return: None
         """
-        endpoint = API_PATH["invalidate_tokens"].format(org_name=org_name, name=db_name)
-        request_url = self.client.base_url + endpoint
-        response = requests.post(request_url, headers=self.client.base_header)
+        if self.client.token_cache is not None:
+            self.client.token_cache.invalidate(org_name, db_name)
 
-        if response.status_code != 200:
-            raise TursoRequestException(f"Something went wrong: {response.content!r}")
+    def _list_databases_call(self, org_name: str) -> _ApiCall[List[DatabaseRead]]:
+        """
+        Build the call listing the databases belonging to the organization or user.
+        :param org_name: Organization or username.
+        :return: _ApiCall returning the list of databases.
+        """
+        load = self._loader(
+            "list_databases", lambda items: [DatabaseRead.load(x) for x in items], "databases", raw=True
+        )
+        return self._call("GET", "list_databases", {"org_name": org_name}, load)
 
-    def list_databases(self, org_name: str) -> List[DatabaseRead]:
+    def _list_databases_table_call(self, org_name: str) -> _ApiCall[DatabaseTable]:
         """
-        Return a list of databases belonging to the organization or user.
+        Build the call listing the databases belonging to the organization or user as a DatabaseTable.
         :param org_name: Organization or username.
-        :return: List of databases.
+        :return: _ApiCall returning the DatabaseTable.
         """
-        endpoint = API_PATH["list_databases"].format(org_name=org_name)
-        request_url = self.client.base_url + endpoint
-        response = requests.get(request_url, headers=self.client.base_header)
+        load = self._loader("list_databases", DatabaseTable.from_records, "databases", raw=True)
+        return self._call("GET", "list_databases", {"org_name": org_name}, load)
 
-        if response.status_code != 200:
-            raise TursoRequestException(f"Something went wrong: {response.content!r}")
+    def _list_instances_call(self, org_name: str, db_name: str) -> _ApiCall[List[DbInstance]]:
+        """
+        Build the call listing the instances of a database.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: _ApiCall returning the list of database instances.
+        """
+        load = self._loader("list_instances", lambda items: [DbInstance.load(x) for x in items], "instances")
+        return self._call("GET", "list_instances", {"org_name": org_name, "name": db_name}, load)
+
+    def _get_instance_call(self, org_name: str, db_name: str, instance_name: str) -> _ApiCall[DbInstance]:
+        """
+        Build the call retrieving an individual database instance by name.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :param instance_name: The name of the instance (location code).
+        :return: _ApiCall returning the database instance.
+        """
+        load = self._loader("retrieve_instance", DbInstance.load, "instance")
+        path = {"org_name": org_name, "name": db_name, "instance_name": instance_name}
+        return self._call("GET", "retrieve_instance", path, load)
 
-        content = response.json()
-        return [DatabaseRead.load(x) for x in content["databases"]]
+    def _create_database_call(self, org_name: str, data: Dict[str, Any], retry: OptBool) -> _ApiCall[DatabaseCreated]:
+        """
+        Build the call sending a validated database creation request.
+        :param org_name: The name of the organization or user.
+        :param data: Request body built by '_build_create_database_body'.
+        :param retry: Retry this call on transient failures.
+        :return: _ApiCall returning the created database.
+        """
+        load = self._loader("create_database", DatabaseCreated.load, "database")
+        return self._call("POST", "create_database", {"org_name": org_name}, load, retry=retry, json=data)
 
-    def list_instances(self, org_name: str, db_name: str) -> List[DbInstance]:
+    def _delete_database_call(self, org_name: str, db_name: str) -> _ApiCall[str]:
         """
-        Returns a list of instances of a database. Instances are the individual primary or replica databases in each region defined by the group.
+        Build the call deleting a database. The cached tokens of the database are dropped once it is deleted.
         :param org_name: The name of the organization or user.
         :param db_name: The name of the database.
-        :return: List of database instances.
+        :return: _ApiCall returning the name of the deleted database.
         """
-        endpoint = API_PATH["list_instances"].format(org_name=org_name, name=db_name)
-        request_url = self.client.base_url + endpoint
 
-        response = requests.get(request_url, headers=self.client.base_header)
+        def parse(response: Any) -> str:
+            self._raise_for_status(response)
+            self._forget_tokens(org_name, db_name)
+            deleted_db: str = self.client.decode(response)["database"]
+            return deleted_db
 
-        if response.status_code != 200:
-            error_message = response.json()["error"]
-            raise TursoRequestException(f"Something went wrong: {error_message}")
+        return self._call("DELETE", "delete_database", {"org_name": org_name, "name": db_name}, parse)
 
-        content = response.json()
-        return [DbInstance.load(x) for x in content["instances"]]
+    def _retrieve_call(self, org_name: str, db_name: str) -> _ApiCall[DatabaseRead]:
+        """
+        Build the call retrieving a database.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: _ApiCall returning the database.
+        """
+        load = self._loader("retrieve_database", DatabaseRead.load, "database")
+        return self._call("GET", "retrieve_database", {"org_name": org_name, "name": db_name}, load)
 
-    def get_instance(self, org_name: str, db_name: str, instance_name: str) -> DbInstance:
+    def _update_call(
+        self, org_name: str, db_name: str, allow_attach: OptBool, size_limit: OptStr
+    ) -> _ApiCall[ConfigUpdateResponse]:
         """
-        Return the individual database instance by name.
+        Build the call updating a database configuration.
+        Raises a ValueError if neither 'allow_attach' nor 'size_limit' is given.
         :param org_name: The name of the organization or user.
         :param db_name: The name of the database.
-        :param instance_name: The name of the instance (location code).
-        :return: Database Instance
+        :param allow_attach: Allow or disallow attaching databases to the current database.
+        :param size_limit: The maximum size of the database.
+        :return: _ApiCall returning the updated configuration.
         """
-        endpoint = API_PATH["retrieve_instance"].format(org_name=org_name, name=db_name, instance_name=instance_name)
-        request_url = self.client.base_url + endpoint
+        if allow_attach is None and size_limit is None:
+            raise ValueError("Either a value for 'allow_attach' or 'size_limit' needs to be given.")
 
-        response = requests.get(request_url, headers=self.client.base_header)
+        data = {}
+        if allow_attach is not None:
+            data["allow_attach"] = allow_attach
 
-        if response.status_code != 200:
-            error_message = response.json()["error"]
-            raise TursoRequestException(f"Something went wrong: {error_message}")
+        if size_limit is not None:
+            data["size_limit"] = size_limit  # type:ignore[assignment]
 
-        content = response.json()
-        print(content)
-        return DbInstance.load(content["instance"])
+        load = self._loader("update_database", ConfigUpdateResponse.load)
+        return self._call("PATCH", "update_database", {"org_name": org_name, "name": db_name}, load, json=data)
 
-    def create_database(
-        self,
-        org_name: str,
-        name: str,
-        is_schema: OptBool = None,
-        schema: OptStr = None,
-        seed_name: OptStr = None,
-        seed_ts: OptStr = None,
-        seed_type: Optional[Literal["database", "dump"]] = None,
-        seed_url: OptStr = None,
-        size_limit: OptStr = None,
-        group: str = "default",
-    ) -> DatabaseCreated:
+    def _get_usage_call(self, org_name: str, db_name: str, from_ts: OptStr, to_ts: OptStr) -> _ApiCall[UsageRead]:
         """
-        Creates a new database in a group for the organization or user.
+        Build the call fetching the usage statistics of a database.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :param from_ts: The datetime to retrieve usage from in ISO 8601 format.
+        :param to_ts: The datetime to retrieve usage to in ISO 8601 format.
+        :return: _ApiCall returning the usage.
+        """
+        params = {}
+        if from_ts:
+            params["from"] = from_ts
+        if to_ts:
+            params["to"] = to_ts
 
+        load = self._loader("get_usage", UsageRead.load, "database")
+        return self._call("GET", "get_usage", {"org_name": org_name, "name": db_name}, load, params=params)
+
+    def _get_stats_call(self, org_name: str, db_name: str) -> _ApiCall[List[StatQuery]]:
+        """
+        Build the call fetching the top queries of a database.
         :param org_name: The name of the organization or user.
-        :param name: The name of the new database. Must contain only lowercase letters, numbers, dashes. No longer than 32 characters.
-        :param is_schema: Mark this database as the parent schema database that updates child databases with any schema changes.
-        :param schema: The name of the parent database to use as the schema. See Multi-DB Schemas.
-        :param seed_name: The name of the existing database when database is used as a seed type.
-        :param seed_ts: A formatted ISO 8601 recovery point to create a database from. This must be within the last 24 hours, or 30 days on the scaler plan.
-        :param seed_type: The type of seed to be used to create a new database. Either 'database' or 'dump'.
-        :param seed_url: The URL returned by upload dump can be used with the dump seed type.
-        :param size_limit: The maximum size of the database in bytes. Values with units are also accepted, e.g. '1mb', '256mb', '1gb'.
-        :param group: The name of the group where the database should be created. The group must already exist. Defaults to 'default'.
-        :return: DatabaseCreated
+        :param db_name: The name of the database.
+        :return: _ApiCall returning the list of top queries.
+        """
+        load = self._loader("get_stats", lambda items: [StatQuery.load(x) for x in items], "top_queries")
+        return self._call("GET", "get_stats", {"org_name": org_name, "name": db_name}, load)
+
+    @classmethod
+    def _build_create_database_bodies(cls, specs: Sequence[Union[DatabaseSpec, str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Validate many database specs and build their request bodies.
+        Raises a ValueError for the first invalid spec or duplicated database name.
+        :param specs: DatabaseSpecs or plain database names.
+        :return: Request bodies by database name in the order of the specs.
+        """
+        bodies: Dict[str, Dict[str, Any]] = {}
+        for item in specs:
+            spec = DatabaseSpec(name=item) if isinstance(item, str) else item
+            if spec.name in bodies:
+                raise ValueError(f"Database <{spec.name}> is specified more than once.")
+            try:
+                bodies[spec.name] = cls._build_create_database_body(**asdict(spec))
+            except ValueError as e:
+                raise ValueError(f"Invalid spec for database <{spec.name}>: {e}") from e
+        return bodies
+
+    @staticmethod
+    def _rollback_exception(
+        failed: List[str], deletions: Sequence[BatchResult[str]], results: Sequence[BatchResult[Any]]
+    ) -> BulkOperationException:
+        """
+        Build the exception raised after a rolled back bulk creation.
+        :param failed: Databases whose creation failed.
+        :param deletions: BatchResults of deleting the created databases again.
+        :param results: BatchResults of the creations.
+        :return: BulkOperationException
+        """
+        deleted = [deletion.key for deletion in deletions if deletion.ok]
+        remaining = [deletion.key for deletion in deletions if not deletion.ok]
+        message = f"Something went wrong: creating {failed} failed, rolled back {deleted}."
+        if remaining:
+            message += f" Rolling back {remaining} failed, these databases still exist."
+        return BulkOperationException(
+            message, failed=failed, rolled_back=deleted, rollback_failed=remaining, results=results
+        )
+
+    @classmethod
+    def _build_create_database_body(
+        cls,
+        *,
+        name: str,
+        is_schema: OptBool,
+        schema: OptStr,
+        seed_name: OptStr,
+        seed_ts: OptStr,
+        seed_type: Optional[Literal["database", "dump"]],
+        seed_url: OptStr,
+        size_limit: OptStr,
+        group: str,
+    ) -> Dict[str, Any]:
         """
-        self._validate_create_database_body_parameters(
+        Validate the parameters of a database creation and build the request body.
+        Raises a ValueException upon detection of invalid parameter combinations.
+        """
+        cls._validate_create_database_body_parameters(
             is_schema=is_schema,
             schema=schema,
             seed_type=seed_type,
@@ -152,16 +384,13 @@ class DatabasesClient:
             seed_ts=seed_ts,
         )
 
-        endpoint = API_PATH["create_database"].format(org_name=org_name)
-        request_url = self.client.base_url + endpoint
-
-        data = {
+        data: Dict[str, Any] = {
             "name": name,
             "group": group,
         }
 
         if is_schema is not None:
-            data["is_schema"] = is_schema  # type:ignore[assignment]
+            data["is_schema"] = is_schema
         if schema:
             data["schema"] = schema
         if size_limit:
@@ -178,16 +407,9 @@ class DatabasesClient:
             if seed_url:
                 seed_data["url"] = seed_url  # type:ignore[assignment]
 
-            data["seed"] = seed_data  # type:ignore[assignment]
+            data["seed"] = seed_data
 
-        response = requests.post(request_url, data=json.dumps(data), headers=self.client.base_header)
-
-        if response.status_code != 200:
-            error_message = response.json()["error"]
-            raise TursoRequestException(f"Something went wrong: {error_message}")
-
-        content = response.json()["database"]
-        return DatabaseCreated.load(content)
+        return data
 
     @staticmethod
     def _validate_create_database_body_parameters(
@@ -214,48 +436,334 @@ class DatabasesClient:
 
             if seed_type == "dump" and not seed_url:
                 raise ValueError(
-                    "Seed URL missing. The URL returned by upload dump can be used " "with the dump seed type."
+                    "Seed URL missing. The URL returned by upload dump can be used with the dump seed type."
                 )
 
             # TODO: What about seed_url + seed_ts?
 
-    def delete_database(self, org_name: str, db_name: str) -> str:
+
+class DatabasesClient(BaseDatabasesClient):
+    """
+    Databases client managing the databases endpoints.
+    """
+
+    client: "tursopy.TursoClient"
+
+    def __init__(self, base_client: "tursopy.TursoClient") -> None:
         """
-        Delete a database belonging to the organization or user.
+        Initialize the database client for api request management.
+        :param base_client: Base TursoClient.
+        """
+        self.client = base_client
+        self.usage_cache = UsageWindowCache()
+        self._routers: Dict[Tuple[str, str], InstanceRouter] = {}
+
+    def _send(self, call: _ApiCall[T]) -> T:
+        """
+        Send a call through the client and parse its response.
+        :param call: _ApiCall
+        :return: Result of the call.
+        """
+        response = self.client.request(call.method, call.url, endpoint=call.endpoint, **call.kwargs)
+        return call.parse(response)
+
+    def generate_token(
+        self, org_name: str, db_name: str, expiration: OptStr = None, authorization: OptStr = None
+    ) -> str:
+        """
+        Generates an authorization token for the specified database. If the client has a token cache, cached
+        tokens are returned until shortly before they expire and refreshed in the background.
         :param org_name: The name of the organization or user.
         :param db_name: The name of the database.
-        :return: Name of deleted database.
+        :param expiration: Expiration time of the token, e.g. '2w1d30m'. Defaults to a token that never expires.
+        :param authorization: Access level of the token, either 'full-access' (default) or 'read-only'.
+        :return: JWT token
+        """
+        call = self._generate_token_call(org_name, db_name, expiration, authorization)
+        cache = self.client.token_cache
+        if cache is None:
+            return self._send(call)
+        key = cache.key(org_name, db_name, expiration=expiration, authorization=authorization)
+        return cache.get(key, lambda: self._send(call))
+
+    def connect(
+        self,
+        org_name: str,
+        db_name: str,
+        *,
+        url: OptStr = None,
+        authorization: OptStr = None,
+        expiration: OptStr = None,
+    ) -> SQLClient:
+        """
+        Return a SQL client of the database. Statements are sent to the HTTP pipeline endpoint of the database
+        with a token from 'generate_token', and 'batch' runs many statements in a single round trip.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :param url: Base url of the database. Defaults to 'https://' and the Hostname of the database.
+        :param authorization: Access level of the token, either 'full-access' (default) or 'read-only'.
+        :param expiration: Expiration time of the token, e.g. '2w1d30m'. Defaults to a token that never expires.
+        :return: SQLClient
+        """
+        return SQLClient(self, org_name, db_name, url=url, authorization=authorization, expiration=expiration)
+
+    def route(self, org_name: str, db_name: str, **options: Any) -> InstanceRouter:
+        """
+        Return the instance router of the database. Reads are routed to the instance with the lowest latency and
+        writes to the primary. The router is created with the first call and shared by later calls, so all SQL
+        clients of a database use the same cached instances and latency measurements.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :param options: Options of a new InstanceRouter, e.g. probe_interval. Ignored once the router exists.
+        :return: InstanceRouter
+        """
+        router = self._routers.get((org_name, db_name))
+        if router is None:
+            router = self._routers.setdefault((org_name, db_name), InstanceRouter(self, org_name, db_name, **options))
+        return router
+
+    def invalidate_tokens(self, org_name: str, db_name: str) -> None:
+        """
+        Invalidates all authorization tokens for the specified database.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: None
         """
-        endpoint = API_PATH["delete_database"].format(org_name=org_name, name=db_name)
-        request_url = self.client.base_url + endpoint
+        try:
+            self._send(self._invalidate_tokens_call(org_name, db_name))
+        finally:
+            self._forget_tokens(org_name, db_name)
 
-        response = requests.delete(request_url, headers=self.client.base_header)
+    def list_databases(self, org_name: str) -> List[DatabaseRead]:
+        """
+        Return a list of databases belonging to the organization or user.
+        :param org_name: Organization or username.
+        :return: List of databases.
+        """
+        return self._send(self._list_databases_call(org_name))
 
-        if response.status_code != 200:
-            error_message = response.json()["error"]
-            raise TursoRequestException(f"Something went wrong: {error_message}")
+    def iter_databases(self, org_name: str) -> Iterator[DatabaseRead]:
+        """
+        Stream the databases belonging to the organization or user. The response body is parsed incrementally,
+        so the first database is returned before the download finishes and memory stays flat for large orgs.
+        :param org_name: Organization or username.
+        :return: Iterator of databases.
+        """
+        request_url = self._url("list_databases", org_name=org_name)
+        response = self.client.request("GET", request_url, endpoint="list_databases", stream=True)
 
-        deleted_db: str = response.json()["database"]
-        return deleted_db
+        with response:
+            self._raise_for_status(response, raw=True)
 
-    def retrieve(self, org_name: str, db_name: str) -> DatabaseRead:
+            for item in iter_json_array(response.iter_content(STREAM_CHUNK_SIZE), "databases"):
+                with self.client.measure_load("list_databases"):
+                    database = DatabaseRead.load(item)
+                yield database
+
+    def list_databases_table(self, org_name: str) -> DatabaseTable:
         """
-        Retrieve database information belonging to the organization or user.
+        Return the databases belonging to the organization or user as a column-oriented table. Repeated values are
+        stored once and lookups by name, id, group, region or schema use indexes instead of scanning a list.
+        :param org_name: Organization or username.
+        :return: DatabaseTable
+        """
+        return self._send(self._list_databases_table_call(org_name))
+
+    def watch_databases(
+        self,
+        org_name: str,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = DEFAULT_BACKOFF,
+        initial: bool = False,
+    ) -> DatabaseWatcher:
+        """
+        Watch the databases of the organization or user for changes. The returned watcher polls 'list_databases'
+        when iterated and yields typed events for created, deleted and modified databases. The time between polls
+        drops to 'min_interval' after a change and grows by 'backoff' up to 'max_interval' while nothing changes.
+
+        :param org_name: Organization or username.
+        :param fields: DatabaseRead fields to watch for modifications, e.g. ('sleeping', 'regions'). Defaults to
+                       all fields.
+        :param min_interval: Seconds between polls after a change.
+        :param max_interval: Upper bound of the seconds between polls.
+        :param backoff: Factor the interval grows by after a poll without changes.
+        :param initial: Report the databases found by the first poll as created.
+        :return: DatabaseWatcher
+        """
+        return DatabaseWatcher(
+            self,
+            org_name,
+            fields=fields,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            initial=initial,
+        )
+
+    def list_instances(self, org_name: str, db_name: str) -> List[DbInstance]:
+        """
+        Returns a list of instances of a database. Instances are the individual primary or replica databases in each region defined by the group.
         :param org_name: The name of the organization or user.
         :param db_name: The name of the database.
-        :return: DatabaseRead
+        :return: List of database instances.
+        """
+        return self._send(self._list_instances_call(org_name, db_name))
+
+    def iter_instances(self, org_name: str, db_name: str) -> Iterator[DbInstance]:
+        """
+        Stream the instances of a database. The response body is parsed incrementally.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: Iterator of database instances.
+        """
+        request_url = self._url("list_instances", org_name=org_name, name=db_name)
+        response = self.client.request("GET", request_url, endpoint="list_instances", stream=True)
+
+        with response:
+            self._raise_for_status(response)
+
+            for item in iter_json_array(response.iter_content(STREAM_CHUNK_SIZE), "instances"):
+                with self.client.measure_load("list_instances"):
+                    instance = DbInstance.load(item)
+                yield instance
+
+    def get_instance(self, org_name: str, db_name: str, instance_name: str) -> DbInstance:
+        """
+        Return the individual database instance by name.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :param instance_name: The name of the instance (location code).
+        :return: Database Instance
+        """
+        return self._send(self._get_instance_call(org_name, db_name, instance_name))
+
+    def create_database(
+        self,
+        org_name: str,
+        name: str,
+        is_schema: OptBool = None,
+        schema: OptStr = None,
+        seed_name: OptStr = None,
+        seed_ts: OptStr = None,
+        seed_type: Optional[Literal["database", "dump"]] = None,
+        seed_url: OptStr = None,
+        size_limit: OptStr = None,
+        group: str = "default",
+        retry: OptBool = None,
+    ) -> DatabaseCreated:
+        """
+        Creates a new database in a group for the organization or user.
+
+        :param org_name: The name of the organization or user.
+        :param name: The name of the new database. Must contain only lowercase letters, numbers, dashes. No longer than 32 characters.
+        :param is_schema: Mark this database as the parent schema database that updates child databases with any schema changes.
+        :param schema: The name of the parent database to use as the schema. See Multi-DB Schemas.
+        :param seed_name: The name of the existing database when database is used as a seed type.
+        :param seed_ts: A formatted ISO 8601 recovery point to create a database from. This must be within the last 24 hours, or 30 days on the scaler plan.
+        :param seed_type: The type of seed to be used to create a new database. Either 'database' or 'dump'.
+        :param seed_url: The URL returned by upload dump can be used with the dump seed type.
+        :param size_limit: The maximum size of the database in bytes. Values with units are also accepted, e.g. '1mb', '256mb', '1gb'.
+        :param group: The name of the group where the database should be created. The group must already exist. Defaults to 'default'.
+        :param retry: Retry this call on transient failures. Database creation is not idempotent, so it is only retried when enabled here and a retry policy is configured on the client.
+        :return: DatabaseCreated
+        """
+        data = self._build_create_database_body(
+            name=name,
+            is_schema=is_schema,
+            schema=schema,
+            seed_name=seed_name,
+            seed_ts=seed_ts,
+            seed_type=seed_type,
+            seed_url=seed_url,
+            size_limit=size_limit,
+            group=group,
+        )
+
+        return self._send(self._create_database_call(org_name, data, retry))
+
+    def create_databases(
+        self,
+        org_name: str,
+        specs: Sequence[Union[DatabaseSpec, str]],
+        *,
+        rollback: bool = False,
+        retry: OptBool = None,
+        ordered: bool = True,
+        max_concurrency: Optional[int] = None,
+    ) -> List[BatchResult[DatabaseCreated]]:
+        """
+        Create many databases concurrently and wait for all of them. Every spec is validated before the first
+        request is sent, so an invalid spec raises a ValueError without creating any database. Failures are
+        reported per database.
+
+        With 'rollback' the databases that were created are deleted again if any creation failed, and a
+        BulkOperationException holding the results is raised.
+
+        :param org_name: The name of the organization or user.
+        :param specs: DatabaseSpecs of the new databases. A plain name creates a database with the default settings.
+        :param rollback: Delete the created databases again if any creation failed.
+        :param retry: Retry the creations on transient failures, see 'create_database'.
+        :param ordered: Return results in the order of 'specs'. Otherwise, results are listed as they completed.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: List of BatchResults holding a DatabaseCreated each.
         """
-        endpoint = API_PATH["retrieve_database"].format(org_name=org_name, name=db_name)
-        request_url = self.client.base_url + endpoint
+        bodies = self._build_create_database_bodies(specs)
+        results = list(
+            self._run_many(
+                lambda name: self._send(self._create_database_call(org_name, bodies[name], retry)),
+                list(bodies),
+                ordered,
+                max_concurrency,
+            )
+        )
+        failed = [result.key for result in results if not result.ok]
+        if rollback and failed:
+            created = [result.key for result in results if result.ok]
+            deletions = self.delete_databases(org_name, created, max_concurrency=max_concurrency)
+            raise self._rollback_exception(failed, deletions, results)
+        return results
+
+    def delete_databases(
+        self,
+        org_name: str,
+        db_names: Sequence[str],
+        *,
+        ordered: bool = True,
+        max_concurrency: Optional[int] = None,
+    ) -> List[BatchResult[str]]:
+        """
+        Delete many databases concurrently and wait for all of them. Failures are reported per database.
 
-        response = requests.get(request_url, headers=self.client.base_header)
+        :param org_name: The name of the organization or user.
+        :param db_names: The names of the databases.
+        :param ordered: Return results in the order of 'db_names'. Otherwise, results are listed as they completed.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: List of BatchResults holding the name of the deleted database each.
+        """
+        return list(
+            self._run_many(lambda db_name: self.delete_database(org_name, db_name), db_names, ordered, max_concurrency)
+        )
 
-        if response.status_code != 200:
-            error_message = response.json()["error"]
-            raise TursoRequestException(f"Something went wrong: {error_message}")
+    def delete_database(self, org_name: str, db_name: str) -> str:
+        """
+        Delete a database belonging to the organization or user.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: Name of deleted database.
+        """
+        return self._send(self._delete_database_call(org_name, db_name))
 
-        content = response.json()["database"]
-        return DatabaseRead.load(content)
+    def retrieve(self, org_name: str, db_name: str) -> DatabaseRead:
+        """
+        Retrieve database information belonging to the organization or user.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: DatabaseRead
+        """
+        return self._send(self._retrieve_call(org_name, db_name))
 
     def update(
         self, org_name: str, db_name: str, allow_attach: OptBool = None, size_limit: OptStr = None
@@ -270,27 +778,7 @@ class DatabasesClient:
         :param size_limit: The maximum size of the database in bytes. Values with units are also accepted, e.g. 1mb, 256mb, 1gb.
         :return: ConfigUpdateResponse
         """
-        endpoint = API_PATH["update_database"].format(org_name=org_name, name=db_name)
-        request_url = self.client.base_url + endpoint
-
-        if allow_attach is None and size_limit is None:
-            raise ValueError("Either a value for 'allow_attach' or 'size_limit' needs to be given.")
-
-        data = {}
-        if allow_attach is not None:
-            data["allow_attach"] = allow_attach
-
-        if size_limit is not None:
-            data["size_limit"] = size_limit  # type:ignore[assignment]
-
-        response = requests.patch(request_url, headers=self.client.base_header, json=data)
-
-        if response.status_code != 200:
-            error_message = response.json()["error"]
-            raise TursoRequestException(f"Something went wrong: {error_message}")
-
-        content = response.json()
-        return ConfigUpdateResponse.load(content)
+        return self._send(self._update_call(org_name, db_name, allow_attach, size_limit))
 
     def get_usage(self, org_name: str, db_name: str, from_ts: OptStr = None, to_ts: OptStr = None) -> UsageRead:
         """
@@ -304,23 +792,7 @@ class DatabasesClient:
          month if not provided. Example: 2023-02-01T00:00:00Z
         :return: UsageRead
         """
-        endpoint = API_PATH["get_usage"].format(org_name=org_name, name=db_name)
-        request_url = self.client.base_url + endpoint
-
-        params = {}
-        if from_ts:
-            params["from"] = from_ts
-        if to_ts:
-            params["to"] = to_ts
-
-        response = requests.get(request_url, headers=self.client.base_header, params=params)
-
-        if response.status_code != 200:
-            error_message = response.json()["error"]
-            raise TursoRequestException(f"Something went wrong: {error_message}")
-
-        content = response.json()
-        return UsageRead.load(content["database"])
+        return self._send(self._get_usage_call(org_name, db_name, from_ts, to_ts))
 
     def get_stats(self, org_name: str, db_name: str) -> List[StatQuery]:
         """
@@ -329,14 +801,155 @@ class DatabasesClient:
         :param db_name: The name of the database.
         :return: List of top queries
         """
-        endpoint = API_PATH["get_stats"].format(org_name=org_name, name=db_name)
-        request_url = self.client.base_url + endpoint
+        return self._send(self._get_stats_call(org_name, db_name))
 
-        response = requests.get(request_url, headers=self.client.base_header)
+    def iter_stats(self, org_name: str, db_name: str) -> Iterator[StatQuery]:
+        """
+        Stream the top queries of a database. The response body is parsed incrementally.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: Iterator of top queries
+        """
+        request_url = self._url("get_stats", org_name=org_name, name=db_name)
+        response = self.client.request("GET", request_url, endpoint="get_stats", stream=True)
+
+        with response:
+            self._raise_for_status(response)
+
+            for item in iter_json_array(response.iter_content(STREAM_CHUNK_SIZE), "top_queries"):
+                with self.client.measure_load("get_stats"):
+                    stat = StatQuery.load(item)
+                yield stat
+
+    def get_usage_many(
+        self,
+        org_name: str,
+        db_names: Sequence[str],
+        from_ts: OptStr = None,
+        to_ts: OptStr = None,
+        *,
+        ordered: bool = True,
+        max_concurrency: Optional[int] = None,
+    ) -> Iterator[BatchResult[UsageRead]]:
+        """
+        Get the usage statistics for many databases concurrently. Failures are reported per database.
+
+        :param org_name: The name of the organization or user.
+        :param db_names: The names of the databases.
+        :param from_ts: The datetime to retrieve usage from in ISO 8601 format.
+        :param to_ts: The datetime to retrieve usage to in ISO 8601 format.
+        :param ordered: Yield results in the order of 'db_names'. Otherwise, results are yielded as they complete.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: Iterator of BatchResults holding a UsageRead each.
+        """
+        return self._run_many(
+            lambda db_name: self.get_usage(org_name, db_name, from_ts=from_ts, to_ts=to_ts),
+            db_names,
+            ordered,
+            max_concurrency,
+        )
+
+    def get_stats_many(
+        self,
+        org_name: str,
+        db_names: Sequence[str],
+        *,
+        ordered: bool = True,
+        max_concurrency: Optional[int] = None,
+    ) -> Iterator[BatchResult[List[StatQuery]]]:
+        """
+        Fetch the top queries of many databases concurrently. Failures are reported per database.
+
+        :param org_name: The name of the organization or user.
+        :param db_names: The names of the databases.
+        :param ordered: Yield results in the order of 'db_names'. Otherwise, results are yielded as they complete.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: Iterator of BatchResults holding a list of top queries each.
+        """
+        return self._run_many(lambda db_name: self.get_stats(org_name, db_name), db_names, ordered, max_concurrency)
+
+    def retrieve_many(
+        self,
+        org_name: str,
+        db_names: Sequence[str],
+        *,
+        ordered: bool = True,
+        max_concurrency: Optional[int] = None,
+    ) -> Iterator[BatchResult[DatabaseRead]]:
+        """
+        Retrieve many databases concurrently. Failures are reported per database.
+
+        :param org_name: The name of the organization or user.
+        :param db_names: The names of the databases.
+        :param ordered: Yield results in the order of 'db_names'. Otherwise, results are yielded as they complete.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: Iterator of BatchResults holding a DatabaseRead each.
+        """
+        return self._run_many(lambda db_name: self.retrieve(org_name, db_name), db_names, ordered, max_concurrency)
+
+    def hot_queries(
+        self,
+        org_name: str,
+        *,
+        top: int = 10,
+        by: str = "rows",
+        db_names: Optional[Sequence[str]] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> HotQueryReport:
+        """
+        Find the query patterns reading or writing the most rows across many databases. The top queries of every
+        database are fetched concurrently and merged by their fingerprint, so queries that only differ in their
+        values count as one pattern.
+
+        :param org_name: The name of the organization or user.
+        :param top: Number of patterns.
+        :param by: 'rows', 'rows_read' or 'rows_written'.
+        :param db_names: Names of the databases. Defaults to all databases of the organization.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: HotQueryReport with the heaviest patterns and the databases running them.
+        """
+        return analyze_hot_queries(self, org_name, top=top, by=by, db_names=db_names, max_concurrency=max_concurrency)
 
-        if response.status_code != 200:
-            error_message = response.json()["error"]
-            raise TursoRequestException(f"Something went wrong: {error_message}")
+    def aggregate_usage(
+        self,
+        org_name: str,
+        start: datetime,
+        end: datetime,
+        bucket: Bucket = "day",
+        *,
+        db_names: Optional[Sequence[str]] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> UsageTable:
+        """
+        Aggregate the usage of many databases over the windows of a time range. The usage of every (database,
+        window) pair is fetched concurrently and windows that are fully in the past are cached in 'usage_cache'
+        for good, so repeated aggregations only fetch the open window.
 
-        content = response.json()
-        return [StatQuery.load(x) for x in content["top_queries"]]
+        :param org_name: The name of the organization or user.
+        :param start: Start of the range.
+        :param end: End of the range, exclusive.
+        :param bucket: Window size, 'hour', 'day', 'month' or a fixed timedelta.
+        :param db_names: Names of the databases. Defaults to all databases of the organization.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: UsageTable that can be grouped by database, group, region and bucket.
+        """
+        return UsageAggregator(self, self.usage_cache).aggregate(
+            org_name, start, end, bucket, db_names=db_names, max_concurrency=max_concurrency
+        )
+
+    def _run_many(
+        self,
+        func: Callable[[str], T],
+        db_names: Sequence[str],
+        ordered: bool,
+        max_concurrency: Optional[int],
+    ) -> Iterator[BatchResult[T]]:
+        """
+        Run a single-database call for many databases with the concurrency settings of the client.
+        """
+        return run_batch(
+            func,
+            db_names,
+            max_concurrency=max_concurrency or self.client.max_concurrency,
+            ordered=ordered,
+        )
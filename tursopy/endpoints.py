@@ -21,3 +21,9 @@ API_PATH = {
     "generate_db_token": "/v1/organizations/{org_name}/databases/{name}/auth/tokens",
     "invalidate_tokens": "/v1/organizations/{org_name}/databases/{name}/auth/rotate",
 }
+
+# Paths of the HTTP endpoints served by every database, relative to the database url.
+SQL_PATH = {
+    "pipeline": "/v3/pipeline",
+    "cursor": "/v3/cursor",
+}
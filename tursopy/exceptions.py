@@ -1,3 +1,6 @@
+from typing import Any, List, Optional, Sequence
+
+
 class MissingRequiredAttributeException(Exception):
     """Indicate a missing required attribute."""
 
@@ -20,3 +23,45 @@ class NotFoundExceptions(Exception):
 
 class TursoRequestException(Exception):
     """Indicates an error during a request."""
+
+
+class BulkOperationException(TursoRequestException):
+    """Indicates a bulk operation that failed for some items and was rolled back."""
+
+    def __init__(
+        self,
+        message: str,
+        failed: List[str],
+        rolled_back: List[str],
+        rollback_failed: List[str],
+        *,
+        results: Sequence[Any] = (),
+    ) -> None:
+        """
+        Initialize the exception.
+        :param message: Error message.
+        :param failed: Keys of the items that failed.
+        :param rolled_back: Keys of the succeeded items that were rolled back.
+        :param rollback_failed: Keys of the succeeded items whose rollback failed.
+        :param results: BatchResults of all items before the rollback.
+        """
+        super().__init__(message)
+        self.failed = failed
+        self.rolled_back = rolled_back
+        self.rollback_failed = rollback_failed
+        self.results = list(results)
+
+
+class SQLException(TursoRequestException):
+    """Indicates a SQL statement that failed on the database."""
+
+    def __init__(self, message: str, code: Optional[str] = None, statement: Optional[int] = None) -> None:
+        """
+        Initialize the exception.
+        :param message: Error message.
+        :param code: Error code of the database, e.g. 'SQLITE_CONSTRAINT'.
+        :param statement: Index of the failed statement within its call, None for statements added by the client.
+        """
+        super().__init__(message)
+        self.code = code
+        self.statement = statement
@@ -0,0 +1,252 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from .batch import run_batch
+from .dataclasses import DatabaseRead, DbInstance
+
+if TYPE_CHECKING:
+    from .db import DatabasesClient
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS databases (
+    org TEXT NOT NULL,
+    name TEXT NOT NULL,
+    db_group TEXT NOT NULL,
+    schema_parent TEXT NOT NULL,
+    data TEXT NOT NULL,
+    instances_synced INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (org, name)
+);
+CREATE INDEX IF NOT EXISTS databases_group ON databases (org, db_group);
+CREATE INDEX IF NOT EXISTS databases_schema ON databases (org, schema_parent);
+CREATE TABLE IF NOT EXISTS database_regions (
+    org TEXT NOT NULL,
+    name TEXT NOT NULL,
+    region TEXT NOT NULL,
+    PRIMARY KEY (org, region, name)
+);
+CREATE TABLE IF NOT EXISTS instances (
+    org TEXT NOT NULL,
+    db_name TEXT NOT NULL,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (org, db_name, name)
+);
+CREATE TABLE IF NOT EXISTS refreshes (
+    org TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class InventoryDiff:
+    """
+    Changes applied to the inventory of an organization by a refresh.
+    """
+
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    failures: List[Tuple[str, Exception]] = field(default_factory=list)
+
+
+class InventoryStore:
+    """
+    Local snapshot of the databases and instances of organizations, kept in a SQLite file.
+
+    A refresh lists the databases of an organization, diffs them against the snapshot and fetches the instances
+    only for databases that were added or changed. Lookups by name, group, region or schema parent are answered
+    from indexed local tables without any API call.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:") -> None:
+        """
+        Open or create the inventory.
+        :param path: Location of the SQLite file. Defaults to an in-memory database.
+        """
+        self.path = str(Path(path).expanduser()) if path != ":memory:" else path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """
+        Close the SQLite connection.
+        :return: None
+        """
+        self._connection.close()
+
+    def __enter__(self) -> "InventoryStore":
+        """
+        Enter a context manager.
+        :return: InventoryStore
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """
+        Close the SQLite connection when leaving the context manager.
+        :return: None
+        """
+        self.close()
+
+    def _query(self, sql: str, parameters: Tuple[Any, ...]) -> List[Tuple[Any, ...]]:
+        """
+        Run a read query.
+        :param sql: SQL statement
+        :param parameters: Statement parameters
+        :return: List of rows
+        """
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def refresh(
+        self, db_client: "DatabasesClient", org_name: str, *, max_concurrency: Optional[int] = None
+    ) -> InventoryDiff:
+        """
+        Bring the inventory of an organization up to date. Instances are fetched concurrently for databases that
+        are new, changed or whose instances could not be fetched by an earlier refresh.
+
+        :param db_client: DatabasesClient used to fetch the databases and instances.
+        :param org_name: The name of the organization or user.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: InventoryDiff
+        """
+        current = {database.Name: database for database in db_client.list_databases(org_name)}
+        snapshot = {
+            name: (data, bool(synced))
+            for name, data, synced in self._query(
+                "SELECT name, data, instances_synced FROM databases WHERE org = ?", (org_name,)
+            )
+        }
+
+        diff = InventoryDiff(removed=sorted(set(snapshot) - set(current)))
+        records = {name: json.dumps(database.to_dict(), sort_keys=True) for name, database in current.items()}
+        stale = []
+        for name, data in records.items():
+            if name not in snapshot:
+                diff.added.append(name)
+            elif snapshot[name][0] != data:
+                diff.changed.append(name)
+            elif not snapshot[name][1]:
+                stale.append(name)
+            else:
+                diff.unchanged += 1
+
+        pending = diff.added + diff.changed + stale
+        instances: Dict[str, List[DbInstance]] = {}
+        results = run_batch(
+            lambda name: db_client.list_instances(org_name, name),
+            pending,
+            max_concurrency=max_concurrency or db_client.client.max_concurrency,
+            ordered=False,
+        )
+        for result in results:
+            if result.error is not None:
+                diff.failures.append((result.key, result.error))
+            else:
+                instances[result.key] = result.unwrap()
+
+        with self._lock, self._connection as connection:
+            for name in diff.removed:
+                self._delete(connection, org_name, name)
+            for name in pending:
+                database = current[name]
+                self._delete(connection, org_name, name)
+                connection.execute(
+                    "INSERT INTO databases VALUES (?, ?, ?, ?, ?, ?)",
+                    (org_name, name, database.group, database.schema, records[name], name in instances),
+                )
+                connection.executemany(
+                    "INSERT INTO database_regions VALUES (?, ?, ?)",
+                    [(org_name, name, region) for region in set(database.regions)],
+                )
+                connection.executemany(
+                    "INSERT INTO instances VALUES (?, ?, ?, ?)",
+                    [
+                        (org_name, name, instance.name, json.dumps(instance.to_dict()))
+                        for instance in instances.get(name, [])
+                    ],
+                )
+            connection.execute("INSERT OR REPLACE INTO refreshes VALUES (?, ?)", (org_name, time.time()))
+        return diff
+
+    @staticmethod
+    def _delete(connection: sqlite3.Connection, org_name: str, db_name: str) -> None:
+        """
+        Delete a database with its regions and instances.
+        :return: None
+        """
+        connection.execute("DELETE FROM databases WHERE org = ? AND name = ?", (org_name, db_name))
+        connection.execute("DELETE FROM database_regions WHERE org = ? AND name = ?", (org_name, db_name))
+        connection.execute("DELETE FROM instances WHERE org = ? AND db_name = ?", (org_name, db_name))
+
+    def refreshed_at(self, org_name: str) -> Optional[float]:
+        """
+        Return the time of the last refresh of an organization.
+        :param org_name: The name of the organization or user.
+        :return: Unix timestamp or None if the organization was never refreshed.
+        """
+        rows = self._query("SELECT refreshed_at FROM refreshes WHERE org = ?", (org_name,))
+        return float(rows[0][0]) if rows else None
+
+    def database(self, org_name: str, db_name: str) -> Optional[DatabaseRead]:
+        """
+        Look up a database by name.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: DatabaseRead or None if the database is not in the inventory.
+        """
+        rows = self._query("SELECT data FROM databases WHERE org = ? AND name = ?", (org_name, db_name))
+        return DatabaseRead.load(json.loads(rows[0][0])) if rows else None
+
+    def databases(
+        self,
+        org_name: str,
+        *,
+        group: Optional[str] = None,
+        region: Optional[str] = None,
+        schema: Optional[str] = None,
+    ) -> List[DatabaseRead]:
+        """
+        List the databases of an organization, optionally filtered. Filters are combined.
+        :param org_name: The name of the organization or user.
+        :param group: Only databases of this group.
+        :param region: Only databases replicated to this region.
+        :param schema: Only databases using this schema database.
+        :return: List of DatabaseRead ordered by name.
+        """
+        sql = "SELECT d.data FROM databases d"
+        conditions = ["d.org = ?"]
+        parameters: List[Any] = [org_name]
+        if region is not None:
+            sql += " JOIN database_regions r ON r.org = d.org AND r.name = d.name AND r.region = ?"
+            parameters.insert(0, region)
+        if group is not None:
+            conditions.append("d.db_group = ?")
+            parameters.append(group)
+        if schema is not None:
+            conditions.append("d.schema_parent = ?")
+            parameters.append(schema)
+        sql += f" WHERE {' AND '.join(conditions)} ORDER BY d.name"
+        return [DatabaseRead.load(json.loads(data)) for (data,) in self._query(sql, tuple(parameters))]
+
+    def instances(self, org_name: str, db_name: str) -> List[DbInstance]:
+        """
+        List the instances of a database.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: List of DbInstance ordered by name.
+        """
+        rows = self._query(
+            "SELECT data FROM instances WHERE org = ? AND db_name = ? ORDER BY name", (org_name, db_name)
+        )
+        return [DbInstance.load(json.loads(data)) for (data,) in rows]
@@ -0,0 +1,294 @@
+import bisect
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNKNOWN_ENDPOINT = "unknown"
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """
+    A single HTTP call sent to the Platform API. Retries are reported as separate calls.
+    """
+
+    endpoint: str
+    method: str
+    status_code: Optional[int]
+    seconds: float
+    response_bytes: int
+    error: Optional[BaseException] = None
+
+
+@dataclass(frozen=True)
+class LoadEvent:
+    """
+    Time spent loading the response of an endpoint into dataclasses.
+    """
+
+    endpoint: str
+    seconds: float
+
+
+MetricsHook = Callable[[Union[RequestEvent, LoadEvent]], None]
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed bucket bounds, compatible with the Prometheus histogram type.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """
+        Initialize the histogram.
+        :param buckets: Sorted upper bounds of the buckets. An implicit +Inf bucket is added.
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Record a value.
+        :param value: Observed value.
+        :return: None
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[int]:
+        """
+        Return the cumulative count of every bucket including the +Inf bucket.
+        :return: List of counts
+        """
+        result, total = [], 0
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile as the upper bound of the bucket containing it.
+        :param q: Quantile between 0 and 1.
+        :return: Upper bucket bound, infinity for the +Inf bucket, or None if nothing was observed.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in zip((*self.buckets, float("inf")), self.cumulative()):
+            if total >= rank:
+                return bound
+        return float("inf")
+
+
+class EndpointMetrics:
+    """
+    Metrics of a single API_PATH endpoint.
+    """
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """
+        Initialize the endpoint metrics.
+        :param buckets: Latency histogram buckets in seconds.
+        """
+        self.calls = 0
+        self.errors = 0
+        self.status_codes: Counter[int] = Counter()
+        self.latency = Histogram(buckets)
+        self.response_bytes = 0
+        self.loads = 0
+        self.load_seconds = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the metrics as plain values.
+        :return: Dictionary of metrics
+        """
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "status_codes": dict(self.status_codes),
+            "latency_seconds": {
+                "sum": self.latency.sum,
+                "count": self.latency.count,
+                "p50": self.latency.quantile(0.5),
+                "p99": self.latency.quantile(0.99),
+                "buckets": dict(zip((*self.latency.buckets, float("inf")), self.latency.cumulative())),
+            },
+            "response_bytes": self.response_bytes,
+            "loads": self.loads,
+            "load_seconds": self.load_seconds,
+        }
+
+
+class Metrics:
+    """
+    Thread-safe per-endpoint instrumentation of a Turso client.
+
+    Every HTTP call records its endpoint, status code, latency and response size, and the time spent loading
+    responses into dataclasses is recorded separately, so network time can be told apart from parsing time.
+    Hooks are called with every RequestEvent and LoadEvent, e.g. to forward them to a metrics backend.
+    """
+
+    def __init__(
+        self, hooks: Optional[Sequence[MetricsHook]] = None, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> None:
+        """
+        Initialize the metrics.
+        :param hooks: Callbacks called with every recorded event.
+        :param buckets: Latency histogram buckets in seconds.
+        """
+        self.hooks: List[MetricsHook] = list(hooks or [])
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: MetricsHook) -> None:
+        """
+        Register a callback called with every recorded event.
+        :param hook: Callback
+        :return: None
+        """
+        self.hooks.append(hook)
+
+    def _endpoint(self, endpoint: str) -> EndpointMetrics:
+        """
+        Return the metrics of an endpoint. Needs to be called with the lock held.
+        :param endpoint: API_PATH key
+        :return: EndpointMetrics
+        """
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = EndpointMetrics(self.buckets)
+        return metrics
+
+    def _emit(self, event: Union[RequestEvent, LoadEvent]) -> None:
+        """
+        Call all hooks with the event.
+        :param event: Recorded event
+        :return: None
+        """
+        for hook in self.hooks:
+            hook(event)
+
+    def observe_request(self, event: RequestEvent) -> None:
+        """
+        Record an HTTP call.
+        :param event: RequestEvent of the call.
+        :return: None
+        """
+        with self._lock:
+            metrics = self._endpoint(event.endpoint)
+            metrics.calls += 1
+            if event.status_code is None:
+                metrics.errors += 1
+            else:
+                metrics.status_codes[event.status_code] += 1
+            metrics.latency.observe(event.seconds)
+            metrics.response_bytes += event.response_bytes
+        self._emit(event)
+
+    def observe_load(self, event: LoadEvent) -> None:
+        """
+        Record the time spent loading a response into dataclasses.
+        :param event: LoadEvent of the response.
+        :return: None
+        """
+        with self._lock:
+            metrics = self._endpoint(event.endpoint)
+            metrics.loads += 1
+            metrics.load_seconds += event.seconds
+        self._emit(event)
+
+    @contextmanager
+    def measure_load(self, endpoint: Optional[str]) -> Iterator[None]:
+        """
+        Measure the time spent in the block as load time of the endpoint.
+        :param endpoint: API_PATH key
+        :return: Context manager
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_load(LoadEvent(endpoint or UNKNOWN_ENDPOINT, time.perf_counter() - start))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the current metrics of all endpoints.
+        :return: Dictionary mapping API_PATH keys to their metrics.
+        """
+        with self._lock:
+            return {endpoint: metrics.snapshot() for endpoint, metrics in sorted(self._endpoints.items())}
+
+    def reset(self) -> None:
+        """
+        Drop all recorded metrics.
+        :return: None
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(self, prefix: str = "tursopy") -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+        :param prefix: Prefix of all metric names.
+        :return: Metrics text
+        """
+        lines: List[str] = []
+
+        def header(name: str, kind: str, description: str) -> None:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+
+            header("requests_total", "counter", "Platform API calls by endpoint and status code.")
+            for endpoint, metrics in endpoints:
+                for status_code, count in sorted(metrics.status_codes.items()):
+                    lines.append(f'{prefix}_requests_total{{endpoint="{endpoint}",status="{status_code}"}} {count}')
+                if metrics.errors:
+                    lines.append(f'{prefix}_requests_total{{endpoint="{endpoint}",status="error"}} {metrics.errors}')
+
+            header("request_duration_seconds", "histogram", "Latency of Platform API calls.")
+            for endpoint, metrics in endpoints:
+                bounds = [_format_bound(bound) for bound in metrics.latency.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, metrics.latency.cumulative()):
+                    lines.append(
+                        f'{prefix}_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound}"}} {count}'
+                    )
+                lines.append(f'{prefix}_request_duration_seconds_sum{{endpoint="{endpoint}"}} {metrics.latency.sum}')
+                lines.append(
+                    f'{prefix}_request_duration_seconds_count{{endpoint="{endpoint}"}} {metrics.latency.count}'
+                )
+
+            header("response_bytes_total", "counter", "Response body bytes received from the Platform API.")
+            for endpoint, metrics in endpoints:
+                lines.append(f'{prefix}_response_bytes_total{{endpoint="{endpoint}"}} {metrics.response_bytes}')
+
+            header("load_seconds_total", "counter", "Time spent loading responses into dataclasses.")
+            for endpoint, metrics in endpoints:
+                lines.append(f'{prefix}_load_seconds_total{{endpoint="{endpoint}"}} {metrics.load_seconds}')
+
+            header("loads_total", "counter", "Responses loaded into dataclasses.")
+            for endpoint, metrics in endpoints:
+                lines.append(f'{prefix}_loads_total{{endpoint="{endpoint}"}} {metrics.loads}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _format_bound(bound: float) -> str:
+    """
+    Format a histogram bucket bound like the Prometheus client libraries do.
+    :param bound: Upper bound of the bucket.
+    :return: Formatted bound
+    """
+    return repr(float(bound))
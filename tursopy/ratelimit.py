@@ -0,0 +1,138 @@
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting the number of calls per second.
+
+    Callers reserve a token under a lock and sleep outside of it, so the same limiter can be shared by worker
+    threads and asyncio tasks at the same time.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        """
+        Initialize the rate limiter.
+        :param rate: Sustained number of calls per second.
+        :param burst: Maximum number of calls that may be issued at once. Defaults to one second worth of calls.
+        """
+        if rate <= 0:
+            raise ValueError("The rate of a RateLimiter needs to be positive.")
+        self.rate = rate
+        self.burst = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Take one token from the bucket, going into debt if it is empty.
+        :return: Seconds the caller needs to wait before its call may be issued.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """
+        Block the current thread until a call may be issued.
+        :return: None
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """
+        Suspend the current task until a call may be issued.
+        :return: None
+        """
+        delay = self._reserve()
+        if delay > 0:
+            import asyncio  # noqa: PLC0415
+
+            await asyncio.sleep(delay)
+
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ClientRateLimiter:
+    """
+    Rate limiter shared by all calls of a client. Every call passes a global token bucket and the bucket of its
+    endpoint group, 'read' for GET, HEAD and OPTIONS calls and 'mutation' for all other methods.
+
+    A call reserves a token in every bucket it passes and waits for the longest of the reserved delays, so
+    concurrent threads and asyncio tasks are spread evenly instead of bursting into the API limits together.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        *,
+        read_rate: Optional[float] = None,
+        mutation_rate: Optional[float] = None,
+        burst: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the client rate limiter. Buckets without a rate are not limited.
+        :param rate: Calls per second of all calls together.
+        :param read_rate: Calls per second of read calls.
+        :param mutation_rate: Calls per second of mutating calls.
+        :param burst: Maximum number of calls each bucket issues at once. Defaults to one second worth of calls.
+        """
+        self.limiter = RateLimiter(rate, burst) if rate else None
+        self.groups = {
+            group: RateLimiter(group_rate, burst)
+            for group, group_rate in (("read", read_rate), ("mutation", mutation_rate))
+            if group_rate
+        }
+
+    @staticmethod
+    def group(method: str) -> str:
+        """
+        Return the endpoint group of a call.
+        :param method: HTTP method of the call.
+        :return: 'read' or 'mutation'
+        """
+        return "read" if method.upper() in READ_METHODS else "mutation"
+
+    def _reserve(self, method: str) -> float:
+        """
+        Reserve a token in the global bucket and in the bucket of the endpoint group.
+        :param method: HTTP method of the call.
+        :return: Seconds the caller needs to wait before its call may be issued.
+        """
+        delay = self.limiter._reserve() if self.limiter is not None else 0.0
+        group = self.groups.get(self.group(method))
+        if group is not None:
+            delay = max(delay, group._reserve())
+        return delay
+
+    def acquire(self, method: str) -> None:
+        """
+        Block the current thread until a call may be issued.
+        :param method: HTTP method of the call.
+        :return: None
+        """
+        delay = self._reserve(method)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, method: str) -> None:
+        """
+        Suspend the current task until a call may be issued.
+        :param method: HTTP method of the call.
+        :return: None
+        """
+        delay = self._reserve(method)
+        if delay > 0:
+            import asyncio  # noqa: PLC0415
+
+            await asyncio.sleep(delay)
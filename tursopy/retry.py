@@ -0,0 +1,133 @@
+import random
+import threading
+import time
+from typing import Collection, Optional
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryBudget:
+    """
+    Thread-safe budget limiting retries to a fraction of the regular calls of a client.
+
+    Every call deposits 'ratio' tokens up to 'max_tokens', every retry withdraws one token. When the API is
+    degraded the budget runs dry and calls fail fast instead of multiplying the load with retries.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 20.0) -> None:
+        """
+        Initialize the retry budget.
+        :param ratio: Retries allowed per regular call, e.g. 0.2 allows one retry every five calls.
+        :param max_tokens: Maximum number of retries that can be saved up. The budget starts full.
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """
+        Record a regular call.
+        :return: None
+        """
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Take the token for one retry.
+        :return: False if the budget is exhausted and the call must not be retried.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def tokens(self) -> float:
+        """
+        Number of retries currently available.
+        :return: float
+        """
+        return self._tokens
+
+
+class RetryPolicy:
+    """
+    Retry policy with exponential backoff, full jitter and Retry-After support.
+    Only idempotent methods are retried unless a call opts in explicitly.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        retry_methods: Collection[str] = IDEMPOTENT_METHODS,
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        """
+        Initialize the retry policy.
+        :param max_attempts: Maximum number of attempts per call including the first one.
+        :param backoff_base: Upper bound of the first backoff in seconds. It doubles with every attempt.
+        :param backoff_max: Maximum delay in seconds. A Retry-After asking for a longer delay is not retried.
+        :param retry_statuses: Response status codes that are retried.
+        :param retry_methods: HTTP methods that are retried by default.
+        :param budget: Retry budget shared by all calls of the client. Defaults to a new RetryBudget.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def allows_method(self, method: str, retry: Optional[bool] = None) -> bool:
+        """
+        Whether calls with the given method may be retried.
+        :param method: HTTP method of the call.
+        :param retry: Per-call override. None applies the method rule of the policy.
+        :return: bool
+        """
+        return retry if retry is not None else method.upper() in self.retry_methods
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Return the delay before the next attempt or None if the call must not be retried.
+        :param attempt: Number of the attempt that just failed, starting at 1.
+        :param retry_after: Value of the Retry-After header of the failed response.
+        :return: Delay in seconds or None.
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        delay = self._parse_retry_after(retry_after)
+        if delay is None:
+            delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+        if delay > self.backoff_max or not self.budget.withdraw():
+            return None
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parse a Retry-After header given in seconds or as an HTTP date.
+        :param value: Header value
+        :return: Delay in seconds or None if the header is missing or invalid.
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        from email.utils import parsedate_to_datetime  # noqa: PLC0415
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,303 @@
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .dataclasses import DbInstance
+from .exceptions import TursoRequestException
+from .sql import SQLClient
+
+if TYPE_CHECKING:
+    from .db import DatabasesClient
+
+DEFAULT_ALPHA = 0.3
+DEFAULT_LATENCY_TTL = 300.0
+DEFAULT_PROBE_INTERVAL = 30.0
+DEFAULT_INSTANCES_TTL = 300.0
+DEFAULT_PROBE_TIMEOUT = 2.0
+HEALTH_PATH = "/health"
+
+Probe = Callable[[DbInstance], float]
+
+
+class LatencyTable:
+    """
+    Thread-safe table of exponentially weighted moving average latencies keyed by hostname.
+
+    Every sample moves the average by 'alpha' towards the new value, so a single slow probe does not move traffic
+    away from an instance that is usually fast. Entries without a new sample for 'ttl' seconds expire, so
+    instances that stopped answering are not chosen on old measurements.
+    """
+
+    def __init__(self, alpha: float = DEFAULT_ALPHA, ttl: float = DEFAULT_LATENCY_TTL) -> None:
+        """
+        Initialize the table.
+        :param alpha: Weight of a new sample, between 0 (exclusive) and 1.
+        :param ttl: Seconds an entry is served after its last sample.
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("Alpha needs to satisfy 0 < alpha <= 1.")
+        self.alpha = alpha
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, hostname: str, seconds: float) -> float:
+        """
+        Add a latency sample.
+        :param hostname: Hostname of the instance.
+        :param seconds: Measured latency.
+        :return: Updated average in seconds.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(hostname)
+            if entry is None or now - entry[1] >= self.ttl:
+                average = seconds
+            else:
+                average = entry[0] + self.alpha * (seconds - entry[0])
+            self._entries[hostname] = (average, now)
+            return average
+
+    def discard(self, hostname: str) -> None:
+        """
+        Drop the entry of an instance, e.g. after a failed probe.
+        :param hostname: Hostname of the instance.
+        :return: None
+        """
+        with self._lock:
+            self._entries.pop(hostname, None)
+
+    def get(self, hostname: str) -> Optional[float]:
+        """
+        Return the average latency of an instance.
+        :param hostname: Hostname of the instance.
+        :return: Seconds or None if the instance has no entry or its entry expired.
+        """
+        with self._lock:
+            entry = self._entries.get(hostname)
+        if entry is None or time.monotonic() - entry[1] >= self.ttl:
+            return None
+        return entry[0]
+
+    def best(self, hostnames: Sequence[str]) -> Optional[str]:
+        """
+        Return the hostname with the lowest average latency.
+        :param hostnames: Candidate hostnames.
+        :return: Hostname or None if none of the candidates has a current entry.
+        """
+        latencies = [(latency, hostname) for hostname in hostnames if (latency := self.get(hostname)) is not None]
+        return min(latencies)[1] if latencies else None
+
+
+class InstanceRouter:
+    """
+    Picks the instance of a database to connect to.
+
+    Reads go to the instance with the lowest measured latency and writes to the primary. The instances are read
+    with 'list_instances' and cached for 'instances_ttl' seconds. Their latencies are measured by probing the
+    health endpoint of every instance and kept in a LatencyTable. Only the first lookup waits for a probe. Once
+    the last probe is 'probe_interval' seconds old, a single background probe updates the table while lookups keep
+    using the current measurements. Without any measurement, reads fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        db_client: "DatabasesClient",
+        org_name: str,
+        db_name: str,
+        *,
+        probe: Optional[Probe] = None,
+        probe_interval: float = DEFAULT_PROBE_INTERVAL,
+        probe_timeout: float = DEFAULT_PROBE_TIMEOUT,
+        instances_ttl: float = DEFAULT_INSTANCES_TTL,
+        alpha: float = DEFAULT_ALPHA,
+        latency_ttl: float = DEFAULT_LATENCY_TTL,
+        scheme: str = "https",
+    ) -> None:
+        """
+        Initialize the router. Nothing is requested before the first lookup.
+        :param db_client: DatabasesClient used to list the instances.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :param probe: Returns the latency of an instance in seconds and raises if it is unreachable. Defaults to
+                      timing a request to the health endpoint of the instance.
+        :param probe_interval: Seconds between probes of the instances.
+        :param probe_timeout: Timeout of a single probe of the default probe.
+        :param instances_ttl: Seconds the result of 'list_instances' is cached.
+        :param alpha: Weight of a new latency sample.
+        :param latency_ttl: Seconds a latency is served after its last sample.
+        :param scheme: Scheme of the instance urls.
+        """
+        self.db_client = db_client
+        self.org_name = org_name
+        self.db_name = db_name
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.instances_ttl = instances_ttl
+        self.scheme = scheme
+        self.latencies = LatencyTable(alpha=alpha, ttl=latency_ttl)
+        self._probe = probe or self._probe_health
+        self._instances: List[DbInstance] = []
+        self._instances_at = float("-inf")
+        self._probed_at = float("-inf")
+        self._probing = False
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+
+    def instances(self) -> List[DbInstance]:
+        """
+        Return the instances of the database, cached for 'instances_ttl' seconds.
+        :return: List of database instances.
+        """
+        with self._lock:
+            if time.monotonic() - self._instances_at < self.instances_ttl:
+                return self._instances
+        instances = self.db_client.list_instances(self.org_name, self.db_name)
+        with self._lock:
+            self._instances, self._instances_at = instances, time.monotonic()
+        return instances
+
+    def primary(self) -> DbInstance:
+        """
+        Return the primary instance, used for writes.
+        :return: Database instance
+        """
+        instances = self.instances()
+        for instance in instances:
+            if instance.type == "primary":
+                return instance
+        raise TursoRequestException(f"Something went wrong: database {self.db_name!r} has no primary instance")
+
+    def nearest(self) -> DbInstance:
+        """
+        Return the instance with the lowest latency, used for reads. The first call probes the instances, later
+        calls start a background probe once the measurements are 'probe_interval' seconds old.
+        :return: Database instance
+        """
+        instances = self.instances()
+        with self._lock:
+            due = time.monotonic() - self._probed_at >= self.probe_interval and not self._probing
+            first = self._probed_at == float("-inf")
+            self._probing |= due and not first
+        if first:
+            self._first_probe()
+        elif due:
+            threading.Thread(target=self._background_probe, daemon=True).start()
+
+        best = self.latencies.best([instance.hostname for instance in instances])
+        for instance in instances:
+            if instance.hostname == best:
+                return instance
+        return self.primary()
+
+    def instance(self, write: bool = False) -> DbInstance:
+        """
+        Return the instance to send a request to.
+        :param write: Route a write to the primary instead of the nearest instance.
+        :return: Database instance
+        """
+        return self.primary() if write else self.nearest()
+
+    def url(self, write: bool = False) -> str:
+        """
+        Return the base url of the instance to send a request to.
+        :param write: Route a write to the primary instead of the nearest instance.
+        :return: str
+        """
+        return f"{self.scheme}://{self.instance(write).hostname}"
+
+    def probe(self) -> Dict[str, Optional[float]]:
+        """
+        Probe all instances concurrently and add the results to the latency table. Unreachable instances are
+        dropped from the table until they answer again.
+        :return: Average latency of every instance by hostname, None for unreachable instances.
+        """
+        with self._probe_lock:
+            return self._probe_instances()
+
+    def _first_probe(self) -> None:
+        """
+        Probe the instances unless another caller finished the first probe while this one waited for it.
+        :return: None
+        """
+        with self._probe_lock:
+            with self._lock:
+                probed = self._probed_at != float("-inf")
+            if not probed:
+                self._probe_instances()
+
+    def _probe_instances(self) -> Dict[str, Optional[float]]:
+        """
+        Probe all instances concurrently. The caller holds the probe lock.
+        :return: Average latency of every instance by hostname, None for unreachable instances.
+        """
+        from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+        instances = self.instances()
+        with ThreadPoolExecutor(max_workers=max(1, len(instances))) as executor:
+            samples = list(executor.map(self._sample, instances))
+        with self._lock:
+            self._probed_at = time.monotonic()
+        return {instance.hostname: sample for instance, sample in zip(instances, samples)}
+
+    def _sample(self, instance: DbInstance) -> Optional[float]:
+        """
+        Probe a single instance and record the result.
+        :param instance: Database instance
+        :return: Updated average latency or None if the instance is unreachable.
+        """
+        try:
+            seconds = self._probe(instance)
+        except Exception:
+            self.latencies.discard(instance.hostname)
+            return None
+        return self.latencies.observe(instance.hostname, seconds)
+
+    def _background_probe(self) -> None:
+        """
+        Probe the instances in a background thread. A failed probe keeps the current measurements.
+        :return: None
+        """
+        try:
+            self.probe()
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._probing = False
+
+    def _probe_health(self, instance: DbInstance) -> float:
+        """
+        Time a request to the health endpoint of an instance.
+        :param instance: Database instance
+        :return: Seconds until the response arrived.
+        """
+        start = time.perf_counter()
+        response = self.db_client.client.transport.request(
+            "GET", f"{self.scheme}://{instance.hostname}{HEALTH_PATH}", timeout=self.probe_timeout
+        )
+        seconds = time.perf_counter() - start
+        response.close()
+        if response.status_code != 200:
+            raise TursoRequestException(f"Something went wrong: {response.content!r}")
+        return seconds
+
+    def connect(
+        self, *, write: bool = False, authorization: Optional[str] = None, expiration: Optional[str] = None
+    ) -> SQLClient:
+        """
+        Return a SQL client that resolves the instance it talks to with every call.
+        :param write: Send all statements to the primary instead of the nearest instance.
+        :param authorization: Access level of the token, either 'full-access' (default) or 'read-only'.
+        :param expiration: Expiration time of the token, e.g. '2w1d30m'.
+        :return: SQLClient
+        """
+        return SQLClient(
+            self.db_client,
+            self.org_name,
+            self.db_name,
+            authorization=authorization,
+            expiration=expiration,
+            router=self,
+            write=write,
+        )
@@ -0,0 +1,110 @@
+import threading
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+
+class _Call:
+    """
+    In-flight call whose result is shared by all callers of the same key.
+    """
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        """
+        Initialize the call.
+        """
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe deduplication of identical in-flight calls.
+
+    The first caller of a key runs the call, callers arriving while it is in flight wait for it and receive the
+    same result or exception. The key is released as soon as the call completes, so results are never reused
+    for later calls.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the single-flight group.
+        """
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Run func once for all concurrent callers of the key.
+        :param key: Identity of the call.
+        :param func: Call to run if no identical call is in flight.
+        :return: Result of the call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            shared_result: T = call.result
+            return shared_result
+
+        try:
+            result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        else:
+            call.result = result
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return result
+
+
+class AsyncSingleFlight:
+    """
+    Deduplication of identical in-flight calls of asyncio tasks.
+
+    The call of the first caller runs as a separate task, so a cancelled caller does not cancel the call for the
+    other callers waiting for it.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the single-flight group.
+        """
+        self._tasks: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await func once for all concurrent callers of the key.
+        :param key: Identity of the call.
+        :param func: Call to run if no identical call is in flight.
+        :return: Result of the call.
+        """
+        import asyncio  # noqa: PLC0415
+
+        task = self._tasks.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = self._tasks[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        result: T = await asyncio.shield(task)
+        return result
@@ -0,0 +1,536 @@
+import base64
+import threading
+from array import array
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .codec import JSONCodec
+from .endpoints import SQL_PATH
+from .exceptions import SQLException, TursoRequestException
+from .streaming import iter_lines
+
+if TYPE_CHECKING:
+    import requests
+
+    from .db import DatabasesClient
+    from .routing import InstanceRouter
+
+Value = Union[None, int, float, str, bytes]
+Args = Union[Sequence[Value], Mapping[str, Value], None]
+Statement = Union[str, Tuple[str, Args]]
+Column = Union["array[int]", "array[float]", List[Value]]
+
+STREAM_CHUNK_SIZE = 64 * 1024
+DEFAULT_BLOCK_SIZE = 10_000
+
+
+def encode_value(value: Value) -> Dict[str, Any]:
+    """
+    Encode a statement argument as Hrana value. Booleans are stored as integers, like SQLite does.
+    :param value: None, int, float, str or bytes.
+    :return: Hrana value
+    """
+    if value is None:
+        return {"type": "null"}
+    if isinstance(value, (bool, int)):
+        return {"type": "integer", "value": str(int(value))}
+    if isinstance(value, float):
+        return {"type": "float", "value": value}
+    if isinstance(value, str):
+        return {"type": "text", "value": value}
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"type": "blob", "base64": base64.b64encode(value).decode()}
+    raise TypeError(f"Unsupported SQL value of type {type(value).__name__}")
+
+
+def _decode_text(value: Dict[str, Any]) -> Value:
+    """
+    Decode a Hrana text value.
+    :param value: Hrana value
+    :return: str
+    """
+    text: str = value["value"]
+    return text
+
+
+_DECODERS: Dict[str, Callable[[Dict[str, Any]], Value]] = {
+    "null": lambda value: None,
+    "integer": lambda value: int(value["value"]),
+    "float": lambda value: float(value["value"]),
+    "text": _decode_text,
+    "blob": lambda value: base64.b64decode(value["base64"]),
+}
+
+
+def decode_value(value: Dict[str, Any]) -> Value:
+    """
+    Decode a Hrana value. Integers are sent as strings to keep their 64-bit precision.
+    :param value: Hrana value, e.g. {'type': 'integer', 'value': '1'}.
+    :return: None, int, float, str or bytes.
+    """
+    return _DECODERS[value["type"]](value)
+
+
+def encode_statement(statement: Statement, want_rows: bool = True) -> Dict[str, Any]:
+    """
+    Build a Hrana statement.
+    :param statement: SQL text or (SQL text, positional or named arguments).
+    :param want_rows: Return the rows of the statement.
+    :return: Hrana statement
+    """
+    sql, args = (statement, None) if isinstance(statement, str) else statement
+    stmt: Dict[str, Any] = {"sql": sql, "want_rows": want_rows}
+    if isinstance(args, Mapping):
+        stmt["named_args"] = [{"name": name, "value": encode_value(value)} for name, value in args.items()]
+    elif args:
+        stmt["args"] = [encode_value(value) for value in args]
+    return stmt
+
+
+def _sql_exception(error: Dict[str, Any], statement: Optional[int]) -> SQLException:
+    """
+    Build the exception of a failed statement.
+    :param error: Hrana error.
+    :param statement: Index of the failed statement, None for statements added by the client.
+    :return: SQLException
+    """
+    return SQLException(f"Something went wrong: {error.get('message')}", error.get("code"), statement)
+
+
+@dataclass
+class ResultSet:
+    """
+    Result of a single SQL statement.
+    """
+
+    columns: List[str]
+    rows: List[Tuple[Value, ...]]
+    affected_row_count: int = 0
+    last_insert_rowid: Optional[int] = None
+    decltypes: List[Optional[str]] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, result: Dict[str, Any]) -> "ResultSet":
+        """
+        Load a Hrana statement result.
+        :param result: Hrana statement result.
+        :return: ResultSet
+        """
+        rowid = result.get("last_insert_rowid")
+        return cls(
+            columns=[column.get("name") or "" for column in result["cols"]],
+            rows=[tuple(decode_value(value) for value in row) for row in result["rows"]],
+            affected_row_count=result.get("affected_row_count", 0),
+            last_insert_rowid=int(rowid) if rowid is not None else None,
+            decltypes=[column.get("decltype") for column in result["cols"]],
+        )
+
+    def __iter__(self) -> Iterator[Tuple[Value, ...]]:
+        """
+        Iterate over the rows.
+        :return: Iterator of rows
+        """
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        """
+        Number of rows.
+        :return: int
+        """
+        return len(self.rows)
+
+    def to_dicts(self) -> List[Dict[str, Value]]:
+        """
+        Return the rows as dictionaries keyed by column name.
+        :return: List of rows
+        """
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+
+@dataclass
+class RowBlock:
+    """
+    Column-oriented block of result rows. Columns holding only integers or only floats are stored in typed arrays,
+    all other columns in lists.
+    """
+
+    columns: List[str]
+    data: List[Column]
+
+    @classmethod
+    def load(cls, columns: List[str], rows: List[List[Dict[str, Any]]]) -> "RowBlock":
+        """
+        Decode Hrana rows column by column. The type of every column is checked once per block, so homogeneous
+        columns are decoded without a per-value type dispatch.
+        :param columns: Column names.
+        :param rows: Hrana rows
+        :return: RowBlock
+        """
+        data: List[Column] = []
+        for index in range(len(columns)):
+            cells = [row[index] for row in rows]
+            kinds = {cell["type"] for cell in cells}
+            if kinds == {"integer"}:
+                data.append(array("q", [int(cell["value"]) for cell in cells]))
+            elif kinds == {"float"}:
+                data.append(array("d", [cell["value"] for cell in cells]))
+            elif len(kinds) == 1:
+                decoder = _DECODERS[kinds.pop()]
+                data.append([decoder(cell) for cell in cells])
+            else:
+                data.append([decode_value(cell) for cell in cells])
+        return cls(columns, data)
+
+    def __len__(self) -> int:
+        """
+        Number of rows.
+        :return: int
+        """
+        return len(self.data[0]) if self.data else 0
+
+    def column(self, name: str) -> Column:
+        """
+        Return the values of a column.
+        :param name: Column name
+        :return: Typed array or list of values
+        """
+        return self.data[self.columns.index(name)]
+
+    def rows(self) -> Iterator[Tuple[Value, ...]]:
+        """
+        Iterate over the rows of the block.
+        :return: Iterator of rows
+        """
+        return zip(*self.data)
+
+
+class RowStream:
+    """
+    Rows of a query, decoded while the response is downloaded.
+
+    The response is a newline delimited stream of Hrana cursor entries, parsed one line at a time, so memory stays
+    bounded by the row being decoded and the first rows are available before the query finished sending. Iterate
+    the stream for rows as tuples or call 'blocks' for column-oriented RowBlocks. A stream can be consumed once.
+    """
+
+    def __init__(
+        self, response: "requests.Response", codec: JSONCodec, on_close: Callable[[Any, str], None], url: str
+    ) -> None:
+        """
+        Read the header of the cursor up to the column names of the query.
+        :param response: Streamed response of the cursor request.
+        :param codec: JSON codec decoding the entries.
+        :param on_close: Called with the baton of the stream and 'url' once the response is closed.
+        :param url: Base url of the database instance that opened the cursor.
+        """
+        self._response = response
+        self._loads = codec.loads
+        self._on_close: Optional[Callable[[Any, str], None]] = on_close
+        self.url = url
+        self._lines = iter_lines(response.iter_content(STREAM_CHUNK_SIZE))
+        self.columns: List[str] = []
+        self.decltypes: List[Optional[str]] = []
+        self.affected_row_count = 0
+        self.last_insert_rowid: Optional[int] = None
+        self._kinds: List[Optional[str]] = []
+        self._decoders: List[Callable[[Dict[str, Any]], Value]] = []
+        try:
+            self._baton = self._loads(next(self._lines)).get("baton")
+            entry = self._entry()
+            if entry is not None:
+                self.columns = [column.get("name") or "" for column in entry["cols"]]
+                self.decltypes = [column.get("decltype") for column in entry["cols"]]
+        except BaseException:
+            self.close()
+            raise
+        self._raw = self._raw_rows()
+        self._rows = map(self._decode, self._raw)
+
+    def _entry(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the next cursor entry. Errors are raised as SQLException.
+        :return: Entry or None at the end of the stream.
+        """
+        line = next(self._lines, None)
+        if line is None:
+            return None
+        entry: Dict[str, Any] = self._loads(line)
+        if entry["type"] in ("step_error", "error"):
+            raise _sql_exception(entry["error"], 0)
+        return entry
+
+    def _raw_rows(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the undecoded rows and close the stream at the end.
+        :return: Iterator of Hrana rows
+        """
+        try:
+            while (entry := self._entry()) is not None:
+                kind = entry["type"]
+                if kind == "row":
+                    yield entry["row"]
+                elif kind == "step_end":
+                    self.affected_row_count = entry.get("affected_row_count", 0)
+                    rowid = entry.get("last_insert_rowid")
+                    self.last_insert_rowid = int(rowid) if rowid is not None else None
+        finally:
+            self.close()
+
+    def _decode(self, row: List[Dict[str, Any]]) -> Tuple[Value, ...]:
+        """
+        Decode a row. The decoder of every column is looked up again only when the column changes its type.
+        :param row: Hrana row
+        :return: Tuple of values
+        """
+        kinds, decoders = self._kinds, self._decoders
+        if not kinds:
+            kinds.extend([None] * len(row))
+            decoders.extend([decode_value] * len(row))
+        values = []
+        for index, cell in enumerate(row):
+            kind = cell["type"]
+            if kind != kinds[index]:
+                kinds[index] = kind
+                decoders[index] = _DECODERS[kind]
+            values.append(decoders[index](cell))
+        return tuple(values)
+
+    def __iter__(self) -> Iterator[Tuple[Value, ...]]:
+        """
+        Iterate over the remaining rows.
+        :return: Iterator of rows
+        """
+        return self._rows
+
+    def blocks(self, size: int = DEFAULT_BLOCK_SIZE) -> Iterator[RowBlock]:
+        """
+        Iterate over the remaining rows in column-oriented blocks.
+        :param size: Maximum number of rows per block.
+        :return: Iterator of RowBlocks
+        """
+        while rows := list(islice(self._raw, size)):
+            yield RowBlock.load(self.columns, rows)
+
+    def close(self) -> None:
+        """
+        Close the response and the stream on the database. Remaining rows are discarded.
+        :return: None
+        """
+        on_close, self._on_close = self._on_close, None
+        if on_close is None:
+            return
+        self._response.close()
+        on_close(getattr(self, "_baton", None), self.url)
+
+    def __enter__(self) -> "RowStream":
+        """
+        Enter a context manager.
+        :return: RowStream
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """
+        Close the stream when leaving the context manager.
+        :return: None
+        """
+        self.close()
+
+
+class SQLClient:
+    """
+    Client of the HTTP pipeline endpoint of a single database.
+
+    Every call is one HTTP request, no matter how many statements it carries, so batches of inserts or lookups
+    pay a single round trip. The request goes through the transport of the TursoClient and authenticates with a
+    database token from 'generate_token'. The token is kept by the client, or by the token cache of the TursoClient
+    if it has one, so statements do not request a new token. A rejected token is replaced once before the call
+    fails.
+    """
+
+    def __init__(
+        self,
+        db_client: "DatabasesClient",
+        org_name: str,
+        db_name: str,
+        *,
+        url: Optional[str] = None,
+        authorization: Optional[str] = None,
+        expiration: Optional[str] = None,
+        router: Optional["InstanceRouter"] = None,
+        write: bool = False,
+    ) -> None:
+        """
+        Initialize the client. The hostname and the token are fetched with the first statement.
+        :param db_client: DatabasesClient used to look up the hostname and to generate tokens.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :param url: Base url of the database. Defaults to 'https://' and the Hostname of the database.
+        :param authorization: Access level of the token, either 'full-access' (default) or 'read-only'.
+        :param expiration: Expiration time of the token, e.g. '2w1d30m'.
+        :param router: InstanceRouter picking the instance of every call. Replaces 'url'.
+        :param write: Let the router send all statements to the primary instead of the nearest instance.
+        """
+        self.db_client = db_client
+        self.org_name = org_name
+        self.db_name = db_name
+        self.authorization = authorization
+        self.expiration = expiration
+        self.router = router
+        self.write = write
+        self._url = url.rstrip("/") if url else None
+        self._jwt: Optional[str] = None
+        self._token_lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """
+        Base url of the database, or of the instance picked by the router.
+        :return: str
+        """
+        if self.router is not None:
+            return self.router.url(self.write)
+        if self._url is None:
+            self._url = "https://" + self.db_client.retrieve(self.org_name, self.db_name).Hostname
+        return self._url
+
+    def _token(self) -> str:
+        """
+        Return a database token. Without a token cache the first token is kept until it is rejected.
+        :return: JWT token
+        """
+        if self.db_client.client.token_cache is not None:
+            return self.db_client.generate_token(self.org_name, self.db_name, self.expiration, self.authorization)
+        with self._token_lock:
+            if self._jwt is None:
+                self._jwt = self.db_client.generate_token(
+                    self.org_name, self.db_name, self.expiration, self.authorization
+                )
+            return self._jwt
+
+    def _reject_token(self, token: str) -> None:
+        """
+        Drop a token the database rejected, so the next call requests a new one.
+        :param token: Rejected JWT token
+        :return: None
+        """
+        cache = self.db_client.client.token_cache
+        if cache is not None:
+            cache.invalidate(self.org_name, self.db_name)
+        with self._token_lock:
+            if self._jwt == token:
+                self._jwt = None
+
+    def _post(
+        self, path: str, body: Dict[str, Any], *, url: Optional[str] = None, **kwargs: Any
+    ) -> "requests.Response":
+        """
+        Send a request to the database. A 401 response drops the token and is retried once with a new token.
+        :param path: Path of the endpoint.
+        :param body: Request body.
+        :param url: Base url of the database. Defaults to 'url', which may change between calls with a router.
+        :param kwargs: Additional keyword arguments passed on to the transport.
+        :return: Response
+        """
+        client = self.db_client.client
+        url = url or self.url
+        data = client.codec.dumps(body)
+        for attempt in range(2):
+            token = self._token()
+            headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+            response = client.transport.request("POST", url + path, data=data, headers=headers, **kwargs)
+            if response.status_code != 401 or attempt:
+                break
+            response.close()
+            self._reject_token(token)
+
+        if response.status_code != 200:
+            content = response.content
+            response.close()
+            raise TursoRequestException(f"Something went wrong: {content!r}")
+        return response
+
+    def pipeline(self, stream_requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send Hrana stream requests in a single pipeline request and close the stream afterwards.
+        :param stream_requests: Hrana stream requests, e.g. {'type': 'execute', 'stmt': {...}}.
+        :return: Responses of the requests. Raises SQLException for the first failed request.
+        """
+        body = {"baton": None, "requests": [*stream_requests, {"type": "close"}]}
+        response = self._post(SQL_PATH["pipeline"], body)
+        results: List[Dict[str, Any]] = self.db_client.client.decode(response)["results"][: len(stream_requests)]
+        for index, result in enumerate(results):
+            if result["type"] == "error":
+                raise _sql_exception(result["error"], index)
+        return [result["response"] for result in results]
+
+    def stream(self, sql: str, args: Args = None) -> RowStream:
+        """
+        Execute a query and stream its rows. Use it for large results that should not be held in memory at once.
+        :param sql: SQL text with '?' or named placeholders.
+        :param args: Positional or named arguments.
+        :return: RowStream, close it or use it as context manager if it is not consumed completely.
+        """
+        body = {"baton": None, "batch": {"steps": [{"stmt": encode_statement((sql, args))}]}}
+        url = self.url
+        response = self._post(SQL_PATH["cursor"], body, url=url, stream=True)
+        return RowStream(response, self.db_client.client.codec, self._close_stream, url)
+
+    def _close_stream(self, baton: Optional[str], url: str) -> None:
+        """
+        Close a stream the database kept open for a cursor.
+        :param baton: Baton of the stream. Nothing is sent without one.
+        :param url: Base url of the database instance holding the stream.
+        :return: None
+        """
+        if baton is not None:
+            self._post(SQL_PATH["pipeline"], {"baton": baton, "requests": [{"type": "close"}]}, url=url).close()
+
+    def execute(self, sql: str, args: Args = None) -> ResultSet:
+        """
+        Execute a single statement.
+        :param sql: SQL text with '?' or named placeholders.
+        :param args: Positional or named arguments.
+        :return: ResultSet
+        """
+        (response,) = self.pipeline([{"type": "execute", "stmt": encode_statement((sql, args))}])
+        return ResultSet.load(response["result"])
+
+    def batch(self, statements: Sequence[Statement], *, transaction: bool = False) -> List[ResultSet]:
+        """
+        Execute many statements in a single round trip. Every statement runs only if the previous one succeeded,
+        the first error is raised as SQLException with the index of the failed statement.
+        :param statements: SQL texts or (SQL text, arguments) pairs.
+        :param transaction: Run the statements in a transaction that is rolled back if a statement fails.
+        :return: One ResultSet per statement.
+        """
+        steps = [{"stmt": encode_statement(statement)} for statement in statements]
+        offset = 1 if transaction else 0
+        if transaction:
+            steps = [{"stmt": {"sql": "BEGIN"}}, *steps, {"stmt": {"sql": "COMMIT"}}]
+        for index in range(1, len(steps)):
+            steps[index]["condition"] = {"type": "ok", "step": index - 1}
+        if transaction:
+            commit = len(steps) - 1
+            steps.append(
+                {"stmt": {"sql": "ROLLBACK"}, "condition": {"type": "not", "cond": {"type": "ok", "step": commit}}}
+            )
+
+        (response,) = self.pipeline([{"type": "batch", "batch": {"steps": steps}}])
+        results, errors = response["result"]["step_results"], response["result"]["step_errors"]
+        for index, error in enumerate(errors):
+            if error is not None:
+                statement = index - offset if offset <= index < offset + len(statements) else None
+                raise _sql_exception(error, statement)
+        return [ResultSet.load(result) for result in results[offset : offset + len(statements)]]
+
+    def executemany(self, sql: str, args_list: Sequence[Args], *, transaction: bool = True) -> List[ResultSet]:
+        """
+        Execute one statement with many argument sets in a single round trip.
+        :param sql: SQL text with '?' or named placeholders.
+        :param args_list: Arguments of every execution.
+        :param transaction: Run all executions in a transaction that is rolled back if one fails.
+        :return: One ResultSet per execution.
+        """
+        return self.batch([(sql, args) for args in args_list], transaction=transaction)
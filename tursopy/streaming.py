@@ -0,0 +1,136 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+_DECODER = json.JSONDecoder()
+
+
+class _JSONStream:
+    """
+    Text buffer over a stream of byte chunks that reads just as much of the stream as the parser needs.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        """
+        Initialize the stream.
+        :param chunks: Byte chunks of a UTF-8 encoded JSON document.
+        """
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._exhausted = False
+        self.text = ""
+        self.pos = 0
+
+    def read_more(self) -> bool:
+        """
+        Append the next chunk to the buffer and drop the consumed part of it.
+        :return: False if the stream is exhausted.
+        """
+        if self._exhausted:
+            return False
+        self.text = self.text[self.pos :]
+        self.pos = 0
+        for chunk in self._chunks:
+            if chunk:
+                self.text += self._decoder.decode(chunk)
+                return True
+        self.text += self._decoder.decode(b"", final=True)
+        self._exhausted = True
+        return True
+
+    def peek(self) -> str:
+        """
+        Skip whitespace and return the next character without consuming it.
+        :return: Next character or an empty string at the end of the stream.
+        """
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text) or not self.read_more():
+                return self.text[self.pos : self.pos + 1]
+
+    def expect(self, characters: str) -> str:
+        """
+        Consume the next character, which needs to be one of the given characters.
+        :param characters: Allowed characters.
+        :return: The consumed character.
+        """
+        char = self.peek()
+        if not char or char not in characters:
+            raise ValueError(
+                f"Unexpected {char or 'end of document'!r} at position {self.pos}, expected {characters!r}."
+            )
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """
+        Decode the next complete JSON value, reading more of the stream until it is available.
+        :return: Decoded value
+        """
+        self.peek()
+        while True:
+            try:
+                result, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.read_more():
+                    raise
+                continue
+            # A value ending exactly at the end of the buffer may be cut off, e.g. a number.
+            if end == len(self.text) and self.read_more():
+                continue
+            self.pos = end
+            return result
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Incrementally parse a JSON object and yield the items of the array stored under 'key' one at a time.
+    Only the item being parsed is held in memory, the rest of the document is read on demand.
+
+    :param chunks: Byte chunks of a UTF-8 encoded JSON object.
+    :param key: Top-level key of the array.
+    :return: Iterator of decoded array items. Yields nothing if the key is missing.
+    """
+    stream = _JSONStream(chunks)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+
+    while True:
+        name = stream.value()
+        stream.expect(":")
+        if name != key:
+            stream.value()
+        else:
+            stream.expect("[")
+            if stream.peek() == "]":
+                stream.pos += 1
+            else:
+                while True:
+                    yield stream.value()
+                    if stream.expect(",]") == "]":
+                        break
+            return
+        if stream.expect(",}") == "}":
+            return
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Split a stream of byte chunks into lines, e.g. of a newline delimited JSON document. Only the current chunk and
+    the unfinished line are held in memory.
+
+    :param chunks: Byte chunks.
+    :return: Iterator of lines without the line break. Empty lines are skipped.
+    """
+    pending = b""
+    for chunk in chunks:
+        lines = (pending + chunk).split(b"\n") if pending else chunk.split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield line
+    if pending.strip():
+        yield pending
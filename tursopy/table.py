@@ -0,0 +1,304 @@
+from array import array
+from dataclasses import fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .dataclasses import DatabaseRead
+
+STRING_COLUMNS = ("Name", "DbId", "Hostname", "hostname")
+CATEGORY_COLUMNS = ("schema", "primaryRegion", "type", "version", "group")
+FLAG_COLUMNS = ("is_schema", "block_reads", "block_writes", "allow_attach", "sleeping")
+REGION = "region"
+
+_FIELDS = tuple(field.name for field in fields(DatabaseRead))
+
+
+class _Category:
+    """
+    Dictionary of the distinct values of a column. Every value is stored once and rows refer to it by code.
+    """
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty dictionary.
+        """
+        self.values: List[Any] = []
+        self.codes: Dict[Any, int] = {}
+
+    def encode(self, value: Any) -> int:
+        """
+        Return the code of a value, adding it to the dictionary if it is new.
+        :param value: Column value
+        :return: Code
+        """
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class DatabaseTable:
+    """
+    Column-oriented table of databases.
+
+    Repeated values like group, region, version and type are dictionary encoded and every distinct region list is
+    stored once. Lookups by Name and DbId use hash indexes, and filters and group-bys on group, region, schema and
+    the other encoded columns use secondary indexes built on first use. Rows are materialized as DatabaseRead only
+    when they are accessed.
+    """
+
+    def __init__(
+        self,
+        strings: Dict[str, List[str]],
+        codes: Dict[str, "array[int]"],
+        flags: Dict[str, bytearray],
+        categories: Dict[str, _Category],
+    ) -> None:
+        """
+        Initialize a table from its columns. Use 'from_records' or 'from_databases' to build a table.
+        :param strings: Columns of unique strings.
+        :param codes: Codes of the dictionary encoded columns, including 'regions'.
+        :param flags: Columns of booleans.
+        :param categories: Dictionaries of the encoded columns. They are shared by tables derived from this one.
+        """
+        self._strings = strings
+        self._codes = codes
+        self._flags = flags
+        self._categories = categories
+        self._by_name = {name: row for row, name in enumerate(strings["Name"])}
+        self._by_id = {db_id: row for row, db_id in enumerate(strings["DbId"])}
+        self._indexes: Dict[str, Dict[Any, "array[int]"]] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "DatabaseTable":
+        """
+        Build a table from the database records of the Platform API without creating a DatabaseRead per record.
+        :param records: Database dictionaries as returned by the list databases endpoint.
+        :return: DatabaseTable
+        """
+        strings: Dict[str, List[str]] = {column: [] for column in STRING_COLUMNS}
+        codes = {column: array("I") for column in (*CATEGORY_COLUMNS, "regions")}
+        flags = {column: bytearray() for column in FLAG_COLUMNS}
+        categories = {column: _Category() for column in (*CATEGORY_COLUMNS, "regions")}
+        try:
+            for record in records:
+                for column, values in strings.items():
+                    values.append(record[column])
+                for column in CATEGORY_COLUMNS:
+                    codes[column].append(categories[column].encode(record[column]))
+                codes["regions"].append(categories["regions"].encode(tuple(record["regions"])))
+                for column, flag_values in flags.items():
+                    flag_values.append(bool(record[column]))
+        except KeyError as e:
+            raise TypeError(f"DatabaseRead is missing the required field {e}.") from None
+        return cls(strings, codes, flags, categories)
+
+    @classmethod
+    def from_databases(cls, databases: Iterable[DatabaseRead]) -> "DatabaseTable":
+        """
+        Build a table from DatabaseRead models.
+        :param databases: Databases
+        :return: DatabaseTable
+        """
+        return cls.from_records({name: getattr(database, name) for name in _FIELDS} for database in databases)
+
+    def __len__(self) -> int:
+        """
+        Number of databases.
+        :return: int
+        """
+        return len(self._strings["Name"])
+
+    def __contains__(self, name: object) -> bool:
+        """
+        Whether a database with the name is in the table.
+        :param name: Database name
+        :return: bool
+        """
+        return name in self._by_name
+
+    def __iter__(self) -> Iterator[DatabaseRead]:
+        """
+        Iterate over the rows as DatabaseRead.
+        :return: Iterator of DatabaseRead
+        """
+        return (self.row(row) for row in range(len(self)))
+
+    def __getitem__(self, row: int) -> DatabaseRead:
+        """
+        Return a row as DatabaseRead.
+        :param row: Row number
+        :return: DatabaseRead
+        """
+        return self.row(row)
+
+    def __repr__(self) -> str:
+        """
+        Short representation showing the number of rows.
+        :return: str
+        """
+        return f"DatabaseTable(rows={len(self)})"
+
+    @property
+    def names(self) -> List[str]:
+        """
+        Names of the databases in row order.
+        :return: List of names
+        """
+        return list(self._strings["Name"])
+
+    def value(self, row: int, column: str) -> Any:
+        """
+        Return a single value without materializing the row.
+        :param row: Row number
+        :param column: Field name of DatabaseRead.
+        :return: Value
+        """
+        if column in self._strings:
+            return self._strings[column][row]
+        if column in self._flags:
+            return bool(self._flags[column][row])
+        if column in self._codes:
+            value = self._categories[column].values[self._codes[column][row]]
+            return list(value) if column == "regions" else value
+        raise KeyError(f"Unknown column '{column}'.")
+
+    def column(self, column: str) -> List[Any]:
+        """
+        Return all values of a column in row order.
+        :param column: Field name of DatabaseRead.
+        :return: List of values
+        """
+        return [self.value(row, column) for row in range(len(self))]
+
+    def row(self, row: int) -> DatabaseRead:
+        """
+        Materialize a row as DatabaseRead.
+        :param row: Row number
+        :return: DatabaseRead
+        """
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("DatabaseTable index out of range.")
+        return DatabaseRead(*(self.value(row, name) for name in _FIELDS))
+
+    def get(self, name: str) -> Optional[DatabaseRead]:
+        """
+        Look up a database by name.
+        :param name: Database name
+        :return: DatabaseRead or None
+        """
+        row = self._by_name.get(name)
+        return self.row(row) if row is not None else None
+
+    def get_by_id(self, db_id: str) -> Optional[DatabaseRead]:
+        """
+        Look up a database by its id.
+        :param db_id: Database id
+        :return: DatabaseRead or None
+        """
+        row = self._by_id.get(db_id)
+        return self.row(row) if row is not None else None
+
+    def to_list(self) -> List[DatabaseRead]:
+        """
+        Materialize all rows.
+        :return: List of DatabaseRead, equal to the result of 'list_databases'.
+        """
+        return list(self)
+
+    def _index(self, column: str) -> Dict[Any, "array[int]"]:
+        """
+        Return the secondary index of an encoded column or of the replica regions, building it on first use.
+        :param column: Encoded column or 'region'.
+        :return: Rows by value, in ascending order.
+        """
+        index = self._indexes.get(column)
+        if index is not None:
+            return index
+        if column not in CATEGORY_COLUMNS and column != REGION:
+            raise KeyError(f"Column '{column}' has no index. Use one of {(*CATEGORY_COLUMNS, REGION)}.")
+
+        source = "regions" if column == REGION else column
+        by_code: Dict[int, "array[int]"] = {}
+        for row, code in enumerate(self._codes[source]):
+            rows = by_code.get(code)
+            if rows is None:
+                rows = by_code[code] = array("I")
+            rows.append(row)
+
+        values = self._categories[source].values
+        index = {}
+        if column == REGION:
+            for code, rows in by_code.items():
+                for region in values[code]:
+                    index.setdefault(region, array("I")).extend(rows)
+            index = {region: array("I", sorted(rows)) for region, rows in index.items()}
+        else:
+            index = {values[code]: rows for code, rows in by_code.items()}
+        self._indexes[column] = index
+        return index
+
+    def _take(self, rows: Sequence[int]) -> "DatabaseTable":
+        """
+        Build a table from a selection of rows. Dictionaries are shared with this table.
+        :param rows: Row numbers
+        :return: DatabaseTable
+        """
+        strings = {column: [values[row] for row in rows] for column, values in self._strings.items()}
+        codes = {column: array("I", [values[row] for row in rows]) for column, values in self._codes.items()}
+        flags = {column: bytearray(values[row] for row in rows) for column, values in self._flags.items()}
+        return DatabaseTable(strings, codes, flags, self._categories)
+
+    def filter(self, region: Optional[str] = None, **conditions: Any) -> "DatabaseTable":
+        """
+        Select the databases matching all conditions. Encoded columns and regions are resolved through their
+        indexes and only the remaining rows are checked against flag and string conditions.
+
+        :param region: Only databases replicated to this region.
+        :param conditions: Values by field name of DatabaseRead, e.g. group="default", sleeping=False.
+        :return: DatabaseTable with the matching rows in their original order.
+        """
+        if region is not None:
+            conditions[REGION] = region
+        selection: Optional[List[int]] = None
+        for column in sorted(conditions, key=lambda column: column not in self._indexes):
+            if column in CATEGORY_COLUMNS or column == REGION:
+                rows = self._index(column).get(conditions[column], array("I"))
+                if selection is None:
+                    selection = list(rows)
+                else:
+                    keep = set(rows)
+                    selection = [row for row in selection if row in keep]
+            elif column in self._flags or column in self._strings:
+                candidates = range(len(self)) if selection is None else selection
+                selection = [row for row in candidates if self.value(row, column) == conditions[column]]
+            else:
+                raise KeyError(f"Unknown column '{column}'.")
+        return self._take(range(len(self)) if selection is None else selection)
+
+    def group_by(self, column: str) -> Dict[Any, "DatabaseTable"]:
+        """
+        Split the table by the values of a column.
+        :param column: Encoded column, flag column or 'region'. With 'region' a database is part of the group of
+         every region it is replicated to.
+        :return: DatabaseTable by value
+        """
+        if column in self._flags:
+            flag_values = self._flags[column]
+            rows: Dict[Any, List[int]] = {}
+            for row, flag in enumerate(flag_values):
+                rows.setdefault(bool(flag), []).append(row)
+            return {value: self._take(selection) for value, selection in rows.items()}
+        return {value: self._take(selection) for value, selection in self._index(column).items()}
+
+    def counts(self, column: str) -> Dict[Any, int]:
+        """
+        Count the databases by the values of a column without building the groups.
+        :param column: Encoded column or 'region'.
+        :return: Number of databases by value
+        """
+        return {value: len(rows) for value, rows in self._index(column).items()}
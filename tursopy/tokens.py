@@ -0,0 +1,250 @@
+import base64
+import binascii
+import json
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from .singleflight import AsyncSingleFlight, SingleFlight
+
+if TYPE_CHECKING:
+    import asyncio
+
+DEFAULT_REFRESH_AHEAD = 300.0
+DEFAULT_EXPIRY_MARGIN = 5.0
+
+TokenKey = Tuple[str, str, Tuple[Tuple[str, Any], ...]]
+
+
+def decode_jwt_expiry(token: str) -> Optional[float]:
+    """
+    Read the 'exp' claim of a JWT without verifying its signature.
+    :param token: JWT
+    :return: Expiry as unix timestamp or None if the token does not expire or cannot be decoded.
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError, binascii.Error):
+        return None
+    expiry = claims.get("exp") if isinstance(claims, dict) else None
+    return float(expiry) if isinstance(expiry, (int, float)) else None
+
+
+class _Entry:
+    """
+    Cached token with the times it needs to be refreshed and stops being served.
+    """
+
+    __slots__ = ("expires_at", "refresh_at", "token")
+
+    def __init__(self, token: str, now: float, refresh_ahead: float, expiry_margin: float) -> None:
+        """
+        Initialize the entry.
+        :param token: JWT
+        :param now: Current unix time.
+        :param refresh_ahead: Seconds before the expiry a refresh starts.
+        :param expiry_margin: Seconds before the expiry the token is no longer served.
+        """
+        self.token = token
+        expiry = decode_jwt_expiry(token)
+        if expiry is None:
+            self.expires_at = self.refresh_at = float("inf")
+        else:
+            self.expires_at = expiry - expiry_margin
+            # Short-lived tokens are refreshed after half of their lifetime at the latest.
+            self.refresh_at = expiry - min(refresh_ahead, max(0.0, expiry - now) / 2)
+
+
+class DatabaseTokenCache:
+    """
+    Thread-safe cache of database auth tokens keyed by organization, database and token options.
+
+    Tokens are served until shortly before the expiry stored in their 'exp' claim. Once a token enters its refresh
+    window a single background refresh replaces it while callers keep receiving the cached token, so token
+    lookups stay off the network. Concurrent callers missing the same token share a single fetch. Tokens without
+    an expiry are cached until they are invalidated.
+    """
+
+    def __init__(
+        self, refresh_ahead: float = DEFAULT_REFRESH_AHEAD, expiry_margin: float = DEFAULT_EXPIRY_MARGIN
+    ) -> None:
+        """
+        Initialize the token cache.
+        :param refresh_ahead: Seconds before the expiry of a token the background refresh starts.
+        :param expiry_margin: Seconds before the expiry a token is no longer served, covering clock skew.
+        """
+        self.refresh_ahead = refresh_ahead
+        self.expiry_margin = expiry_margin
+        self._entries: Dict[TokenKey, _Entry] = {}
+        self._refreshing: Set[TokenKey] = set()
+        self._generations: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._fetches = SingleFlight()
+        self._async_fetches = AsyncSingleFlight()
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    @staticmethod
+    def key(org_name: str, db_name: str, **options: Any) -> TokenKey:
+        """
+        Build the cache key of a token.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :param options: Token options, e.g. expiration and authorization.
+        :return: Cache key
+        """
+        return org_name, db_name, tuple(sorted((k, v) for k, v in options.items() if v is not None))
+
+    def _lookup(self, key: TokenKey) -> Tuple[Optional[str], bool, int]:
+        """
+        Look up a token.
+        :param key: Cache key
+        :return: Servable token or None, whether the caller needs to start a refresh, and the current generation.
+        """
+        now = time.time()
+        with self._lock:
+            generation = self._generations.get(key[:2], 0)
+            entry = self._entries.get(key)
+            if entry is None or now >= entry.expires_at:
+                return None, False, generation
+            if now < entry.refresh_at or key in self._refreshing:
+                return entry.token, False, generation
+            self._refreshing.add(key)
+            return entry.token, True, generation
+
+    def _store(self, key: TokenKey, token: str, generation: int) -> None:
+        """
+        Store a fetched token unless the tokens of its database were invalidated while it was fetched.
+        :param key: Cache key
+        :param token: JWT
+        :param generation: Generation of the database when the fetch started.
+        :return: None
+        """
+        with self._lock:
+            if self._generations.get(key[:2], 0) == generation:
+                self._entries[key] = _Entry(token, time.time(), self.refresh_ahead, self.expiry_margin)
+
+    def _refresh_done(self, key: TokenKey) -> None:
+        """
+        Mark the background refresh of a key as finished.
+        :param key: Cache key
+        :return: None
+        """
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def get(self, key: TokenKey, fetch: Callable[[], str]) -> str:
+        """
+        Return the cached token of the key, fetching it if there is none and refreshing it in a background thread
+        when it is about to expire.
+        :param key: Cache key
+        :param fetch: Call requesting a new token from the Platform API.
+        :return: JWT
+        """
+        token, refresh, generation = self._lookup(key)
+        if token is not None:
+            if refresh:
+                threading.Thread(target=self._refresh, args=(key, fetch, generation), daemon=True).start()
+            return token
+
+        return self._fetches.do(key, lambda: self._fetch(key, fetch))
+
+    def _fetch(self, key: TokenKey, fetch: Callable[[], str]) -> str:
+        """
+        Fetch and store a token unless another caller stored one since the lookup that missed it.
+        :param key: Cache key
+        :param fetch: Call requesting a new token from the Platform API.
+        :return: JWT
+        """
+        token, _, generation = self._lookup(key)
+        if token is not None:
+            return token
+        token = fetch()
+        self._store(key, token, generation)
+        return token
+
+    def _refresh(self, key: TokenKey, fetch: Callable[[], str], generation: int) -> None:
+        """
+        Replace a token in the background. A failed refresh keeps the current token until it expires.
+        :param key: Cache key
+        :param fetch: Call requesting a new token from the Platform API.
+        :param generation: Generation of the database when the refresh started.
+        :return: None
+        """
+        try:
+            self._store(key, fetch(), generation)
+        except Exception:
+            pass
+        finally:
+            self._refresh_done(key)
+
+    async def get_async(self, key: TokenKey, fetch: Callable[[], Awaitable[str]]) -> str:
+        """
+        Return the cached token of the key, fetching it if there is none and refreshing it in a background task
+        when it is about to expire.
+        :param key: Cache key
+        :param fetch: Coroutine function requesting a new token from the Platform API.
+        :return: JWT
+        """
+        token, refresh, generation = self._lookup(key)
+        if token is not None:
+            if refresh:
+                import asyncio  # noqa: PLC0415
+
+                task = asyncio.ensure_future(self._refresh_async(key, fetch, generation))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return token
+
+        return await self._async_fetches.do(key, lambda: self._fetch_async(key, fetch))
+
+    async def _fetch_async(self, key: TokenKey, fetch: Callable[[], Awaitable[str]]) -> str:
+        """
+        Fetch and store a token unless another task stored one since the lookup that missed it.
+        :param key: Cache key
+        :param fetch: Coroutine function requesting a new token from the Platform API.
+        :return: JWT
+        """
+        token, _, generation = self._lookup(key)
+        if token is not None:
+            return token
+        token = await fetch()
+        self._store(key, token, generation)
+        return token
+
+    async def _refresh_async(self, key: TokenKey, fetch: Callable[[], Awaitable[str]], generation: int) -> None:
+        """
+        Replace a token in a background task. A failed refresh keeps the current token until it expires.
+        :param key: Cache key
+        :param fetch: Coroutine function requesting a new token from the Platform API.
+        :param generation: Generation of the database when the refresh started.
+        :return: None
+        """
+        try:
+            self._store(key, await fetch(), generation)
+        except Exception:
+            pass
+        finally:
+            self._refresh_done(key)
+
+    def invalidate(self, org_name: str, db_name: str) -> None:
+        """
+        Drop all cached tokens of a database. Refreshes that are in flight are discarded when they complete.
+        :param org_name: The name of the organization or user.
+        :param db_name: The name of the database.
+        :return: None
+        """
+        with self._lock:
+            self._generations[(org_name, db_name)] = self._generations.get((org_name, db_name), 0) + 1
+            for key in [key for key in self._entries if key[:2] == (org_name, db_name)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Drop all cached tokens.
+        :return: None
+        """
+        with self._lock:
+            for org_db in {key[:2] for key in self._entries}:
+                self._generations[org_db] = self._generations.get(org_db, 0) + 1
+            self._entries.clear()
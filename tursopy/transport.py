@@ -0,0 +1,360 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple, Type, Union, cast
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+Timeout = Union[float, Tuple[float, float], None]
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT: Timeout = (5.0, 30.0)
+
+
+class Transport(ABC):
+    """
+    Base class for the HTTP layer used by the TursoClient to talk to the Platform API.
+    """
+
+    #: Exceptions raised by the transport for transient network failures. Calls failing with them may be retried.
+    retryable_errors: Tuple[Type[BaseException], ...] = ()
+
+    @abstractmethod
+    def request(self, method: str, url: str, **kwargs: Any) -> "requests.Response":
+        """
+        Send a single HTTP request.
+        :param method: HTTP method, e.g. 'GET'.
+        :param url: Fully qualified request url.
+        :param kwargs: Additional keyword arguments understood by the transport (headers, params, json, data, ...).
+        :return: Response
+        """
+
+    def close(self) -> None:
+        """
+        Release all resources held by the transport.
+        :return: None
+        """
+
+
+class RequestsTransport(Transport):
+    """
+    Transport backed by a pooled keep-alive requests.Session.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        keep_alive: bool = True,
+        session: Optional["requests.Session"] = None,
+    ) -> None:
+        """
+        Initialize the transport. The session is set up with the first request, so requests is only imported once
+        the client talks to the network.
+        :param pool_size: Maximum number of connections kept open per host.
+        :param timeout: Default (connect, read) timeout in seconds applied to every request that does not set one.
+        :param keep_alive: Reuse connections between requests. Disabling this closes the connection after each call.
+        :param session: Optional preconfigured session. A new one is created if not given.
+        """
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self._session = session
+        self._ready = False
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        """
+        Pooled session of the transport, created on first access.
+        :return: requests.Session
+        """
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    self._setup()
+        return self._session  # type:ignore [return-value]
+
+    def _setup(self) -> None:
+        """
+        Import requests, create the session if none was given and mount the pooled adapters.
+        :return: None
+        """
+        import requests  # noqa: PLC0415
+        from requests.adapters import HTTPAdapter  # noqa: PLC0415
+
+        session = self._session if self._session is not None else requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+
+        self.retryable_errors = (requests.ConnectionError, requests.Timeout)
+        self._session = session
+        self._ready = True
+
+    def request(self, method: str, url: str, **kwargs: Any) -> "requests.Response":
+        """
+        Send a single HTTP request through the pooled session.
+        :param method: HTTP method, e.g. 'GET'.
+        :param url: Fully qualified request url.
+        :param kwargs: Keyword arguments passed on to requests.Session.request.
+        :return: Response
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        """
+        Close the session and all pooled connections.
+        :return: None
+        """
+        if self._session is not None:
+            self._session.close()
+
+
+class AsyncTransport(ABC):
+    """
+    Base class for the HTTP layer used by the AsyncTursoClient to talk to the Platform API.
+    """
+
+    #: Exceptions raised by the transport for transient network failures. Calls failing with them may be retried.
+    retryable_errors: Tuple[Type[BaseException], ...] = ()
+
+    @abstractmethod
+    async def request(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """
+        Send a single HTTP request.
+        :param method: HTTP method, e.g. 'GET'.
+        :param url: Fully qualified request url.
+        :param kwargs: Additional keyword arguments understood by the transport (headers, params, json, ...).
+        :return: Response
+        """
+
+    async def aclose(self) -> None:
+        """
+        Release all resources held by the transport.
+        :return: None
+        """
+
+
+def _import_httpx(http2: bool = False) -> Any:
+    """
+    Import the optional httpx dependency.
+    :param http2: Also require the h2 package used by httpx for HTTP/2.
+    :return: httpx module
+    """
+    try:
+        import httpx  # noqa: PLC0415
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(
+            "The httpx transports require the optional 'httpx' dependency. "
+            "Install it with 'pip install tursopy[async]'."
+        ) from e
+    if http2:
+        try:
+            import h2  # noqa: F401, PLC0415
+        except ImportError as e:  # pragma: no cover
+            raise ImportError(
+                "HTTP/2 requires the optional 'h2' dependency. Install it with 'pip install tursopy[http2]'."
+            ) from e
+    return httpx
+
+
+def _httpx_options(httpx: Any, pool_size: int, timeout: Timeout, keep_alive: bool, http2: bool) -> Dict[str, Any]:
+    """
+    Translate the transport settings into keyword arguments of httpx.Client and httpx.AsyncClient.
+    :param httpx: httpx module
+    :param pool_size: Maximum number of connections in the pool.
+    :param timeout: Default (connect, read) timeout in seconds.
+    :param keep_alive: Reuse connections between requests.
+    :param http2: Offer HTTP/2, which is negotiated during the TLS handshake.
+    :return: Client options
+    """
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size if keep_alive else 0)
+    return {"timeout": _httpx_timeout(httpx, timeout), "limits": limits, "http2": http2}
+
+
+def _httpx_timeout(httpx: Any, timeout: Timeout) -> Any:
+    """
+    Translate a requests style timeout into an httpx.Timeout.
+    :param httpx: httpx module
+    :param timeout: Timeout in seconds or a (connect, read) tuple.
+    :return: httpx.Timeout
+    """
+    if isinstance(timeout, tuple):
+        connect_timeout, read_timeout = timeout
+        return httpx.Timeout(read_timeout, connect=connect_timeout)
+    return httpx.Timeout(timeout)
+
+
+class HTTPXResponse:
+    """
+    Adapter giving an httpx.Response the parts of the requests.Response interface the TursoClient relies on.
+    """
+
+    def __init__(self, response: "httpx.Response") -> None:
+        """
+        Wrap a response.
+        :param response: httpx.Response
+        """
+        self.raw = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+
+    @property
+    def content(self) -> bytes:
+        """
+        Body of the response. A streamed body is read completely.
+        :return: bytes
+        """
+        return self.raw.read()
+
+    @property
+    def text(self) -> str:
+        """
+        Decoded body of the response.
+        :return: str
+        """
+        self.raw.read()
+        return self.raw.text
+
+    def json(self) -> Any:
+        """
+        Decode the JSON body.
+        :return: Decoded body
+        """
+        self.raw.read()
+        return self.raw.json()
+
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Iterate over the body in chunks without reading it into memory.
+        :param chunk_size: Size of the chunks.
+        :return: Iterator of bytes
+        """
+        return self.raw.iter_bytes(chunk_size)
+
+    def close(self) -> None:
+        """
+        Release the connection of the response.
+        :return: None
+        """
+        self.raw.close()
+
+    def __enter__(self) -> "HTTPXResponse":
+        """
+        Enter a context manager.
+        :return: HTTPXResponse
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """
+        Close the response when leaving the context manager.
+        :return: None
+        """
+        self.close()
+
+
+class HTTPXTransport(Transport):
+    """
+    Transport backed by a pooled httpx.Client. With HTTP/2 the concurrent calls of all threads are multiplexed over
+    a single connection per host instead of one pooled connection per call in flight.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        keep_alive: bool = True,
+        http2: bool = False,
+        client: Optional["httpx.Client"] = None,
+    ) -> None:
+        """
+        Initialize the transport.
+        :param pool_size: Maximum number of connections in the pool.
+        :param timeout: Default (connect, read) timeout in seconds applied to every request that does not set one.
+        :param keep_alive: Reuse connections between requests.
+        :param http2: Use HTTP/2. Requires the optional 'h2' dependency.
+        :param client: Optional preconfigured httpx.Client. A new one is created if not given.
+        """
+        httpx = _import_httpx(http2)
+        if client is None:
+            client = httpx.Client(**_httpx_options(httpx, pool_size, timeout, keep_alive, http2))
+        self.client = client
+        self.retryable_errors = (httpx.TransportError,)
+        self._httpx = httpx
+
+    def request(self, method: str, url: str, **kwargs: Any) -> "requests.Response":
+        """
+        Send a single HTTP request through the pooled client. Keyword arguments follow requests, e.g. 'data' and
+        'stream', and are translated for httpx.
+        :param method: HTTP method, e.g. 'GET'.
+        :param url: Fully qualified request url.
+        :param kwargs: Keyword arguments of requests.Session.request.
+        :return: Response implementing the parts of requests.Response used by the client.
+        """
+        stream = kwargs.pop("stream", False)
+        if "data" in kwargs:
+            kwargs["content"] = kwargs.pop("data")
+        if "timeout" in kwargs:
+            kwargs["timeout"] = _httpx_timeout(self._httpx, kwargs["timeout"])
+        response = self.client.send(self.client.build_request(method, url, **kwargs), stream=stream)
+        return cast("requests.Response", HTTPXResponse(response))
+
+    def close(self) -> None:
+        """
+        Close the client and all pooled connections.
+        :return: None
+        """
+        self.client.close()
+
+
+class HTTPXAsyncTransport(AsyncTransport):
+    """
+    Transport backed by a pooled httpx.AsyncClient. All requests share one connection pool.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        keep_alive: bool = True,
+        client: Optional["httpx.AsyncClient"] = None,
+        http2: bool = False,
+    ) -> None:
+        """
+        Initialize the transport.
+        :param pool_size: Maximum number of concurrent connections in the pool.
+        :param timeout: Default (connect, read) timeout in seconds applied to every request that does not set one.
+        :param keep_alive: Reuse connections between requests.
+        :param client: Optional preconfigured httpx.AsyncClient. A new one is created if not given.
+        :param http2: Use HTTP/2, multiplexing concurrent calls over one connection per host. Requires the optional
+         'h2' dependency.
+        """
+        httpx = _import_httpx(http2)
+        if client is None:
+            client = httpx.AsyncClient(**_httpx_options(httpx, pool_size, timeout, keep_alive, http2))
+        self.client = client
+        self.retryable_errors = (httpx.TransportError,)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """
+        Send a single HTTP request through the pooled client.
+        :param method: HTTP method, e.g. 'GET'.
+        :param url: Fully qualified request url.
+        :param kwargs: Keyword arguments passed on to httpx.AsyncClient.request.
+        :return: Response
+        """
+        response: httpx.Response = await self.client.request(method, url, **kwargs)
+        return response
+
+    async def aclose(self) -> None:
+        """
+        Close the client and all pooled connections.
+        :return: None
+        """
+        await self.client.aclose()
@@ -1,10 +1,15 @@
 import os
-from typing import Any, Optional
-
-import requests
+import threading
+import time
+from contextlib import nullcontext
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, ContextManager, Optional, Type, Union
 
+from .auth import TOKEN_VALIDATION_MODES, TokenValidationCache
+from .batch import DEFAULT_MAX_CONCURRENCY
+from .cache import ResponseCache
+from .codec import JSONCodec, get_codec
 from .dataclasses import PlatformTokenCreated, PlatformTokenRead
-from .db import DatabasesClient
 from .endpoints import API_PATH
 from .exceptions import (
     InvalidPlatformTokenException,
@@ -13,18 +18,44 @@ from .exceptions import (
     TokenNotFoundException,
     TursoRequestException,
 )
+from .metrics import UNKNOWN_ENDPOINT, Metrics, RequestEvent
+from .ratelimit import ClientRateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .tokens import DatabaseTokenCache
+from .transport import DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT, HTTPXTransport, RequestsTransport, Transport
+
+if TYPE_CHECKING:
+    import requests
 
+    from .db import DatabasesClient
 
-class TursoClient:
+
+class BaseTursoClient:
     """
-    TursoClient main class.
+    Configuration shared by the synchronous and the asynchronous Turso client.
     """
 
     def __init__(self, **kwargs: Any) -> None:
         """
-        Initialize a Turso client.
+        Load the client configuration.
 
         :param: token: Turso access token.
+        :param base_url: Platform API base url. Defaults to 'https://api.turso.tech'.
+        :param max_concurrency: Default number of calls bulk operations keep in flight.
+        :param requests_per_second: Optional cap on the calls per second issued by this client.
+        :param reads_per_second: Optional cap on the read (GET) calls per second issued by this client.
+        :param mutations_per_second: Optional cap on the mutating calls per second issued by this client.
+        :param rate_limiter: ClientRateLimiter used instead of the rate settings, e.g. to share it between clients.
+        :param cache: Enable the in-memory read cache. Either True for the default settings or a ResponseCache.
+        :param retry: Retry failed calls. Either True for the default RetryPolicy or a RetryPolicy.
+        :param metrics: Record per-endpoint metrics. Either True for a new Metrics instance or a Metrics instance.
+        :param token_cache: Cache database auth tokens. Either True for the default settings or a DatabaseTokenCache.
+        :param json_codec: JSON codec used for responses and request bodies. Either 'orjson', 'msgspec', 'json' or a
+         JSONCodec. Defaults to the fastest installed codec.
+        :param token_validation: When to validate the platform token. 'eager' validates on construction, 'lazy'
+         right before the first call and 'cached' trusts a validation remembered in a local file.
+        :param token_validation_cache: TokenValidationCache used by the 'cached' validation mode.
         """
         required_attributes = ["platform_token"]
         for attribute in required_attributes:
@@ -33,20 +64,83 @@ class TursoClient:
                 required_message = (
                     f"Required configuration setting <'{attribute}'> missing."
                     "\nThis setting can be provided as a keyword argument to "
-                    "the 'TursoClient' class constructor, "
+                    f"the '{type(self).__name__}' class constructor, "
                     f"or as an environment variable named 'turso_{attribute}'."
                 )
                 raise MissingRequiredAttributeException(required_message)
             else:
                 setattr(self, attribute, value)
 
-        self.base_url = "https://api.turso.tech"
+        self.base_url = self._fetch_config("base_url", **kwargs) or "https://api.turso.tech"
         self.base_header = {
             "Authorization": f"Bearer {getattr(self, 'platform_token')}",
             "Content-Type": "application/json",
         }
-        self._validate_user_token()
-        self.db = DatabasesClient(base_client=self)
+        self.max_concurrency: int = kwargs.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        rate_limiter: Optional[ClientRateLimiter] = kwargs.get("rate_limiter", None)
+        rates = [kwargs.get(name) for name in ("requests_per_second", "reads_per_second", "mutations_per_second")]
+        if rate_limiter is None and any(rates):
+            rate_limiter = ClientRateLimiter(rates[0], read_rate=rates[1], mutation_rate=rates[2])
+        self.rate_limiter = rate_limiter
+        cache: Union[bool, ResponseCache, None] = kwargs.get("cache", None)
+        self.cache = ResponseCache() if cache is True else cache or None
+        retry: Union[bool, RetryPolicy, None] = kwargs.get("retry", None)
+        self.retry_policy = RetryPolicy() if retry is True else retry or None
+        metrics: Union[bool, Metrics, None] = kwargs.get("metrics", None)
+        self.metrics = Metrics() if metrics is True else metrics or None
+        token_cache: Union[bool, DatabaseTokenCache, None] = kwargs.get("token_cache", None)
+        self.token_cache = DatabaseTokenCache() if token_cache is True else token_cache or None
+        codec: Union[str, JSONCodec, None] = kwargs.get("json_codec", None)
+        self.codec = codec if isinstance(codec, JSONCodec) else get_codec(codec)
+
+        self.token_validation: str = kwargs.get("token_validation", "eager")
+        if self.token_validation not in TOKEN_VALIDATION_MODES:
+            raise ValueError(f"Token validation needs to be one of {TOKEN_VALIDATION_MODES}.")
+        self.validation_cache: Optional[TokenValidationCache] = None
+        if self.token_validation == "cached":
+            self.validation_cache = kwargs.get("token_validation_cache", None) or TokenValidationCache()
+        # The eager mode validates on construction (TursoClient) or on entering the client (AsyncTursoClient), any
+        # client that has not validated yet validates right before its first call.
+        self._token_validated = self.validation_cache is not None and self.validation_cache.is_valid(
+            getattr(self, "platform_token")
+        )
+        self._token_validation_lock = threading.Lock()
+
+    def _token_validation_succeeded(self) -> None:
+        """
+        Record a successful validation of the platform token.
+        :return: None
+        """
+        self._token_validated = True
+        if self.validation_cache is not None:
+            self.validation_cache.remember(getattr(self, "platform_token"))
+
+    def _token_rejected(self) -> None:
+        """
+        Forget a remembered validation after the API rejected the platform token.
+        :return: None
+        """
+        if self.validation_cache is not None:
+            self._token_validated = False
+            self.validation_cache.forget(getattr(self, "platform_token"))
+
+    def measure_load(self, endpoint: str) -> ContextManager[None]:
+        """
+        Measure the time spent in the block as dataclass load time of the endpoint if metrics are enabled.
+        :param endpoint: API_PATH key
+        :return: Context manager
+        """
+        if self.metrics is None:
+            return nullcontext()
+        return self.metrics.measure_load(endpoint)
+
+    def decode(self, response: Any) -> Any:
+        """
+        Decode the JSON body of a response with the codec of the client.
+        :param response: Response of the transport.
+        :return: Decoded body
+        """
+        return self.codec.loads(response.content)
 
     @staticmethod
     def _fetch_config(attribute: str, **kwargs: Any) -> Optional[str]:
@@ -62,6 +156,235 @@ class TursoClient:
         else:
             return env_value
 
+
+class TursoClient(BaseTursoClient):
+    """
+    TursoClient main class.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """
+        Initialize a Turso client.
+
+        :param: token: Turso access token.
+        :param base_url: Platform API base url. Defaults to 'https://api.turso.tech'.
+        :param transport: Transport used for all Platform API calls. Defaults to a pooled RequestsTransport.
+        :param pool_size: Maximum number of pooled connections of the default transport.
+        :param timeout: Default (connect, read) timeout in seconds of the default transport.
+        :param keep_alive: Reuse connections between calls of the default transport.
+        :param http2: Use an HTTPXTransport speaking HTTP/2 instead of the requests pool, multiplexing concurrent
+         calls over one connection. Requires the optional 'httpx' and 'h2' dependencies.
+        :param token_validation: When to validate the platform token: 'eager' (default), 'lazy' or 'cached'.
+        :param token_validation_cache: TokenValidationCache used by the 'cached' validation mode.
+        :param single_flight: Share the response of identical GET calls that are in flight at the same time.
+        :param max_concurrency: Default number of threads bulk operations like 'get_usage_many' use.
+        :param requests_per_second: Optional cap on the calls per second issued by this client.
+        :param reads_per_second: Optional cap on the read (GET) calls per second issued by this client.
+        :param mutations_per_second: Optional cap on the mutating calls per second issued by this client.
+        :param rate_limiter: ClientRateLimiter used instead of the rate settings, e.g. to share it between clients.
+        """
+        super().__init__(**kwargs)
+        transport: Optional[Transport] = kwargs.get("transport", None)
+        if transport is None:
+            options = {
+                "pool_size": kwargs.get("pool_size", DEFAULT_POOL_SIZE),
+                "timeout": kwargs.get("timeout", DEFAULT_TIMEOUT),
+                "keep_alive": kwargs.get("keep_alive", True),
+            }
+            transport = HTTPXTransport(http2=True, **options) if kwargs.get("http2") else RequestsTransport(**options)
+        self.transport = transport
+        self.single_flight = SingleFlight() if kwargs.get("single_flight", False) else None
+        self._db: Optional["DatabasesClient"] = None
+        self._db_lock = threading.Lock()
+        if self.token_validation == "eager":
+            self._validate_user_token()
+
+    @property
+    def db(self) -> "DatabasesClient":
+        """
+        Client of the database endpoints. It is imported and created on first access.
+        :return: DatabasesClient
+        """
+        if self._db is None:
+            with self._db_lock:
+                if self._db is None:
+                    from .db import DatabasesClient  # noqa: PLC0415
+
+                    self._db = DatabasesClient(base_client=self)
+        return self._db
+
+    def request(
+        self,
+        method: str,
+        request_url: str,
+        endpoint: Optional[str] = None,
+        retry: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "requests.Response":
+        """
+        Send a request to the Platform API through the client transport. The authorization header is added
+        automatically. Reads of cacheable endpoints are served from the read cache if it is enabled and
+        identical reads in flight at the same time are sent once if single-flight is enabled.
+        A platform token that has not been validated yet is validated before the first call.
+        :param method: HTTP method, e.g. 'GET'.
+        :param request_url: Fully qualified request url.
+        :param endpoint: API_PATH key of the request.
+        :param retry: Allow or forbid retries of this call. Defaults to retrying idempotent methods only.
+        :param kwargs: Additional keyword arguments passed on to the transport (params, json, data, ...).
+        :return: Response
+        """
+        if not self._token_validated and endpoint != "validate_platform_token":
+            with self._token_validation_lock:
+                if not self._token_validated:
+                    self._validate_user_token()
+
+        if self.cache is None:
+            return self._dispatch(method, request_url, endpoint=endpoint, retry=retry, **kwargs)
+
+        if method != "GET":
+            response = self._dispatch(method, request_url, endpoint=endpoint, retry=retry, **kwargs)
+            if self.cache.invalidates(endpoint):
+                self.cache.invalidate(request_url)
+            return response
+
+        if endpoint is None or not self.cache.is_cacheable(endpoint) or kwargs.get("stream"):
+            return self._dispatch(method, request_url, endpoint=endpoint, retry=retry, **kwargs)
+
+        cache_key = self.cache.key(request_url, kwargs.get("params"))
+        cached: Optional["requests.Response"] = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        response = self._dispatch(method, request_url, endpoint=endpoint, retry=retry, **kwargs)
+        self.cache.set(endpoint, cache_key, response)
+        return response
+
+    def _dispatch(
+        self,
+        method: str,
+        request_url: str,
+        endpoint: Optional[str] = None,
+        retry: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "requests.Response":
+        """
+        Send a request, sharing the response of an identical read that is already in flight if single-flight
+        deduplication is enabled.
+        :param method: HTTP method, e.g. 'GET'.
+        :param request_url: Fully qualified request url.
+        :param endpoint: API_PATH key of the request.
+        :param retry: Allow or forbid retries of this call.
+        :param kwargs: Additional keyword arguments passed on to the transport.
+        :return: Response
+        """
+        if self.single_flight is None or method != "GET" or kwargs.get("stream"):
+            return self._send(method, request_url, endpoint=endpoint, retry=retry, **kwargs)
+        key = ResponseCache.key(request_url, kwargs.get("params"))
+        return self.single_flight.do(
+            key, lambda: self._send(method, request_url, endpoint=endpoint, retry=retry, **kwargs)
+        )
+
+    def _send(
+        self,
+        method: str,
+        request_url: str,
+        endpoint: Optional[str] = None,
+        retry: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> "requests.Response":
+        """
+        Send a request through the transport. Failed calls are retried according to the retry policy.
+        :param method: HTTP method, e.g. 'GET'.
+        :param request_url: Fully qualified request url.
+        :param endpoint: API_PATH key of the request.
+        :param retry: Allow or forbid retries of this call. Defaults to the method rule of the retry policy.
+        :param kwargs: Additional keyword arguments passed on to the transport.
+        :return: Response
+        """
+        headers = {**self.base_header, **kwargs.pop("headers", {})}
+        if "json" in kwargs:
+            kwargs["data"] = self.codec.dumps(kwargs.pop("json"))
+        policy = self.retry_policy
+        if policy is None or not policy.allows_method(method, retry):
+            response = self._attempt(method, request_url, endpoint, headers=headers, **kwargs)
+        else:
+            policy.budget.deposit()
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    response = self._attempt(method, request_url, endpoint, headers=headers, **kwargs)
+                except self.transport.retryable_errors:
+                    delay = policy.delay(attempt)
+                    if delay is None:
+                        raise
+                else:
+                    if response.status_code not in policy.retry_statuses:
+                        break
+                    delay = policy.delay(attempt, response.headers.get("Retry-After"))
+                    if delay is None:
+                        break
+                    response.close()
+                time.sleep(delay)
+
+        if response.status_code == 401:
+            self._token_rejected()
+        return response
+
+    def _attempt(self, method: str, request_url: str, endpoint: Optional[str], **kwargs: Any) -> "requests.Response":
+        """
+        Send a single attempt of a call through the rate limiter and the transport and record its metrics.
+        :param method: HTTP method, e.g. 'GET'.
+        :param request_url: Fully qualified request url.
+        :param endpoint: API_PATH key of the request.
+        :param kwargs: Additional keyword arguments passed on to the transport.
+        :return: Response
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method)
+        if self.metrics is None:
+            return self.transport.request(method, request_url, **kwargs)
+
+        endpoint = endpoint or UNKNOWN_ENDPOINT
+        start = time.perf_counter()
+        try:
+            response = self.transport.request(method, request_url, **kwargs)
+        except Exception as exc:
+            self.metrics.observe_request(RequestEvent(endpoint, method, None, time.perf_counter() - start, 0, exc))
+            raise
+        seconds = time.perf_counter() - start
+        if kwargs.get("stream"):
+            response_bytes = int(response.headers.get("Content-Length", 0))
+        else:
+            response_bytes = len(response.content)
+        self.metrics.observe_request(RequestEvent(endpoint, method, response.status_code, seconds, response_bytes))
+        return response
+
+    def close(self) -> None:
+        """
+        Close the underlying transport and release pooled connections.
+        :return: None
+        """
+        self.transport.close()
+
+    def __enter__(self) -> "TursoClient":
+        """
+        Enter the client context.
+        :return: TursoClient
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """
+        Close the client when leaving the context.
+        :return: None
+        """
+        self.close()
+
     def _validate_user_token(self) -> bool:
         """
         Validate the current platform api token.
@@ -69,14 +392,15 @@ class TursoClient:
         """
         endpoint = API_PATH["validate_platform_token"]
         request_url = self.base_url + endpoint
-        response = requests.get(request_url, headers=self.base_header)
+        response = self.request("GET", request_url, endpoint="validate_platform_token")
 
         if response.status_code == 401:
-            error_message = response.json()["error"]
+            error_message = self.decode(response)["error"]
             raise InvalidPlatformTokenException(error_message)
         elif response.status_code != 200:
             raise TursoRequestException(f"Something went wrong: {response.content!r}")
 
+        self._token_validation_succeeded()
         return True
 
     def create_platform_api_token(self, name: str) -> PlatformTokenCreated:
@@ -87,15 +411,16 @@ class TursoClient:
         endpoint = API_PATH["create_platform_token"].format(name=name)
         request_url = self.base_url + endpoint
 
-        response = requests.post(request_url, headers=self.base_header)
+        response = self.request("POST", request_url, endpoint="create_platform_token")
 
         if response.status_code == 409:
             raise TokenAlreadyExistsException(f"Token with name <{name}> already exists.")
         elif response.status_code != 200:
             raise TursoRequestException(f"Something went wrong: {response.content!r}")
 
-        content = response.json()
-        return PlatformTokenCreated.load(content)
+        content = self.decode(response)
+        with self.measure_load("create_platform_token"):
+            return PlatformTokenCreated.load(content)
 
     def list_platform_tokens(self) -> list[PlatformTokenRead]:
         """
@@ -104,13 +429,14 @@ class TursoClient:
         """
         endpoint = API_PATH["list_platform_tokens"]
         request_url = self.base_url + endpoint
-        response = requests.get(request_url, headers=self.base_header)
+        response = self.request("GET", request_url, endpoint="list_platform_tokens")
 
         if response.status_code != 200:
             raise TursoRequestException(f"Something went wrong: {response.content!r}")
 
-        content = response.json()
-        return [PlatformTokenRead.load(token) for token in content["tokens"]]
+        content = self.decode(response)
+        with self.measure_load("list_platform_tokens"):
+            return [PlatformTokenRead.load(token) for token in content["tokens"]]
 
     def revoke_token(self, name: str) -> str:
         """
@@ -120,12 +446,12 @@ class TursoClient:
         """
         endpoint = API_PATH["revoke_platform_token"].format(name=name)
         request_url = self.base_url + endpoint
-        response = requests.delete(request_url, headers=self.base_header)
+        response = self.request("DELETE", request_url, endpoint="revoke_platform_token")
 
         if response.status_code == 404:
             raise TokenNotFoundException(f"Token with name <{name}> not found.")
         if response.status_code != 200:
             raise TursoRequestException(f"Something went wrong: {response.content!r}")
 
-        content: str = response.json()["token"]
+        content: str = self.decode(response)["token"]
         return content
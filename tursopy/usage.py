@@ -0,0 +1,364 @@
+import calendar
+import json
+import os
+import tempfile
+import threading
+from array import array
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .batch import run_batch
+
+if TYPE_CHECKING:
+    from .db import DatabasesClient
+
+Bucket = Union[str, timedelta]
+Window = Tuple[datetime, datetime]
+UsageValues = Tuple[int, int, int]
+
+BUCKETS = ("hour", "day", "month")
+GROUP_KEYS = ("database", "group", "region", "bucket")
+
+
+class UsageTotals(NamedTuple):
+    """
+    Aggregated usage of a group of rows.
+    """
+
+    rows_read: int
+    rows_written: int
+    storage_bytes: int
+
+
+def format_timestamp(value: datetime) -> str:
+    """
+    Format a datetime as ISO 8601 timestamp in UTC as expected by the usage endpoint.
+    :param value: Datetime. Naive datetimes are interpreted as UTC.
+    :return: Timestamp, e.g. '2023-01-01T00:00:00Z'.
+    """
+    return _as_utc(value).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _as_utc(value: datetime) -> datetime:
+    """
+    Convert a datetime to UTC. Naive datetimes are interpreted as UTC.
+    :param value: Datetime
+    :return: Timezone aware datetime in UTC.
+    """
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _next_boundary(value: datetime, bucket: str) -> datetime:
+    """
+    Return the start of the calendar bucket following the one containing the value.
+    :param value: Datetime in UTC.
+    :param bucket: 'hour', 'day' or 'month'.
+    :return: Datetime in UTC.
+    """
+    if bucket == "hour":
+        return value.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    if bucket == "day":
+        return value.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    days = calendar.monthrange(value.year, value.month)[1]
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0) + timedelta(days=days)
+
+
+def split_range(start: datetime, end: datetime, bucket: Bucket = "day") -> List[Window]:
+    """
+    Split a time range into consecutive windows. Calendar buckets are aligned to UTC hour, day or month boundaries,
+    so the first and last window may be shorter than a full bucket.
+    :param start: Start of the range.
+    :param end: End of the range, exclusive.
+    :param bucket: 'hour', 'day', 'month' or a fixed timedelta.
+    :return: List of (start, end) windows in UTC.
+    """
+    start, end = _as_utc(start), _as_utc(end)
+    if isinstance(bucket, timedelta):
+        if bucket <= timedelta(0):
+            raise ValueError("The bucket size needs to be positive.")
+    elif bucket not in BUCKETS:
+        raise ValueError(f"Bucket needs to be one of {BUCKETS} or a timedelta.")
+
+    windows = []
+    lower = start
+    while lower < end:
+        upper = lower + bucket if isinstance(bucket, timedelta) else _next_boundary(lower, bucket)
+        windows.append((lower, min(upper, end)))
+        lower = upper
+    return windows
+
+
+class UsageWindowCache:
+    """
+    Cache of the usage of closed time windows. Windows that ended in the past never change, so they are cached
+    without expiry. With a path the cache is kept in a local JSON file and shared between runs.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None) -> None:
+        """
+        Initialize the usage window cache.
+        :param path: Optional location of the cache file. Defaults to an in-memory cache.
+        """
+        self.path = Path(path).expanduser() if path is not None else None
+        self._entries: Dict[str, List[int]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if self.path is not None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    content = json.load(f)
+                if isinstance(content, dict):
+                    self._entries = content
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def key(org_name: str, db_name: str, from_ts: str, to_ts: str) -> str:
+        """
+        Build the cache key of a window.
+        :return: Cache key
+        """
+        return f"{org_name}/{db_name}/{from_ts}/{to_ts}"
+
+    def get(self, key: str) -> Optional[UsageValues]:
+        """
+        Return the cached usage of a window.
+        :param key: Cache key
+        :return: (rows_read, rows_written, storage_bytes) or None.
+        """
+        values = self._entries.get(key)
+        return (values[0], values[1], values[2]) if values is not None else None
+
+    def set(self, key: str, values: UsageValues) -> None:
+        """
+        Cache the usage of a closed window.
+        :param key: Cache key
+        :param values: (rows_read, rows_written, storage_bytes)
+        :return: None
+        """
+        with self._lock:
+            self._entries[key] = list(values)
+            self._dirty = True
+
+    def __len__(self) -> int:
+        """
+        Number of cached windows.
+        :return: int
+        """
+        return len(self._entries)
+
+    def save(self) -> None:
+        """
+        Atomically write new entries to the cache file, if the cache has one.
+        :return: None
+        """
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".usage")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError:
+                pass
+
+
+class UsageTable:
+    """
+    Column store of usage rows, one row per database and window.
+
+    Values are kept in typed arrays and databases are dictionary encoded, so millions of rows need a few bytes
+    each instead of a Usage object per row.
+    """
+
+    def __init__(
+        self, databases: Sequence[str], groups: Sequence[str], regions: Sequence[str], windows: List[Window]
+    ) -> None:
+        """
+        Initialize an empty table.
+        :param databases: Database names. Rows refer to them by index.
+        :param groups: Group of every database.
+        :param regions: Primary region of every database.
+        :param windows: Time windows. Rows refer to them by index.
+        """
+        self.databases = list(databases)
+        self.groups = list(groups)
+        self.regions = list(regions)
+        self.windows = windows
+        self.database_index = array("I")
+        self.window_index = array("I")
+        self.rows_read = array("q")
+        self.rows_written = array("q")
+        self.storage_bytes = array("q")
+        self.failures: List[Tuple[str, datetime, Exception]] = []
+
+    def append(self, database: int, window: int, values: UsageValues) -> None:
+        """
+        Append a row.
+        :param database: Index of the database.
+        :param window: Index of the window.
+        :param values: (rows_read, rows_written, storage_bytes)
+        :return: None
+        """
+        self.database_index.append(database)
+        self.window_index.append(window)
+        self.rows_read.append(values[0])
+        self.rows_written.append(values[1])
+        self.storage_bytes.append(values[2])
+
+    def __len__(self) -> int:
+        """
+        Number of rows.
+        :return: int
+        """
+        return len(self.database_index)
+
+    def rows(self) -> Iterator[Tuple[str, datetime, int, int, int]]:
+        """
+        Iterate over the rows.
+        :return: Iterator of (database, window start, rows_read, rows_written, storage_bytes) tuples.
+        """
+        for i in range(len(self)):
+            yield (
+                self.databases[self.database_index[i]],
+                self.windows[self.window_index[i]][0],
+                self.rows_read[i],
+                self.rows_written[i],
+                self.storage_bytes[i],
+            )
+
+    def total(self) -> UsageTotals:
+        """
+        Aggregate all rows. See 'group_by' for how storage is aggregated.
+        :return: UsageTotals
+        """
+        return self._aggregate(lambda database, window: "total")["total"]
+
+    def group_by(self, key: str) -> Dict[Union[str, datetime], UsageTotals]:
+        """
+        Aggregate the rows by database, group, region or window.
+
+        Read and written rows are summed. Storage is a level rather than a flow, so the storage of a database is
+        its maximum over the windows of the group, and the storage of a group is the sum over its databases.
+        :param key: 'database', 'group', 'region' or 'bucket'.
+        :return: UsageTotals by database name, group name, region or window start.
+        """
+        if key not in GROUP_KEYS:
+            raise ValueError(f"Group key needs to be one of {GROUP_KEYS}.")
+        if key == "database":
+            return self._aggregate(lambda database, window: self.databases[database])
+        if key == "group":
+            return self._aggregate(lambda database, window: self.groups[database])
+        if key == "region":
+            return self._aggregate(lambda database, window: self.regions[database])
+        return self._aggregate(lambda database, window: self.windows[window][0])
+
+    def _aggregate(self, label: Callable[[int, int], Any]) -> Dict[Any, UsageTotals]:
+        """
+        Aggregate the rows by a label computed from the database and window index of every row.
+        :param label: Label function.
+        :return: UsageTotals by label.
+        """
+        rows_read: Dict[Any, int] = defaultdict(int)
+        rows_written: Dict[Any, int] = defaultdict(int)
+        storage: Dict[Tuple[Any, int], int] = {}
+        for i in range(len(self)):
+            database = self.database_index[i]
+            name = label(database, self.window_index[i])
+            rows_read[name] += self.rows_read[i]
+            rows_written[name] += self.rows_written[i]
+            storage[name, database] = max(storage.get((name, database), 0), self.storage_bytes[i])
+
+        storage_bytes: Dict[Any, int] = defaultdict(int)
+        for (name, _), value in storage.items():
+            storage_bytes[name] += value
+        return {name: UsageTotals(rows_read[name], rows_written[name], storage_bytes[name]) for name in rows_read}
+
+
+class UsageAggregator:
+    """
+    Org-wide usage aggregation over many time windows.
+
+    The usage of every (database, window) pair is fetched concurrently and stored in a UsageTable. Windows that
+    ended before the aggregation started are cached for good, so repeated aggregations only fetch the open window.
+    """
+
+    def __init__(self, db_client: "DatabasesClient", cache: Optional[UsageWindowCache] = None) -> None:
+        """
+        Initialize the aggregator.
+        :param db_client: DatabasesClient used to fetch the usage.
+        :param cache: Cache of closed windows. Defaults to a new in-memory UsageWindowCache.
+        """
+        self.db = db_client
+        self.cache = cache if cache is not None else UsageWindowCache()
+
+    def aggregate(
+        self,
+        org_name: str,
+        start: datetime,
+        end: datetime,
+        bucket: Bucket = "day",
+        *,
+        db_names: Optional[Sequence[str]] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> UsageTable:
+        """
+        Fetch the usage of databases for every window of a time range.
+        Failed fetches are reported on the 'failures' of the table and their rows are missing.
+
+        :param org_name: The name of the organization or user.
+        :param start: Start of the range.
+        :param end: End of the range, exclusive.
+        :param bucket: Window size, 'hour', 'day', 'month' or a fixed timedelta.
+        :param db_names: Names of the databases. Defaults to all databases of the organization.
+        :param max_concurrency: Number of calls in flight. Defaults to the client setting.
+        :return: UsageTable
+        """
+        windows = split_range(start, end, bucket)
+        databases = {database.Name: database for database in self.db.list_databases(org_name)}
+        names = list(db_names) if db_names is not None else list(databases)
+        table = UsageTable(
+            names,
+            [databases[name].group if name in databases else "" for name in names],
+            [databases[name].primaryRegion if name in databases else "" for name in names],
+            windows,
+        )
+
+        now = datetime.now(timezone.utc)
+        timestamps = [(format_timestamp(lower), format_timestamp(upper)) for lower, upper in windows]
+        pending: Dict[str, Tuple[int, int]] = {}
+        for database, name in enumerate(names):
+            for window, (from_ts, to_ts) in enumerate(timestamps):
+                key = self.cache.key(org_name, name, from_ts, to_ts)
+                cached = self.cache.get(key)
+                if cached is not None:
+                    table.append(database, window, cached)
+                else:
+                    pending[key] = database, window
+
+        def fetch(key: str) -> UsageValues:
+            database, window = pending[key]
+            from_ts, to_ts = timestamps[window]
+            total = self.db.get_usage(org_name, names[database], from_ts=from_ts, to_ts=to_ts).total
+            return total.rows_read, total.rows_written, total.storage_bytes
+
+        results = run_batch(
+            fetch, list(pending), max_concurrency=max_concurrency or self.db.client.max_concurrency, ordered=False
+        )
+        for result in results:
+            database, window = pending[result.key]
+            if result.error is not None:
+                table.failures.append((names[database], windows[window][0], result.error))
+                continue
+            values = result.unwrap()
+            table.append(database, window, values)
+            if windows[window][1] <= now:
+                self.cache.set(result.key, values)
+
+        self.cache.save()
+        return table
@@ -0,0 +1,325 @@
+import threading
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .dataclasses import DatabaseRead
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from .async_db import AsyncDatabasesClient
+    from .db import DatabasesClient
+
+DATABASE_FIELDS = tuple(f.name for f in fields(DatabaseRead))
+DEFAULT_MIN_INTERVAL = 2.0
+DEFAULT_MAX_INTERVAL = 60.0
+DEFAULT_BACKOFF = 2.0
+
+
+@dataclass(frozen=True)
+class DatabaseCreatedEvent:
+    """
+    A database appeared in the organization.
+    """
+
+    name: str
+    database: DatabaseRead
+
+
+@dataclass(frozen=True)
+class DatabaseDeletedEvent:
+    """
+    A database disappeared from the organization. 'database' is its last known state.
+    """
+
+    name: str
+    database: DatabaseRead
+
+
+@dataclass(frozen=True)
+class DatabaseModifiedEvent:
+    """
+    Watched fields of a database changed. 'changes' maps every changed field to its (old, new) value.
+    """
+
+    name: str
+    database: DatabaseRead
+    previous: DatabaseRead
+    changes: Dict[str, Tuple[Any, Any]]
+
+
+DatabaseEvent = Union[DatabaseCreatedEvent, DatabaseDeletedEvent, DatabaseModifiedEvent]
+WatchHook = Callable[[DatabaseEvent], None]
+
+
+class AdaptiveInterval:
+    """
+    Polling interval that drops to the minimum after a change and grows by a factor with every quiet poll.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = DEFAULT_BACKOFF,
+    ) -> None:
+        """
+        Initialize the interval.
+        :param min_interval: Seconds between polls after a change.
+        :param max_interval: Upper bound of the seconds between polls.
+        :param backoff: Factor the interval grows by after a poll without changes.
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Intervals need to satisfy 0 < min_interval <= max_interval.")
+        if backoff < 1:
+            raise ValueError("Backoff needs to be at least 1.")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.current = min_interval
+
+    def update(self, changed: bool) -> float:
+        """
+        Compute the seconds until the next poll.
+        :param changed: Whether the last poll found changes.
+        :return: Seconds to wait
+        """
+        if changed:
+            self.current = self.min_interval
+        else:
+            self.current = min(self.current * self.backoff, self.max_interval)
+        return self.current
+
+
+class DatabaseDiffer:
+    """
+    Snapshot of the databases of an organization that turns successive listings into change events.
+
+    Every database is reduced to a hash of its watched fields, so unchanged databases are skipped with a single
+    integer comparison. Fields are only compared one by one for databases whose hash changed.
+    """
+
+    def __init__(self, fields: Optional[Sequence[str]] = None) -> None:
+        """
+        Initialize an empty snapshot.
+        :param fields: DatabaseRead fields to watch. Defaults to all fields.
+        """
+        watched = tuple(fields) if fields is not None else DATABASE_FIELDS
+        unknown = [name for name in watched if name not in DATABASE_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown database fields: {', '.join(unknown)}.")
+        self.fields = watched
+        self._snapshot: Dict[str, Tuple[int, DatabaseRead]] = {}
+
+    def _hash(self, database: DatabaseRead) -> int:
+        """
+        Hash the watched fields of a database.
+        :param database: DatabaseRead
+        :return: Hash
+        """
+        values = (getattr(database, name) for name in self.fields)
+        return hash(tuple(tuple(value) if isinstance(value, list) else value for value in values))
+
+    def diff(self, databases: Sequence[DatabaseRead]) -> List[DatabaseEvent]:
+        """
+        Replace the snapshot with a new listing and return what changed. A database that was deleted and created
+        again under the same name, detected by its DbId, is reported as a deletion followed by a creation.
+        :param databases: Current databases of the organization.
+        :return: List of events, deletions first.
+        """
+        previous = self._snapshot
+        current: Dict[str, Tuple[int, DatabaseRead]] = {}
+        created: List[DatabaseEvent] = []
+        modified: List[DatabaseEvent] = []
+        deleted: List[DatabaseEvent] = []
+
+        for database in databases:
+            digest = self._hash(database)
+            current[database.Name] = (digest, database)
+            known = previous.get(database.Name)
+            if known is None:
+                created.append(DatabaseCreatedEvent(database.Name, database))
+            elif known[1].DbId != database.DbId:
+                deleted.append(DatabaseDeletedEvent(database.Name, known[1]))
+                created.append(DatabaseCreatedEvent(database.Name, database))
+            elif known[0] != digest:
+                changes = self._changes(known[1], database)
+                if changes:
+                    modified.append(DatabaseModifiedEvent(database.Name, database, known[1], changes))
+
+        for name, (_, database) in previous.items():
+            if name not in current:
+                deleted.append(DatabaseDeletedEvent(name, database))
+
+        self._snapshot = current
+        return deleted + created + modified
+
+    def _changes(self, old: DatabaseRead, new: DatabaseRead) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Compare the watched fields of two states of a database.
+        :param old: Previous state.
+        :param new: Current state.
+        :return: Changed fields mapped to their (old, new) value.
+        """
+        changes = {}
+        for name in self.fields:
+            before, after = getattr(old, name), getattr(new, name)
+            if before != after:
+                changes[name] = (before, after)
+        return changes
+
+    @property
+    def databases(self) -> Dict[str, DatabaseRead]:
+        """
+        Databases of the last listing by name.
+        :return: Dict
+        """
+        return {name: database for name, (_, database) in self._snapshot.items()}
+
+
+class DatabaseWatcher:
+    """
+    Change feed of the databases of an organization, built by polling 'list_databases'.
+
+    The first poll records the current databases, later polls yield the differences as typed events. The time
+    between polls adapts to the activity of the organization: it drops to 'min_interval' after a change and
+    grows towards 'max_interval' while nothing changes. Errors of a poll are raised to the caller, configure
+    retries on the client to ride out transient failures.
+    """
+
+    def __init__(
+        self,
+        db_client: "DatabasesClient",
+        org_name: str,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = DEFAULT_BACKOFF,
+        initial: bool = False,
+    ) -> None:
+        """
+        Initialize the watcher. No call is sent before the first poll.
+        :param db_client: DatabasesClient used to list the databases.
+        :param org_name: The name of the organization or user.
+        :param fields: DatabaseRead fields to watch for modifications. Defaults to all fields.
+        :param min_interval: Seconds between polls after a change.
+        :param max_interval: Upper bound of the seconds between polls.
+        :param backoff: Factor the interval grows by after a poll without changes.
+        :param initial: Report the databases found by the first poll as created.
+        """
+        self.db_client = db_client
+        self.org_name = org_name
+        self.differ = DatabaseDiffer(fields)
+        self.interval = AdaptiveInterval(min_interval, max_interval, backoff)
+        self.initial = initial
+        self.polls = 0
+        self._stopped = threading.Event()
+
+    def poll(self) -> List[DatabaseEvent]:
+        """
+        List the databases once and return the changes since the previous poll.
+        :return: List of events
+        """
+        events = self.differ.diff(self.db_client.list_databases(self.org_name))
+        self.polls += 1
+        return events if self.polls > 1 or self.initial else []
+
+    def stop(self) -> None:
+        """
+        Stop the watcher. A wait for the next poll is interrupted. Safe to call from another thread or a callback.
+        :return: None
+        """
+        self._stopped.set()
+
+    def __iter__(self) -> Iterator[DatabaseEvent]:
+        """
+        Poll until the watcher is stopped and yield every change.
+        :return: Iterator of events
+        """
+        while not self._stopped.is_set():
+            events = self.poll()
+            yield from events
+            self._stopped.wait(self.interval.update(bool(events)))
+
+    def run(self, callback: WatchHook) -> None:
+        """
+        Poll until the watcher is stopped and call the callback for every change.
+        :param callback: Called with every event.
+        :return: None
+        """
+        for event in self:
+            callback(event)
+
+
+class AsyncDatabaseWatcher:
+    """
+    Asynchronous variant of DatabaseWatcher. Iterate with 'async for'.
+    """
+
+    def __init__(
+        self,
+        db_client: "AsyncDatabasesClient",
+        org_name: str,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = DEFAULT_BACKOFF,
+        initial: bool = False,
+    ) -> None:
+        """
+        Initialize the watcher. No call is sent before the first poll.
+        :param db_client: AsyncDatabasesClient used to list the databases.
+        :param org_name: The name of the organization or user.
+        :param fields: DatabaseRead fields to watch for modifications. Defaults to all fields.
+        :param min_interval: Seconds between polls after a change.
+        :param max_interval: Upper bound of the seconds between polls.
+        :param backoff: Factor the interval grows by after a poll without changes.
+        :param initial: Report the databases found by the first poll as created.
+        """
+        self.db_client = db_client
+        self.org_name = org_name
+        self.differ = DatabaseDiffer(fields)
+        self.interval = AdaptiveInterval(min_interval, max_interval, backoff)
+        self.initial = initial
+        self.polls = 0
+        self._stopped = False
+        self._wakeup: Optional["asyncio.Event"] = None
+
+    async def poll(self) -> List[DatabaseEvent]:
+        """
+        List the databases once and return the changes since the previous poll.
+        :return: List of events
+        """
+        events = self.differ.diff(await self.db_client.list_databases(self.org_name))
+        self.polls += 1
+        return events if self.polls > 1 or self.initial else []
+
+    def stop(self) -> None:
+        """
+        Stop the watcher. A wait for the next poll is interrupted. Call it from the event loop of the watcher.
+        :return: None
+        """
+        self._stopped = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def __aiter__(self) -> AsyncIterator[DatabaseEvent]:
+        """
+        Poll until the watcher is stopped and yield every change.
+        :return: Async iterator of events
+        """
+        import asyncio  # noqa: PLC0415
+
+        self._wakeup = asyncio.Event()
+        while not self._stopped:
+            events = await self.poll()
+            for event in events:
+                yield event
+            if self._stopped:
+                break
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval.update(bool(events)))
+            except asyncio.TimeoutError:
+                pass